@@ -0,0 +1,72 @@
+"""
+Benchmark of the Selenium scraper's browser profiles: the "default" Chrome
+versus the "performance" one (headless, eager page loads, no images,
+stylesheets or fonts), timing the session startup, the `driver.get` of the
+gazette page and the search round trip.
+
+Unlike the other benchmarks, it needs a running Selenium (e.g. the
+docker-compose `selenium` service, with its port 4444 exposed) and network
+access to the gazette site.
+
+Usage (from the project root):
+    PYTHONPATH=src python benchmarks/bench_browser_profile.py \
+        --selenium-url http://localhost:4444/wd/hub --target-url <TARGET_URL> --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.conthabil.scraper import Scraper
+
+
+def run_once(selenium_url: str, target_url: str, profile: str, download_path: str) -> dict[str, float]:
+    """Opens a session with the profile and times one search, in seconds."""
+
+    timings = {}
+    scraper = Scraper(selenium_url=selenium_url, download_path=download_path, browser_profile=profile)
+
+    start = time.perf_counter()
+    with scraper:
+        timings["startup"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scraper.driver.get(target_url)
+        timings["driver.get"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scraper._perform_search()
+        timings["search"] = time.perf_counter() - start
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--selenium-url", default="http://localhost:4444/wd/hub")
+    parser.add_argument("--target-url", default=os.environ.get("TARGET_URL"), required="TARGET_URL" not in os.environ)
+    parser.add_argument("--runs", type=int, default=5, help="Searches per profile.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for profile in ("default", "performance"):
+            runs = [run_once(args.selenium_url, args.target_url, profile, tmp) for _ in range(args.runs)]
+            results[profile] = {step: statistics.median(run[step] for run in runs) for step in runs[0]}
+
+    print(f"Median of {args.runs} runs per profile:")
+    print(f"  {'step':<12} {'default':>10} {'performance':>12}")
+    for step in results["default"]:
+        print(
+            f"  {step:<12} {results['default'][step] * 1000:8.0f} ms "
+            f"{results['performance'][step] * 1000:9.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
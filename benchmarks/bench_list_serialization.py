@@ -0,0 +1,97 @@
+"""
+Benchmark of the GET /gazettes/ listing path: fetching ORM entities and
+serializing them through Pydantic (the previous `response_model` path) versus
+fetching plain column tuples and serializing them with orjson (the current path).
+
+Runs against an in-memory SQLite database, so it measures the Python-side
+costs (row materialization and serialization) rather than network latency.
+
+Usage (from the project root):
+    PYTHONPATH=src python benchmarks/bench_list_serialization.py --rows 5000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+os.environ.setdefault("TARGET_URL", "https://example.com")
+os.environ.setdefault("UPLOAD_URL", "https://example.com")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from main import _gazette_dict
+from src.conthabil import crud, schemas
+from src.conthabil.crud import Gazette
+
+
+def setup_session(rows: int):
+    """Creates an in-memory database holding `rows` gazettes."""
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Gazette.metadata.create_all(bind=engine)
+
+    start = datetime(2020, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Gazette),
+            [
+                {
+                    "url": f"https://0x0.st/{i:08x}.pdf",
+                    "publication_date": start + timedelta(hours=i),
+                }
+                for i in range(rows)
+            ],
+        )
+
+    return sessionmaker(bind=engine)()
+
+
+def pydantic_path(db, adapter: TypeAdapter) -> bytes:
+    """ORM entities validated and serialized through the response model."""
+
+    gazettes = db.scalars(select(Gazette).order_by(Gazette.publication_date, Gazette.id)).all()
+    db.expunge_all()
+    return adapter.dump_json(adapter.validate_python(gazettes, from_attributes=True))
+
+
+def orjson_path(db) -> bytes:
+    """Column tuples serialized directly with orjson."""
+
+    gazettes = db.execute(crud.gazettes_in_range_statement(start=None, end=None)).all()
+    return orjson.dumps([_gazette_dict(g) for g in gazettes])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000, help="Number of gazettes listed.")
+    parser.add_argument("--repeat", type=int, default=20, help="Iterations per path.")
+    args = parser.parse_args()
+
+    db = setup_session(args.rows)
+    adapter = TypeAdapter(List[schemas.GazetteResponse])
+
+    assert orjson.loads(pydantic_path(db, adapter)) == orjson.loads(orjson_path(db))
+
+    results = {
+        "ORM + Pydantic": timeit.timeit(lambda: pydantic_path(db, adapter), number=args.repeat),
+        "columns + orjson": timeit.timeit(lambda: orjson_path(db), number=args.repeat),
+    }
+
+    print(f"Listing {args.rows} gazettes, {args.repeat} iterations:")
+    for name, total in results.items():
+        print(f"  {name:<18} {total / args.repeat * 1000:8.2f} ms/request")
+
+    baseline, fast = results.values()
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of the per-file overhead of uploads: a new httpx.Client per file
+(the previous `Uploader._upload_file`) versus the Uploader's shared pooled
+client, which keeps connections alive across the whole batch.
+
+Uploads go to a local HTTP/1.1 server, so the difference measured is the
+TCP connection setup and client construction per file. Against the real
+upload host the gap is larger, since every new connection also pays a TLS
+handshake and the network round trips.
+
+Usage (from the project root):
+    PYTHONPATH=src python benchmarks/bench_upload_client.py --files 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import httpx
+
+from src.conthabil.uploader import Uploader
+
+
+class UploadHandler(BaseHTTPRequestHandler):
+    """Accepts a multipart upload and answers with a public URL, keeping the connection alive."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's algorithm
+    # and delayed ACKs stall every response on a kept-alive connection.
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b"https://upload.example.com/file.pdf\n"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def upload_with_new_clients(upload_url: str, file_paths: list[str]) -> None:
+    """One client, and so one connection, per file."""
+
+    for file_path in file_paths:
+        with open(file_path, "rb") as f:
+            files = {"file": (os.path.basename(file_path), f, "application/pdf")}
+            with httpx.Client() as client:
+                client.post(upload_url, files=files).raise_for_status()
+
+
+def upload_with_shared_client(upload_url: str, file_paths: list[str]) -> None:
+    """The Uploader's pooled client, shared by every file."""
+
+    with Uploader(upload_url=upload_url, http2=False) as uploader:
+        for file_path in file_paths:
+            assert uploader._upload_file(file_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=200, help="Number of files uploaded.")
+    parser.add_argument("--size", type=int, default=64 * 1024, help="Size of each file, in bytes.")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UploadHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    upload_url = f"http://127.0.0.1:{server.server_port}/"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_paths = []
+        for i in range(args.files):
+            path = os.path.join(tmp, f"DOM_{i:08d}.pdf")
+            with open(path, "wb") as f:
+                f.write(os.urandom(args.size))
+            file_paths.append(path)
+
+        results = {}
+        for name, upload in (
+            ("client per file", upload_with_new_clients),
+            ("shared client", upload_with_shared_client),
+        ):
+            start = time.perf_counter()
+            upload(upload_url, file_paths)
+            results[name] = time.perf_counter() - start
+
+    server.shutdown()
+
+    print(f"Uploading {args.files} files of {args.size} bytes:")
+    for name, total in results.items():
+        print(f"  {name:<16} {total / args.files * 1000:8.2f} ms/file")
+
+    baseline, fast = results.values()
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
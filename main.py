@@ -1,11 +1,28 @@
-from typing import List, Optional
+import csv
+import hashlib
+import io
+from datetime import date, datetime, time, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Literal, Optional, Sequence
 
-from fastapi import FastAPI, Depends, HTTPException, APIRouter, Query
+import orjson
+from fastapi import FastAPI, Body, Depends, HTTPException, APIRouter, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import StreamingResponse
 
-from src.conthabil import crud, schemas
-from src.conthabil.database import get_db
+from src.conthabil import async_crud, crud, pagination, schemas
+from src.conthabil.compression import CompressionMiddleware
+from src.conthabil.config import get_settings
+from src.conthabil.database import (
+    AsyncSessionLocal,
+    SessionLocal,
+    get_async_db,
+    get_db,
+    get_pool_status,
+)
+from src.conthabil.response_cache import CachedResponse, ResponseCache
 
 
 # -- App Initialization --
@@ -24,11 +41,238 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["POST", "GET"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
+)
+
+
+# -- Compression Middleware --
+# Brotli or gzip, negotiated from the request's Accept-Encoding header.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=get_settings().COMPRESSION_MINIMUM_SIZE,
+    gzip_level=get_settings().COMPRESSION_GZIP_LEVEL,
+    brotli_quality=get_settings().COMPRESSION_BROTLI_QUALITY,
 )
 
 
-# -- API Router --
+# -- Response Cache --
+# Serialized GET /gazettes/ responses, invalidated by the create routes.
+response_cache = ResponseCache(
+    max_entries=get_settings().RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=get_settings().RESPONSE_CACHE_TTL,
+    historical_ttl=get_settings().RESPONSE_CACHE_HISTORICAL_TTL,
+)
+
+# -- API Routers --
+# Only one of the sync or async gazette routers is mounted, according to DB_ASYNC.
 router = APIRouter()
+async_router = APIRouter()
+monitoring_router = APIRouter()
+
+
+# -- Route Helpers --
+def _select_gazettes_query(
+    month: Optional[int],
+    year: Optional[int],
+    date_from: Optional[date],
+    date_to: Optional[date],
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+) -> tuple[str, dict[str, Any]]:
+    """
+    Picks the name of the listing function (in both `crud` and `async_crud`)
+    and its keyword arguments matching the query parameters of `read_gazettes`.
+    """
+
+    if (month or year) and (date_from or date_to):
+        raise HTTPException(
+            status_code=400, detail="Filter either by month and year or by date range, not both."
+        )
+
+    if month and year:
+        return "get_gazettes_by_month_year", {"month": month, "year": year}
+
+    if (month and not year) or (not month and year):
+        raise HTTPException(
+            status_code=400, detail="Both month and year must be provided for filtering."
+        )
+
+    # Like the unfiltered listing, date ranges are paginated by offset or cursor.
+    page = {"after": _decode_cursor(cursor)} if cursor else {"skip": skip}
+
+    if date_from or date_to:
+        # The last representable day has no next day to end on, so it is left open.
+        return "get_gazettes_by_date_range", {
+            "start": datetime.combine(date_from, time.min) if date_from else None,
+            "end": (
+                datetime.combine(date_to + timedelta(days=1), time.min)
+                if date_to and date_to < date.max else None
+            ),
+            **page,
+            "limit": limit,
+        }
+
+    if cursor:
+        return "get_gazettes_after", {**page, "limit": limit}
+
+    return "get_gazettes", {**page, "limit": limit}
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decodes a pagination cursor, rejecting malformed ones with a 400."""
+
+    try:
+        return pagination.decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+
+def _cache_key(query_name: str, query_args: dict[str, Any]) -> tuple:
+    """Builds the response cache key of a listing query."""
+
+    return query_name, tuple(sorted(query_args.items()))
+
+
+def _query_span(query_args: dict[str, Any]) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Returns the `[start, end)` publication date range covered by a listing query."""
+
+    if "month" in query_args:
+        return crud.month_range(query_args["month"], query_args["year"])
+
+    return query_args.get("start"), query_args.get("end")
+
+
+def _validator_headers(key: tuple, stats: Any) -> dict[str, str]:
+    """
+    Builds the ETag and Last-Modified headers of a listing from the aggregate
+    `crud.get_gazettes_stats` of the date range it covers. The strong ETag
+    derives from the query, the row count and the highest id of the range,
+    which change whenever an entry is added to it; Last-Modified is the
+    creation time of its newest entry.
+    """
+
+    digest = hashlib.sha256(repr((key, stats.count, stats.max_id)).encode()).hexdigest()[:32]
+    headers = {"ETag": f'"{digest}"'}
+
+    if stats.last_created_at is not None:
+        newest = stats.last_created_at
+        # Naive values only come from databases storing UTC (e.g. SQLite).
+        if newest.tzinfo is None:
+            newest = newest.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(
+            newest.astimezone(timezone.utc).replace(microsecond=0), usegmt=True
+        )
+
+    return headers
+
+
+def _is_not_modified(request: Request, headers: dict[str, str]) -> bool:
+    """
+    Evaluates the request's If-None-Match (or, in its absence,
+    If-Modified-Since) header against the listing's validators.
+    """
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or headers["ETag"] in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and "Last-Modified" in headers:
+        try:
+            return _http_date(headers["Last-Modified"]) <= _http_date(if_modified_since)
+        except (TypeError, ValueError):
+            # An unreadable date cannot prove the client's copy is current.
+            return False
+
+    return False
+
+
+def _http_date(value: str) -> datetime:
+    """Parses an HTTP date, reading a "-0000" zone (parsed as naive) as UTC."""
+
+    parsed = parsedate_to_datetime(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _not_modified_response(headers: dict[str, str]) -> Response:
+    """Builds a 304 Not Modified response carrying the listing's validators."""
+
+    validators = {k: v for k, v in headers.items() if k in ("ETag", "Last-Modified")}
+    return Response(status_code=304, headers=validators)
+
+
+def _gazette_dict(gazette: Any) -> dict[str, Any]:
+    """Maps a gazette row to the fields of `GazetteResponse`."""
+
+    return {"url": gazette.url, "publication_date": gazette.publication_date, "id": gazette.id}
+
+
+def _render_gazettes(
+    gazettes: Sequence, query_args: dict[str, Any], headers: dict[str, str]
+) -> CachedResponse:
+    """
+    Serializes a gazette listing, adding the X-Next-Cursor header when a
+    paginated listing returned a full page.
+
+    The rows come straight from the database, so they are serialized with
+    orjson, producing the `GazetteResponse` layout without validating every
+    row through Pydantic.
+    """
+
+    body = orjson.dumps([_gazette_dict(g) for g in gazettes])
+
+    headers = dict(headers)
+    limit = query_args.get("limit")
+    if limit and len(gazettes) == limit:
+        headers["X-Next-Cursor"] = pagination.encode_cursor(gazettes[-1])
+
+    return CachedResponse(body=body, headers=headers)
+
+
+def _json_response(request: Request, cached: CachedResponse) -> Response:
+    """
+    Builds the HTTP response for a serialized listing, or a 304 Not Modified
+    when the client already holds it.
+    """
+
+    if _is_not_modified(request, cached.headers):
+        return _not_modified_response(cached.headers)
+
+    return Response(content=cached.body, media_type="application/json", headers=cached.headers)
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _format_export_chunk(rows: Iterable, export_format: str) -> str:
+    """Formats a batch of exported rows as NDJSON lines or CSV records."""
+
+    if export_format == "ndjson":
+        return "".join(orjson.dumps(_gazette_dict(r)).decode() + "\n" for r in rows)
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows((r.id, r.url, r.publication_date.isoformat()) for r in rows)
+    return buffer.getvalue()
+
+
+def _export_header(export_format: str) -> str:
+    """Returns the header line of an export, if the format has one."""
+
+    return "id,url,publication_date\r\n" if export_format == "csv" else ""
+
+
+def _export_response(content: Iterator[str] | AsyncIterator[str], export_format: str) -> StreamingResponse:
+    """Builds the streaming response of an export."""
+
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="gazettes.{export_format}"'},
+    )
 
 
 # -- Route Declarations --
@@ -38,36 +282,247 @@ def create_gazette(gazette: schemas.GazetteCreate, db: Session = Depends(get_db)
     Create a new gazette entry.
     """
 
-    return crud.create_gazette(db=db, gazette=gazette)
+    stored, created = crud.create_gazette(db=db, gazette=gazette)
+    if created:
+        response_cache.invalidate([stored.publication_date])
+
+    return stored
+
+
+@router.post("/gazettes/bulk", response_model=List[schemas.GazetteResponse], tags=["Gazettes"])
+def create_gazettes_bulk(
+    gazettes: List[schemas.GazetteCreate] = Body(..., max_length=get_settings().API_BULK_CHUNK_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Create many gazette entries in a single transaction.
+
+    Entries whose URL already exists are not duplicated. The response contains
+    the created or already existing entry of each item, in the request order.
+    Requests are limited to `API_BULK_CHUNK_SIZE` entries, the size of the
+    chunks sent by the `ApiClient`.
+    """
+
+    stored, created = crud.create_gazettes(db=db, gazettes=gazettes)
+    response_cache.invalidate(row.publication_date for row in created)
+
+    return stored
 
 
 @router.get("/gazettes/", response_model=List[schemas.GazetteResponse], tags=["Gazettes"])
 def read_gazettes(
+    request: Request,
     month: Optional[int] = Query(None, ge=1, le=12),
     year: Optional[int] = Query(None),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
     """
     Retrieve gazette entries.
 
     - If **month** and **year** are provided, it filters entries by publication date.
-    - Otherwise, it returns a paginated list of all entries.
+    - If **date_from** and/or **date_to** are provided, it filters entries published
+      between those dates (both inclusive), paginated like the unfiltered listing.
+    - Otherwise, it returns a paginated list of all entries, ordered by publication date.
 
     - **skip**: Number of entries to skip (for pagination).
     - **limit**: Maximum number of entries to return (for pagination).
+    - **cursor**: Opaque cursor from the `X-Next-Cursor` header of the previous
+      page. Fetches the next page in constant time, regardless of its depth.
+
+    When a page is full, the `X-Next-Cursor` response header holds the cursor
+    for the next page.
+
+    Responses are cached in memory, keyed by the query parameters, until a new
+    entry is created in the date range they cover.
+
+    Responses carry `ETag` and `Last-Modified` headers; requests sending a
+    matching `If-None-Match` (or `If-Modified-Since`) get a `304 Not Modified`.
     """
 
-    if month and year:
-        return crud.get_gazettes_by_month_year(db, month=month, year=year)
+    query_name, query_args = _select_gazettes_query(
+        month, year, date_from, date_to, skip, limit, cursor
+    )
+    key = _cache_key(query_name, query_args)
+    cached = response_cache.get(key)
 
-    if (month and not year) or (not month and year):
-        raise HTTPException(
-            status_code=400, detail="Both month and year must be provided for filtering."
-        )
+    if cached is None:
+        # Taken before the queries, so that a write committed meanwhile keeps
+        # the (possibly stale) response out of the cache.
+        generation = response_cache.generation()
+        stats = crud.get_gazettes_stats(db, *_query_span(query_args))
+        validators = _validator_headers(key, stats)
+
+        # Answer repeat polls with the aggregate query alone, before paying
+        # for the listing query and its serialization.
+        if _is_not_modified(request, validators):
+            return _not_modified_response(validators)
+
+        query = getattr(crud, query_name)
+        gazettes = query(db, **query_args)
+        cached = _render_gazettes(gazettes, query_args, validators)
+        response_cache.set(key, cached, *_query_span(query_args), generation=generation)
+
+    return _json_response(request, cached)
+
+
+@router.get("/gazettes/export", tags=["Gazettes"])
+def export_gazettes(export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format")):
+    """
+    Export the whole gazette archive as NDJSON (one JSON object per line) or CSV.
+
+    Rows are streamed from a server-side cursor, so memory use stays constant
+    regardless of the archive size.
+    """
+
+    batch_size = get_settings().EXPORT_BATCH_SIZE
+
+    def generate() -> Iterator[str]:
+        # The session is owned by the generator because the stream outlives
+        # the request handler.
+        db = SessionLocal()
+        try:
+            yield _export_header(export_format)
+
+            batch = []
+            for row in crud.iter_gazettes(db, batch_size=batch_size):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield _format_export_chunk(batch, export_format)
+                    batch = []
+
+            yield _format_export_chunk(batch, export_format)
+        finally:
+            db.close()
+
+    return _export_response(generate(), export_format)
+
+
+# -- Async Route Declarations --
+@async_router.post(
+    "/gazettes/",
+    response_model=schemas.GazetteResponse,
+    tags=["Gazettes"],
+    description=create_gazette.__doc__,
+)
+async def create_gazette_async(
+    gazette: schemas.GazetteCreate, db: AsyncSession = Depends(get_async_db)
+):
+    """Async version of `create_gazette`."""
+
+    stored, created = await async_crud.create_gazette(db=db, gazette=gazette)
+    if created:
+        response_cache.invalidate([stored.publication_date])
+
+    return stored
+
+
+@async_router.post(
+    "/gazettes/bulk",
+    response_model=List[schemas.GazetteResponse],
+    tags=["Gazettes"],
+    description=create_gazettes_bulk.__doc__,
+)
+async def create_gazettes_bulk_async(
+    gazettes: List[schemas.GazetteCreate] = Body(..., max_length=get_settings().API_BULK_CHUNK_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async version of `create_gazettes_bulk`."""
+
+    stored, created = await async_crud.create_gazettes(db=db, gazettes=gazettes)
+    response_cache.invalidate(row.publication_date for row in created)
+
+    return stored
+
+
+@async_router.get(
+    "/gazettes/",
+    response_model=List[schemas.GazetteResponse],
+    tags=["Gazettes"],
+    description=read_gazettes.__doc__,
+)
+async def read_gazettes_async(
+    request: Request,
+    month: Optional[int] = Query(None, ge=1, le=12),
+    year: Optional[int] = Query(None),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async version of `read_gazettes`."""
+
+    query_name, query_args = _select_gazettes_query(
+        month, year, date_from, date_to, skip, limit, cursor
+    )
+    key = _cache_key(query_name, query_args)
+    cached = response_cache.get(key)
+
+    if cached is None:
+        generation = response_cache.generation()
+        stats = await async_crud.get_gazettes_stats(db, *_query_span(query_args))
+        validators = _validator_headers(key, stats)
+
+        if _is_not_modified(request, validators):
+            return _not_modified_response(validators)
+
+        query = getattr(async_crud, query_name)
+        gazettes = await query(db, **query_args)
+        cached = _render_gazettes(gazettes, query_args, validators)
+        response_cache.set(key, cached, *_query_span(query_args), generation=generation)
+
+    return _json_response(request, cached)
+
+
+@async_router.get("/gazettes/export", tags=["Gazettes"], description=export_gazettes.__doc__)
+async def export_gazettes_async(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+):
+    """Async version of `export_gazettes`."""
+
+    batch_size = get_settings().EXPORT_BATCH_SIZE
+
+    async def generate() -> AsyncIterator[str]:
+        async with AsyncSessionLocal() as db:
+            yield _export_header(export_format)
+
+            batch = []
+            async for row in async_crud.iter_gazettes(db, batch_size=batch_size):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield _format_export_chunk(batch, export_format)
+                    batch = []
+
+            yield _format_export_chunk(batch, export_format)
+
+    return _export_response(generate(), export_format)
+
+
+# -- Monitoring Route Declarations --
+@monitoring_router.get("/stats/db-pool", response_model=schemas.DatabasePoolStatus, tags=["Monitoring"])
+def read_db_pool_status():
+    """
+    Retrieve the database connection pool state and its cumulative checkout,
+    checkin, connect and invalidation counters.
+    """
+
+    return get_pool_status()
+
+
+@monitoring_router.get("/stats/response-cache", response_model=schemas.ResponseCacheStats, tags=["Monitoring"])
+def read_response_cache_stats():
+    """
+    Retrieve the size and hit/miss counters of the gazette listing response cache.
+    """
 
-    return crud.get_gazettes(db, skip=skip, limit=limit)
+    return response_cache.stats()
 
 
-app.include_router(router)
+app.include_router(async_router if get_settings().DB_ASYNC else router)
+app.include_router(monitoring_router)
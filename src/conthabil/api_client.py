@@ -1,29 +1,88 @@
 import logging
 from datetime import datetime
+from types import TracebackType
+from typing import Self
 
 import httpx
 
+from conthabil.circuit_breaker import CircuitBreaker
+from conthabil.ratelimit import RateLimiter
+
+
+def gazette_payload(publication_date: datetime, uploaded_url: str) -> dict[str, str]:
+    """Returns the JSON body describing a gazette to the API."""
+
+    return {"url": uploaded_url, "publication_date": publication_date.isoformat()}
+
 
 class ApiClient:
     """
     A client to handle communication with the gazette storage API.
+    It can be used as a context manager to close the HTTP client when done.
     """
 
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        bulk_chunk_size: int = 100,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
         """
         Initializes the ApiClient.
 
         Args:
             base_url: The base URL of the API (e.g., 'http://app:8000/api').
+            bulk_chunk_size: Maximum number of gazettes sent per bulk request.
+            rate_limiter: Adaptive per-host rate limiter for the API requests.
+            circuit_breaker: Circuit breaker guarding the API.
+            transport: Transport of the HTTP client, replacing the network
+                (e.g. an `httpx.MockTransport`).
         """
 
         self.base_url = base_url
-        self.client = httpx.Client()
+        self.bulk_chunk_size = bulk_chunk_size
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker("gazette API")
+        self.client = httpx.Client(transport=transport)
+
+        # Gazettes skipped while the circuit was open, to be stored by a later run.
+        self.parked: list[tuple[datetime, str]] = []
+
+
+    def __enter__(self) -> Self:
+        """
+        Enters the context manager.
+        """
+        return self
+
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """
+        Exits the context manager, closing the HTTP client.
+        """
+
+        self.close()
+
+
+    def close(self) -> None:
+        """
+        Closes the HTTP client and its open connections.
+        """
+
+        self.client.close()
 
 
     def store_gazette(self, publication_date: datetime, uploaded_url: str) -> bool:
         """
-        Posts a new gazette entry to the API.
+        Posts a new gazette entry to the API. While the API's circuit is open,
+        the entry is parked instead.
 
         Args:
             publication_date: The publication date of the gazette.
@@ -34,15 +93,19 @@ class ApiClient:
         """
 
         endpoint = f"{self.base_url}/gazettes/"
+        payload = gazette_payload(publication_date, uploaded_url)
 
-        payload = {
-            "url": uploaded_url,
-            "publication_date": publication_date.isoformat(),
-        }
+        if not self.circuit_breaker.allow():
+            logging.warning(f"Gazette API is unavailable. Parking {uploaded_url} for a later run.")
+            self.parked.append((publication_date, uploaded_url))
+            return False
 
         try:
-            response = self.client.post(endpoint, json=payload)
-            response.raise_for_status()
+            with self.circuit_breaker.record_call():
+                response = self.rate_limiter.send(
+                    endpoint, lambda: self.client.post(endpoint, json=payload)
+                )
+                response.raise_for_status()
             return True
 
         except httpx.HTTPStatusError as e:
@@ -56,3 +119,56 @@ class ApiClient:
             logging.error(f"Error storing URL {uploaded_url} via API: {e}")
             return False
 
+
+    def store_gazettes(self, gazettes: list[tuple[datetime, str]]) -> int:
+        """
+        Posts many gazette entries to the API's bulk endpoint, in chunks of
+        `bulk_chunk_size` entries per request. Chunks are parked while the
+        API's circuit is open, and when their request fails, so that no
+        gazette is lost.
+
+        Args:
+            gazettes: Pairs of (publication_date, uploaded_url).
+
+        Returns:
+            The number of gazettes stored (created or already existing).
+        """
+
+        endpoint = f"{self.base_url}/gazettes/bulk"
+        stored = 0
+
+        for start in range(0, len(gazettes), self.bulk_chunk_size):
+            chunk = gazettes[start:start + self.bulk_chunk_size]
+            payload = [gazette_payload(*gazette) for gazette in chunk]
+
+            if not self.circuit_breaker.allow():
+                logging.warning(
+                    f"Gazette API is unavailable. Parking a chunk of {len(chunk)} URLs for a later run."
+                )
+                self.parked.extend(chunk)
+                continue
+
+            try:
+                with self.circuit_breaker.record_call():
+                    response = self.rate_limiter.send(
+                        endpoint, lambda: self.client.post(endpoint, json=payload)
+                    )
+                    response.raise_for_status()
+                stored += len(response.json())
+
+            except httpx.HTTPStatusError as e:
+                logging.error(
+                    f"Error storing a chunk of {len(chunk)} URLs via API: {e}. "
+                    f"Response: {e.response.text}"
+                )
+                self.parked.extend(chunk)
+
+            except httpx.RequestError as e:
+                logging.error(f"Error storing a chunk of {len(chunk)} URLs via API: {e}")
+                self.parked.extend(chunk)
+
+            except ValueError as e:
+                logging.error(f"Unreadable response storing a chunk of {len(chunk)} URLs via API: {e}")
+                self.parked.extend(chunk)
+
+        return stored
@@ -0,0 +1,194 @@
+"""
+Async counterparts of the `crud` functions, for use with an AsyncSession.
+
+The queries themselves are built by the statement builders in `crud`, so both
+paths always run the exact same SQL.
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Sequence
+import logging
+
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from conthabil.crud import (
+    GAZETTE_COLUMNS,
+    find_missing_urls,
+    gazettes_after_statement,
+    gazettes_by_urls_statement,
+    gazettes_export_statement,
+    gazettes_in_range_statement,
+    gazettes_page_statement,
+    gazettes_stats_statement,
+    in_request_order,
+    log_bulk_result,
+    month_range,
+    unique_gazettes,
+    upsert_gazettes_statement,
+)
+from conthabil.models import Gazette
+from conthabil.schemas import GazetteCreate
+
+
+async def create_gazette(db: AsyncSession, gazette: GazetteCreate) -> tuple[Row, bool]:
+    """
+    Creates a new gazette entry in the database, returning the existing one if
+    the URL is already stored. See `crud.create_gazette`.
+
+    Args:
+        db: The async database session.
+        gazette: The Pydantic schema for creating a gazette.
+
+    Returns:
+        A row with the id, url and publication date of the created or
+        existing gazette, and whether it was created.
+    """
+
+    stmt = upsert_gazettes_statement(db.get_bind().dialect, [gazette])
+
+    if stmt is None:
+        created = await _insert_gazette_fallback(db, gazette)
+    else:
+        created = (await db.execute(stmt)).one_or_none()
+    await db.commit()
+
+    if created is None:
+        logging.info(f"Gazette with URL {gazette.url} already exists. Skipping creation.")
+        return (await db.execute(gazettes_by_urls_statement([gazette.url]))).one(), False
+
+    logging.info(f"Successfully created new gazette entry for URL: {gazette.url}")
+
+    return created, True
+
+
+async def _insert_gazette_fallback(db: AsyncSession, gazette: GazetteCreate) -> Row | None:
+    """
+    Inserts a gazette in a savepoint on dialects without ON CONFLICT support.
+    See `crud._insert_gazette_fallback`.
+    """
+
+    db_gazette = Gazette(url=gazette.url, publication_date=gazette.publication_date)
+
+    try:
+        async with db.begin_nested():
+            db.add(db_gazette)
+    except IntegrityError:
+        return None
+
+    return (
+        await db.execute(select(*GAZETTE_COLUMNS).where(Gazette.id == db_gazette.id))
+    ).one()
+
+
+async def create_gazettes(
+    db: AsyncSession, gazettes: Sequence[GazetteCreate]
+) -> tuple[list[Row], Sequence[Row]]:
+    """
+    Creates many gazette entries in a single transaction. See `crud.create_gazettes`.
+
+    Args:
+        db: The async database session.
+        gazettes: The Pydantic schemas for the gazettes to create.
+
+    Returns:
+        Rows with the id, url and publication date of the created or already
+        existing gazette of each input, in the order of `gazettes`, and the
+        rows of the gazettes actually created.
+    """
+
+    if not gazettes:
+        return [], []
+
+    stmt = upsert_gazettes_statement(db.get_bind().dialect, gazettes)
+
+    if stmt is None:
+        created = [
+            row
+            for gazette in unique_gazettes(gazettes)
+            if (row := await _insert_gazette_fallback(db, gazette)) is not None
+        ]
+    else:
+        created = (await db.execute(stmt)).all()
+    await db.commit()
+
+    missing_urls = find_missing_urls(gazettes, created)
+    existing = (
+        (await db.execute(gazettes_by_urls_statement(missing_urls))).all() if missing_urls else []
+    )
+
+    log_bulk_result(gazettes, created, existing)
+
+    return in_request_order(gazettes, [*created, *existing]), created
+
+
+async def get_gazettes(db: AsyncSession, skip: int = 0, limit: int = 100) -> Sequence[Row]:
+    """
+    Retrieves a list of gazette entries. See `crud.get_gazettes`.
+    """
+
+    return (await db.execute(gazettes_page_statement(skip=skip, limit=limit))).all()
+
+
+async def get_gazettes_after(
+    db: AsyncSession, after: tuple[datetime, int], limit: int = 100
+) -> Sequence[Row]:
+    """
+    Retrieves the page of gazette entries following a given sort key. See
+    `crud.get_gazettes_after`.
+    """
+
+    return (await db.execute(gazettes_after_statement(after=after, limit=limit))).all()
+
+
+async def get_gazettes_by_month_year(db: AsyncSession, month: int, year: int) -> Sequence[Row]:
+    """
+    Retrieves gazette entries filtered by publication month and year. See
+    `crud.get_gazettes_by_month_year`.
+    """
+
+    start, end = month_range(month, year)
+
+    return await get_gazettes_by_date_range(db, start=start, end=end)
+
+
+async def get_gazettes_by_date_range(
+    db: AsyncSession,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    skip: int = 0,
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
+) -> Sequence[Row]:
+    """
+    Retrieves gazette entries published within `[start, end)`. See
+    `crud.get_gazettes_by_date_range`.
+    """
+
+    stmt = gazettes_in_range_statement(start=start, end=end, skip=skip, limit=limit, after=after)
+
+    return (await db.execute(stmt)).all()
+
+
+async def get_gazettes_stats(
+    db: AsyncSession, start: datetime | None = None, end: datetime | None = None
+) -> Row:
+    """
+    Retrieves the count, highest id and latest creation time of the gazettes
+    published within `[start, end)`. See `crud.get_gazettes_stats`.
+    """
+
+    return (await db.execute(gazettes_stats_statement(start=start, end=end))).one()
+
+
+async def iter_gazettes(db: AsyncSession, batch_size: int = 1000) -> AsyncIterator[Row]:
+    """
+    Streams every gazette entry from a server-side cursor. See `crud.iter_gazettes`.
+    """
+
+    stmt = gazettes_export_statement().execution_options(yield_per=batch_size)
+
+    async for row in await db.stream(stmt):
+        yield row
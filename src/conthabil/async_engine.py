@@ -0,0 +1,366 @@
+"""
+Asyncio engine for the download, upload and store network stages.
+
+Concurrency is bounded per target host with semaphores, and the transfers
+are awaited on the event loop instead of each holding a thread. Apart from
+awaiting its requests, the engine works like the threaded
+workflows: each stage has an httpx.AsyncClient configured like the stage's
+sync client, requests go through the same adaptive rate limiter and circuit
+breakers, and downloads reuse the helpers of `downloads.py`.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from types import TracebackType
+from typing import Self
+from urllib.parse import urlsplit
+
+import httpx
+
+from conthabil.api_client import gazette_payload
+from conthabil.circuit_breaker import CircuitBreaker
+from conthabil.downloads import (
+    MAX_RESTARTS,
+    IncompleteDownloadError,
+    complete_download,
+    download_request,
+    open_part_file,
+)
+from conthabil.manifest import MANIFEST_FILENAME, DownloadManifest, file_sha256
+from conthabil.pipeline import PipelineResult, parse_publication_date
+from conthabil.ratelimit import RateLimiter
+from conthabil.upload_cache import UploadCache
+
+
+# Bytes of a download buffered before each write to its partial file.
+DOWNLOAD_WRITE_SIZE = 256 * 1024
+
+
+class AsyncEngine:
+    """
+    Downloads, uploads and stores gazettes concurrently on a single event loop.
+    It is designed to be used as an async context manager.
+    """
+
+    def __init__(
+        self,
+        download_path: str,
+        upload_url: str,
+        api_base_url: str,
+        default_host_limit: int = 10,
+        host_limits: dict[str, int] | None = None,
+        upload_cache: UploadCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        upload_circuit_breaker: CircuitBreaker | None = None,
+        api_circuit_breaker: CircuitBreaker | None = None,
+        download_limits: httpx.Limits | None = None,
+        download_http2: bool = True,
+        upload_limits: httpx.Limits | None = None,
+        upload_http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initializes the AsyncEngine.
+
+        Args:
+            download_path: The directory to save downloaded files.
+            upload_url: The target URL for file uploads.
+            api_base_url: The base URL of the gazette API.
+            default_host_limit: Maximum in-flight requests per host.
+            host_limits: Per-host overrides of the in-flight limit, keyed by hostname.
+            upload_cache: Content-addressed cache of previous uploads, consulted
+                before uploading each file.
+            rate_limiter: Adaptive per-host rate limiter for every request.
+            upload_circuit_breaker: Circuit breaker guarding the upload host.
+            api_circuit_breaker: Circuit breaker guarding the API.
+            download_limits: Connection pool limits of the download client
+                (by default, those of a Downloader).
+            download_http2: Whether downloads negotiate HTTP/2 with servers that support it.
+            upload_limits: Connection pool limits of the upload client
+                (by default, those of an Uploader).
+            upload_http2: Whether uploads negotiate HTTP/2 with servers that support it.
+            transport: Transport of the HTTP clients, replacing the network
+                (e.g. an `httpx.MockTransport`).
+        """
+
+        self.download_path = download_path
+        self.upload_url = upload_url
+        self.api_base_url = api_base_url
+        self.default_host_limit = default_host_limit
+        self.host_limits = host_limits or {}
+        self.upload_cache = upload_cache
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.upload_circuit_breaker = upload_circuit_breaker or CircuitBreaker("upload host")
+        self.api_circuit_breaker = api_circuit_breaker or CircuitBreaker("gazette API")
+        self.download_limits = download_limits or httpx.Limits(
+            max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0
+        )
+        self.download_http2 = download_http2
+        self.upload_limits = upload_limits or httpx.Limits(
+            max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0
+        )
+        self.upload_http2 = upload_http2
+        self.transport = transport
+
+        self.manifest = DownloadManifest(os.path.join(download_path, MANIFEST_FILENAME))
+
+        # Files and gazettes skipped while a circuit was open, for a later run.
+        self.parked_uploads: list[str] = []
+        self.parked_gazettes: list[tuple[datetime, str]] = []
+
+        self.download_client: httpx.AsyncClient | None = None
+        self.upload_client: httpx.AsyncClient | None = None
+        self.api_client: httpx.AsyncClient | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+    async def __aenter__(self) -> Self:
+        """
+        Enters the context manager, opening the HTTP clients of the stages.
+        """
+
+        self.download_client = httpx.AsyncClient(
+            limits=self.download_limits,
+            http2=self.download_http2,
+            follow_redirects=True,
+            transport=self.transport,
+        )
+        self.upload_client = httpx.AsyncClient(
+            limits=self.upload_limits, http2=self.upload_http2, transport=self.transport
+        )
+        self.api_client = httpx.AsyncClient(transport=self.transport)
+        return self
+
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """
+        Exits the context manager, closing the HTTP clients.
+        """
+
+        for client in (self.download_client, self.upload_client, self.api_client):
+            if client:
+                await client.aclose()
+
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        """Returns the semaphore bounding concurrent requests to the URL's host."""
+
+        host = urlsplit(url).hostname or ""
+        if host not in self._semaphores:
+            limit = self.host_limits.get(host, self.default_host_limit)
+            self._semaphores[host] = asyncio.Semaphore(limit)
+
+        return self._semaphores[host]
+
+
+    async def run(self, links: list[str]) -> PipelineResult:
+        """
+        Pushes every link through download, upload and store concurrently.
+
+        Args:
+            links: The URLs of the files to process.
+
+        Returns:
+            A PipelineResult with the number of files completed per stage.
+        """
+
+        if not (self.download_client and self.upload_client and self.api_client):
+            raise RuntimeError("HTTP clients not initialized. Use the 'async with' statement.")
+
+        logging.info(f"Starting async processing of {len(links)} files...")
+
+        result = PipelineResult()
+        await asyncio.gather(*(self._process(link, result) for link in links))
+
+        logging.info(
+            f"Async engine finished. Downloaded: {result.downloaded}, "
+            f"uploaded: {result.uploaded}, stored: {result.stored}."
+        )
+        return result
+
+
+    async def _process(self, link: str, result: PipelineResult) -> None:
+        """Moves a single file through the three stages."""
+
+        file_path = await self.download_file(link)
+        if not file_path:
+            return
+        result.downloaded += 1
+
+        uploaded_url = await self.upload_file(file_path)
+        if not uploaded_url:
+            return
+        result.uploaded += 1
+
+        try:
+            publication_date = parse_publication_date(file_path)
+        except ValueError as e:
+            logging.error(
+                f"Error parsing date from filename '{os.path.basename(file_path)}': {e}. "
+                f"Skipping storage for {uploaded_url}."
+            )
+            return
+
+        if await self.store_gazette(publication_date, uploaded_url):
+            result.stored += 1
+
+
+    async def download_file(self, link: str) -> str | None:
+        """
+        Downloads a single file from a given link, resuming a partial
+        download and skipping files unchanged since the last run. See
+        `Downloader._download_file`.
+
+        Args:
+            link: The URL of the file to download.
+
+        Returns:
+            The local path of the downloaded file, or None if download fails.
+        """
+
+        try:
+            for _ in range(MAX_RESTARTS + 1):
+                save_path, offset, headers = download_request(link, self.download_path, self.manifest)
+
+                async with self._semaphore(link):
+                    response = await self.rate_limiter.asend(
+                        link, lambda: self._fetch_to_part_file(link, save_path, offset, headers)
+                    )
+
+                # Hashing the file for the manifest is blocking, so it runs off the event loop.
+                if await asyncio.to_thread(
+                    complete_download, link, save_path, offset, response, self.manifest
+                ):
+                    return save_path
+
+            raise IncompleteDownloadError(f"Gave up restarting the download of {link}")
+
+        except (httpx.HTTPError, IOError) as e:
+            logging.error(f"Error downloading {link}: {e}")
+            return None
+
+
+    async def _fetch_to_part_file(
+        self, link: str, save_path: str, offset: int, headers: dict[str, str]
+    ) -> httpx.Response:
+        """See `Downloader._fetch_to_part_file`."""
+
+        assert self.download_client, "HTTP client is not initialized."
+
+        async with self.download_client.stream("GET", link, headers=headers) as response:
+            if response.is_success:
+                # Disk I/O runs off the event loop, one thread hop per buffered chunk.
+                f = await asyncio.to_thread(open_part_file, save_path, response, offset)
+                try:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_WRITE_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+
+        return response
+
+
+    async def upload_file(self, file_path: str) -> str | None:
+        """
+        Uploads a single file, unless the upload cache already holds a URL
+        for the same content. See `Uploader._upload_file`.
+
+        Args:
+            file_path: The local path of the file to upload.
+
+        Returns:
+            The public URL of the uploaded file, or None if the upload fails.
+        """
+
+        try:
+            file_name = os.path.basename(file_path)
+
+            if self.upload_cache is not None:
+                sha256 = await asyncio.to_thread(file_sha256, file_path)
+                if cached_url := self.upload_cache.get(sha256):
+                    logging.info(f"{file_name} was already uploaded to {cached_url}. Skipping upload.")
+                    return cached_url
+
+            async with self._semaphore(self.upload_url):
+                # Checked once a slot is free, as the circuit may have opened meanwhile.
+                if not self.upload_circuit_breaker.allow():
+                    logging.warning(f"Upload host is unavailable. Parking {file_name} for a later run.")
+                    self.parked_uploads.append(file_path)
+                    return None
+
+                with self.upload_circuit_breaker.record_call():
+                    response = await self.rate_limiter.asend(
+                        self.upload_url, lambda: self._post_file(file_path)
+                    )
+                    response.raise_for_status()
+
+            url = response.text.strip()
+
+            if self.upload_cache is not None:
+                self.upload_cache.set(sha256, url)
+
+            return url
+
+        except (httpx.HTTPError, IOError) as e:
+            logging.error(f"Error uploading {file_path}: {e}")
+            return None
+
+
+    async def _post_file(self, file_path: str) -> httpx.Response:
+        """Posts a file to the upload URL as multipart/form-data."""
+
+        assert self.upload_client, "HTTP client is not initialized."
+
+        with open(file_path, "rb") as f:
+            files = {"file": (os.path.basename(file_path), f, "application/pdf")}
+            return await self.upload_client.post(self.upload_url, files=files)
+
+
+    async def store_gazette(self, publication_date: datetime, uploaded_url: str) -> bool:
+        """
+        Posts a new gazette entry to the API. See `ApiClient.store_gazette`.
+
+        Args:
+            publication_date: The publication date of the gazette.
+            uploaded_url: The public URL of the file after uploading.
+
+        Returns:
+            True if the gazette was stored successfully, False otherwise.
+        """
+
+        assert self.api_client, "HTTP client is not initialized."
+
+        endpoint = f"{self.api_base_url}/gazettes/"
+        payload = gazette_payload(publication_date, uploaded_url)
+
+        try:
+            async with self._semaphore(endpoint):
+                if not self.api_circuit_breaker.allow():
+                    logging.warning(f"Gazette API is unavailable. Parking {uploaded_url} for a later run.")
+                    self.parked_gazettes.append((publication_date, uploaded_url))
+                    return False
+
+                with self.api_circuit_breaker.record_call():
+                    response = await self.rate_limiter.asend(
+                        endpoint, lambda: self.api_client.post(endpoint, json=payload)
+                    )
+                    response.raise_for_status()
+            return True
+
+        except httpx.HTTPStatusError as e:
+            logging.error(
+                f"Error storing URL {uploaded_url} via API: {e}. "
+                f"Response: {e.response.text}"
+            )
+            return False
+
+        except httpx.RequestError as e:
+            logging.error(f"Error storing URL {uploaded_url} via API: {e}")
+            return False
@@ -0,0 +1,158 @@
+"""
+Circuit breaker for the outbound HTTP clients.
+
+After `failure_threshold` consecutive failed requests to a service, the
+circuit opens and further calls are refused immediately instead of waiting
+for each one to time out against a host that is down. Once `reset_timeout`
+seconds have passed, a single trial request is let through (half-open): its
+success closes the circuit again, its failure re-opens it. Calls that fail
+for reasons unrelated to the service must `release` their permission, which
+`record_call` takes care of.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+
+import httpx
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_outage(error: httpx.HTTPError) -> bool:
+    """
+    Tells whether a request error means the service is unavailable (transport
+    errors, 5xx and 429 responses), as opposed to a rejected request.
+    """
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+
+    return True
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open/half-open circuit breaker guarding one service.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initializes the CircuitBreaker.
+
+        Args:
+            name: The name of the guarded service, used in the logs.
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a trial call.
+        """
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+
+    def allow(self) -> bool:
+        """
+        Tells whether a call may proceed. In the half-open state, only one
+        trial call is allowed until its outcome is recorded.
+        """
+
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                logging.info(f"Circuit for {self.name} is half-open. Trying a request.")
+                self.state = CircuitState.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == CircuitState.HALF_OPEN:
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+
+            return True
+
+
+    def record_success(self) -> None:
+        """Records a successful call, closing the circuit."""
+
+        with self._lock:
+            if self.state != CircuitState.CLOSED:
+                logging.info(f"Circuit for {self.name} is closed again.")
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+
+    def record_failure(self) -> None:
+        """Records a failed call, opening the circuit past the threshold."""
+
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+
+            if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != CircuitState.OPEN:
+                    logging.warning(
+                        f"Circuit for {self.name} is open after {self.failures} consecutive "
+                        f"failures. Failing fast for {self.reset_timeout:.0f}s."
+                    )
+                self.state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+
+
+    def release(self) -> None:
+        """
+        Gives back a call that ended without telling whether the service is
+        up (e.g. it failed reading a local file), so that a half-open circuit
+        lets another trial through instead of waiting for this one forever.
+        """
+
+        with self._lock:
+            self._trial_in_flight = False
+
+
+    def record_error(self, error: httpx.HTTPError) -> None:
+        """
+        Records a call that raised an HTTP error: outages count as failures,
+        while rejected requests show the service is up.
+        """
+
+        if is_outage(error):
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+    @contextmanager
+    def record_call(self) -> Iterator[None]:
+        """
+        Records the outcome of the call made in the `with` block, once `allow`
+        let it through: a success if the block completes, `record_error` if it
+        raises an httpx error, and `release` on any other exception.
+        """
+
+        try:
+            yield
+        except httpx.HTTPError as e:
+            self.record_error(e)
+            raise
+        except BaseException:
+            self.release()
+            raise
+
+        self.record_success()
@@ -0,0 +1,215 @@
+"""
+ASGI middleware compressing API responses with Brotli or gzip.
+
+The encoding is negotiated from the request's Accept-Encoding header, with
+Brotli preferred over gzip when the client accepts both. Responses smaller
+than a threshold are sent as they are, since compressing them costs more CPU
+than the bytes it saves. Streaming responses (such as the export endpoint)
+are compressed chunk by chunk, flushing after each one, so rows still reach
+the client as soon as they are produced.
+"""
+
+import zlib
+from typing import Protocol
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Encodings in order of preference.
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+# Statuses whose responses have no body, or a body that must not be re-encoded.
+_UNCOMPRESSED_STATUSES = {204, 206, 304}
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        # wbits=31 selects the gzip container instead of a raw zlib stream.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Picks the preferred supported encoding accepted by the client.
+
+    Args:
+        accept_encoding: The value of the request's Accept-Encoding header.
+
+    Returns:
+        "br", "gzip", or None if the client accepts neither.
+    """
+
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+
+    candidates = [
+        (accepted.get(encoding, accepted.get("*", 0.0)), -rank, encoding)
+        for rank, encoding in enumerate(SUPPORTED_ENCODINGS)
+    ]
+    quality, _, encoding = max(candidates)
+
+    return encoding if quality > 0 else None
+
+
+class CompressionMiddleware:
+    """
+    Compresses response bodies with Brotli or gzip, according to the client's
+    Accept-Encoding header.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        """
+        Initializes the CompressionMiddleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            minimum_size: Responses with fewer bytes than this are not compressed.
+            gzip_level: The gzip compression level (1-9).
+            brotli_quality: The Brotli compression quality (0-11).
+        """
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+    def _compressor(self, encoding: str) -> _Compressor:
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+
+class _CompressionResponder:
+    """Rewrites the messages of a single response."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+
+        self.start_message: Message | None = None
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] in _UNCOMPRESSED_STATUSES or "content-encoding" in headers
+            )
+            if self.passthrough:
+                await self._send(message)
+            else:
+                # Held back until the first body chunk shows whether to compress.
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self._send(start_message)
+                await self._send(message)
+                return
+
+            self.compressor = self.middleware._compressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            # The compressed body is no longer byte-identical to the one the
+            # ETag was computed over.
+            if "etag" in headers and not headers["etag"].startswith("W/"):
+                headers["ETag"] = f"W/{headers['etag']}"
+
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            await self._send(start_message)
+
+        assert self.compressor is not None
+        if more_body:
+            chunk = self.compressor.compress(body) + self.compressor.flush()
+        else:
+            chunk = self.compressor.compress(body) + self.compressor.finish()
+
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -8,6 +8,7 @@ settings are present and valid on application startup.
 
 import logging
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -30,10 +31,134 @@ class Settings(BaseSettings):
     # --- Database Configuration ---
     DATABASE_URL: str = "postgresql+psycopg://user:password@db:5432/conthabil_db"
 
+    # --- Database Connection Pool ---
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Seconds to wait for a free connection before giving up.
+    DB_POOL_TIMEOUT: float = 30
+    # Seconds after which a connection is replaced (-1 disables recycling).
+    DB_POOL_RECYCLE: int = 1800
+    # Test connections on checkout, transparently replacing stale ones
+    # (e.g. after a PostgreSQL restart).
+    DB_POOL_PRE_PING: bool = True
+    # When connecting through PgBouncer, let it do the pooling (NullPool) and
+    # disable server-side prepared statements.
+    DB_PGBOUNCER_MODE: bool = False
+    # Serve the API routes with async handlers on an AsyncSession (psycopg
+    # async), instead of sync handlers running in Starlette's threadpool.
+    DB_ASYNC: bool = False
+
+    # --- API Response Cache ---
+    # In-process cache of serialized GET /gazettes/ responses (0 disables it).
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    # Seconds a response is kept when it may include the current month...
+    RESPONSE_CACHE_TTL: float = 60
+    # ...and when it only covers past months, which rarely change.
+    RESPONSE_CACHE_HISTORICAL_TTL: float = 86400
+
+    # --- API Export ---
+    # Rows fetched per round trip (and sent per chunk) by GET /gazettes/export.
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # --- API Response Compression ---
+    # Responses smaller than this many bytes are sent uncompressed.
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    # gzip level (1-9) and Brotli quality (0-11). Moderate values keep the
+    # CPU cost per request low while still shrinking URL-heavy JSON severalfold.
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
     # --- File System Paths ---
     # The path inside the app container where downloaded PDF files will be stored.
     DOWNLOAD_PATH: str = "/app/downloads"
 
+    # --- Workflow Configuration ---
+    # "selenium" drives the search form in a remote Chrome; "http" replays the
+    # form's AJAX request directly, without starting a browser.
+    SCRAPER_BACKEND: Literal["selenium", "http"] = "selenium"
+    # How the Selenium scraper reads the result links: one execute_script call
+    # ("script") or one page_source read parsed locally ("page_source").
+    SCRAPER_LINK_EXTRACTION: Literal["script", "page_source"] = "script"
+    # "performance" runs the Selenium scraper's Chrome headless, with a small
+    # window, no extensions and eager page loads, blocking images, stylesheets
+    # and fonts; "default" is a regular Chrome (watchable through noVNC).
+    SCRAPER_BROWSER_PROFILE: Literal["default", "performance"] = "default"
+    # "pipeline" streams each file through download -> upload -> store as soon
+    # as it is ready; "batch" finishes every stage before starting the next;
+    # "async" runs the three network stages on a single asyncio event loop.
+    WORKFLOW_MODE: Literal["batch", "pipeline", "async"] = "pipeline"
+    # Scraper (browser) sessions searching months in parallel during a backfill
+    # (--from/--to); Selenium Grid can host several sessions at once.
+    BACKFILL_SESSIONS: int = 3
+    # Warm browser sessions kept open between the runs of the scheduler
+    # (--interval), so runs skip Chrome startup. Each session is replaced after
+    # DRIVER_POOL_MAX_USES runs, and pinged every DRIVER_POOL_KEEPALIVE seconds
+    # while idle (below Selenium Grid's SE_NODE_SESSION_TIMEOUT).
+    DRIVER_POOL_SIZE: int = 1
+    DRIVER_POOL_MAX_USES: int = 20
+    DRIVER_POOL_KEEPALIVE: float = 120.0
+    # Threads of the download, upload and store stages. Unset, each stage gets
+    # RATE_LIMIT_MAX_CONCURRENCY threads, so the rate limiter's per-host limit
+    # alone bounds the requests in flight; set a value to cap a stage lower.
+    DOWNLOAD_WORKERS: int | None = None
+    UPLOAD_WORKERS: int | None = None
+    STORE_WORKERS: int | None = None
+    # Maximum number of files waiting between two pipeline stages.
+    PIPELINE_QUEUE_SIZE: int = 10
+    # Remove local files once uploaded, so the pipeline keeps disk usage low.
+    PIPELINE_DELETE_AFTER_UPLOAD: bool = False
+
+    # Connection pool of the scraper's shared download client.
+    DOWNLOAD_MAX_CONNECTIONS: int = 10
+    DOWNLOAD_KEEPALIVE_EXPIRY: float = 30.0
+    DOWNLOAD_HTTP2: bool = True
+
+    # Connection pool of the uploader's shared HTTP client. HTTP/2 is only
+    # used when the upload host supports it.
+    UPLOAD_MAX_CONNECTIONS: int = 10
+    UPLOAD_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    UPLOAD_KEEPALIVE_EXPIRY: float = 30.0
+    UPLOAD_HTTP2: bool = True
+
+    # Content-addressed cache of uploaded files (0 disables it), so re-runs
+    # only upload new PDFs. Cached URLs older than the max age (in seconds)
+    # are uploaded again, as the upload host expires files after a while.
+    UPLOAD_CACHE_MAX_ENTRIES: int = 10000
+    UPLOAD_CACHE_MAX_AGE: float | None = 30 * 24 * 3600
+
+    # Maximum number of gazettes sent per request to the bulk API endpoint.
+    API_BULK_CHUNK_SIZE: int = 100
+
+    # --- Outbound Rate Limiting ---
+    # Per-host limits of the download, upload and API clients. The request
+    # rate and the requests in flight grow while the servers keep up, and are
+    # halved on a 429/503, which is retried after Retry-After or an
+    # exponential backoff with jitter. The stages have enough threads for the
+    # requests in flight to grow up to RATE_LIMIT_MAX_CONCURRENCY per host,
+    # unless a lower *_WORKERS value is set above.
+    RATE_LIMIT_MAX_RATE: float = 5.0
+    RATE_LIMIT_BURST: int = 5
+    RATE_LIMIT_INITIAL_CONCURRENCY: int = 2
+    RATE_LIMIT_MAX_CONCURRENCY: int = 16
+    RATE_LIMIT_MAX_RETRIES: int = 5
+    RATE_LIMIT_BACKOFF_BASE: float = 1.0
+    RATE_LIMIT_BACKOFF_MAX: float = 60.0
+
+    # --- Circuit Breakers ---
+    # After this many consecutive failures, requests to the upload host or the
+    # API fail fast until a trial request succeeds, attempted every
+    # CIRCUIT_RESET_TIMEOUT seconds. The skipped work is parked in
+    # DOWNLOAD_PATH/parked.json and retried at the start of the next run.
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_TIMEOUT: float = 30.0
+
+    # --- Async Engine Configuration ---
+    # Maximum in-flight requests per target host, with optional per-host
+    # overrides given as JSON (e.g. '{"0x0.st": 5}'). The engine otherwise
+    # uses the connection pool, rate limiting and circuit breaker settings above.
+    ASYNC_DEFAULT_HOST_LIMIT: int = 10
+    ASYNC_HOST_LIMITS: dict[str, int] = {}
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,45 +1,135 @@
-from typing import Sequence
+from datetime import datetime
+from typing import Iterator, Sequence
 import logging
 
+from dateutil.relativedelta import relativedelta
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Dialect, Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import extract
+from sqlalchemy import Insert, Select, func, select, tuple_
 
 from conthabil.models import Gazette
 from conthabil.schemas import GazetteCreate
 
 
-def create_gazette(db: Session, gazette: GazetteCreate) -> Gazette:
+# The columns returned by the create functions.
+GAZETTE_COLUMNS = (Gazette.id, Gazette.url, Gazette.publication_date)
+
+# The columns returned by the listing functions. Selecting plain columns
+# instead of ORM entities skips identity map and object construction costs.
+GAZETTE_LISTING_COLUMNS = (*GAZETTE_COLUMNS, Gazette.created_at)
+
+
+def create_gazette(db: Session, gazette: GazetteCreate) -> tuple[Row, bool]:
     """
     Creates a new gazette entry in the database. This operation is idempotent:
     if a gazette with the same URL already exists, it returns the existing one
     without creating a duplicate.
 
+    On PostgreSQL (and SQLite) the entry is created with a single
+    `INSERT ... ON CONFLICT (url) DO NOTHING RETURNING` statement, so concurrent
+    requests for the same URL cannot fail on the unique index and a new entry
+    costs one round trip. The existing entry is only read when the insert
+    was skipped.
+
     Args:
         db: The database session.
         gazette: The Pydantic schema for creating a gazette.
 
     Returns:
-        The created or existing Gazette ORM object.
+        A row with the id, url and publication date of the created or
+        existing gazette, and whether it was created.
     """
 
-    db_gazette = db.query(Gazette).filter(Gazette.url == gazette.url).first()
+    stmt = upsert_gazettes_statement(db.get_bind().dialect, [gazette])
 
-    if db_gazette:
+    if stmt is None:
+        created = _insert_gazette_fallback(db, gazette)
+    else:
+        created = db.execute(stmt).one_or_none()
+    db.commit()
+
+    if created is None:
         logging.info(f"Gazette with URL {gazette.url} already exists. Skipping creation.")
-        return db_gazette
+        return db.execute(gazettes_by_urls_statement([gazette.url])).one(), False
+
+    logging.info(f"Successfully created new gazette entry for URL: {gazette.url}")
+
+    return created, True
+
+
+def _insert_gazette_fallback(db: Session, gazette: GazetteCreate) -> Row | None:
+    """
+    Inserts a gazette on dialects without ON CONFLICT support, relying on the
+    unique index on `url` to detect duplicates. The insert runs in a savepoint,
+    so a duplicate only rolls back its own row; committing is left to the caller.
+
+    Returns:
+        A row for the created gazette, or None if the URL already exists.
+    """
 
     db_gazette = Gazette(url=gazette.url, publication_date=gazette.publication_date)
-    db.add(db_gazette)
+
+    try:
+        with db.begin_nested():
+            db.add(db_gazette)
+    except IntegrityError:
+        return None
+
+    return db.execute(select(*GAZETTE_COLUMNS).where(Gazette.id == db_gazette.id)).one()
+
+
+def create_gazettes(
+    db: Session, gazettes: Sequence[GazetteCreate]
+) -> tuple[list[Row], Sequence[Row]]:
+    """
+    Creates many gazette entries in a single transaction. Like `create_gazette`,
+    this operation is idempotent: URLs that already exist are not duplicated,
+    and their existing entries are returned instead.
+
+    On PostgreSQL (and SQLite) all rows go in with one
+    `INSERT ... ON CONFLICT (url) DO NOTHING RETURNING` statement.
+
+    Args:
+        db: The database session.
+        gazettes: The Pydantic schemas for the gazettes to create.
+
+    Returns:
+        Rows with the id, url and publication date of the created or already
+        existing gazette of each input, in the order of `gazettes`, and the
+        rows of the gazettes actually created.
+    """
+
+    if not gazettes:
+        return [], []
+
+    stmt = upsert_gazettes_statement(db.get_bind().dialect, gazettes)
+
+    if stmt is None:
+        # Dialects without ON CONFLICT support insert one row at a time, each
+        # in its own savepoint of the same transaction.
+        created = [
+            row
+            for gazette in unique_gazettes(gazettes)
+            if (row := _insert_gazette_fallback(db, gazette)) is not None
+        ]
+    else:
+        created = db.execute(stmt).all()
     db.commit()
-    db.refresh(db_gazette)
-    logging.info(f"Successfully created new gazette entry for URL: {gazette.url}")
 
-    return db_gazette
+    missing_urls = find_missing_urls(gazettes, created)
+    existing = db.execute(gazettes_by_urls_statement(missing_urls)).all() if missing_urls else []
+
+    log_bulk_result(gazettes, created, existing)
 
+    return in_request_order(gazettes, [*created, *existing]), created
 
-def get_gazettes(db: Session, skip: int = 0, limit: int = 100) -> Sequence[Gazette]:
+
+def get_gazettes(db: Session, skip: int = 0, limit: int = 100) -> Sequence[Row]:
     """
-    Retrieves a list of gazette entries from the database.
+    Retrieves a list of gazette entries from the database, ordered by
+    publication date and id.
 
     Args:
         db: The database session.
@@ -47,28 +137,274 @@ def get_gazettes(db: Session, skip: int = 0, limit: int = 100) -> Sequence[Gazet
         limit: The maximum number of records to return (for pagination).
 
     Returns:
-        A sequence of Gazette ORM objects.
+        Rows with the id, url, publication date and creation time of the gazettes.
+    """
+
+    return db.execute(gazettes_page_statement(skip=skip, limit=limit)).all()
+
+
+def get_gazettes_after(
+    db: Session, after: tuple[datetime, int], limit: int = 100
+) -> Sequence[Row]:
+    """
+    Retrieves the page of gazette entries following a given sort key (keyset
+    pagination). The `(publication_date, id)` range condition is served by the
+    matching index, so every page costs the same regardless of its depth.
+
+    Args:
+        db: The database session.
+        after: The (publication_date, id) of the last entry of the previous page.
+        limit: The maximum number of records to return.
+
+    Returns:
+        Rows with the id, url, publication date and creation time of the gazettes.
     """
 
-    return db.query(Gazette).offset(skip).limit(limit).all()
+    return db.execute(gazettes_after_statement(after=after, limit=limit)).all()
 
 
-def get_gazettes_by_month_year(db: Session, month: int, year: int) -> Sequence[Gazette]:
+def get_gazettes_by_month_year(db: Session, month: int, year: int) -> Sequence[Row]:
     """
     Retrieves gazette entries filtered by publication month and year.
 
+    The filter is expressed as the half-open range
+    `[first day of the month, first day of the next month)`, so it can be
+    served by the index on `publication_date`.
+
     Args:
         db: The database session.
         month: The month to filter by (1-12).
         year: The year to filter by.
 
     Returns:
-        A sequence of Gazette ORM objects matching the criteria.
+        Rows with the id, url, publication date and creation time of the
+        matching gazettes.
+    """
+
+    start, end = month_range(month, year)
+
+    return get_gazettes_by_date_range(db, start=start, end=end)
+
+
+def get_gazettes_by_date_range(
+    db: Session,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    skip: int = 0,
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
+) -> Sequence[Row]:
+    """
+    Retrieves gazette entries published within the half-open range
+    `[start, end)`, ordered by publication date and id, optionally paginated
+    by offset or by keyset like `get_gazettes` and `get_gazettes_after`.
+
+    Args:
+        db: The database session.
+        start: The inclusive lower bound, or None for no lower bound.
+        end: The exclusive upper bound, or None for no upper bound.
+        skip: The number of records to skip.
+        limit: The maximum number of records to return, or None for all.
+        after: The (publication_date, id) of the last entry of the previous page.
+
+    Returns:
+        Rows with the id, url, publication date and creation time of the
+        matching gazettes.
+    """
+
+    stmt = gazettes_in_range_statement(start=start, end=end, skip=skip, limit=limit, after=after)
+
+    return db.execute(stmt).all()
+
+
+def get_gazettes_stats(
+    db: Session, start: datetime | None = None, end: datetime | None = None
+) -> Row:
     """
+    Retrieves, with a single aggregate query, the number of gazettes published
+    within `[start, end)`, their highest id and their latest creation time.
+    These change whenever an entry is added to the range, so they validate
+    cached listings without running the listing query.
+
+    Args:
+        db: The database session.
+        start: The inclusive lower bound, or None for no lower bound.
+        end: The exclusive upper bound, or None for no upper bound.
+
+    Returns:
+        A row with the `count`, `max_id` and `last_created_at` of the range.
+    """
+
+    return db.execute(gazettes_stats_statement(start=start, end=end)).one()
+
+
+def iter_gazettes(db: Session, batch_size: int = 1000) -> Iterator[Row]:
+    """
+    Streams every gazette entry, ordered by publication date and id, without
+    loading the whole table in memory: rows are fetched from a server-side
+    cursor `batch_size` at a time.
+
+    Args:
+        db: The database session.
+        batch_size: The number of rows fetched per round trip.
+
+    Returns:
+        An iterator of rows with the id, url and publication date of each gazette.
+    """
+
+    stmt = gazettes_export_statement().execution_options(yield_per=batch_size)
+
+    yield from db.execute(stmt)
+
+
+# -- Statement Builders and Helpers --
+# Shared by the functions above and their async counterparts in `async_crud`.
+
+
+def upsert_gazettes_statement(
+    dialect: Dialect, gazettes: Sequence[GazetteCreate]
+) -> Insert | None:
+    """
+    Builds an `INSERT ... ON CONFLICT (url) DO NOTHING RETURNING` statement for
+    the given gazettes, or returns None if the dialect has no ON CONFLICT support.
+    Duplicate URLs within `gazettes` are inserted once.
+    """
+
+    if dialect.name == "postgresql":
+        insert = postgresql.insert
+    elif dialect.name == "sqlite":
+        insert = sqlite.insert
+    else:
+        return None
+
+    values = [{"url": g.url, "publication_date": g.publication_date} for g in unique_gazettes(gazettes)]
+
+    return (
+        insert(Gazette)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=[Gazette.url])
+        .returning(*GAZETTE_COLUMNS)
+    )
+
+
+def gazettes_by_urls_statement(urls: Sequence[str]) -> Select:
+    """Builds the query for the id, url and publication date of the given URLs."""
+
+    return select(*GAZETTE_COLUMNS).where(Gazette.url.in_(urls))
+
+
+def gazettes_page_statement(skip: int, limit: int) -> Select:
+    """Builds the offset-paginated listing query."""
 
     return (
-        db.query(Gazette)
-        .filter(extract("month", Gazette.publication_date) == month)
-        .filter(extract("year", Gazette.publication_date) == year)
-        .all()
+        select(*GAZETTE_LISTING_COLUMNS)
+        .order_by(Gazette.publication_date, Gazette.id)
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+def gazettes_after_statement(after: tuple[datetime, int], limit: int) -> Select:
+    """Builds the keyset-paginated listing query."""
+
+    return (
+        select(*GAZETTE_LISTING_COLUMNS)
+        .where(tuple_(Gazette.publication_date, Gazette.id) > tuple_(*after))
+        .order_by(Gazette.publication_date, Gazette.id)
+        .limit(limit)
+    )
+
+
+def gazettes_in_range_statement(
+    start: datetime | None,
+    end: datetime | None,
+    skip: int = 0,
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
+) -> Select:
+    """Builds the (optionally paginated) query for the gazettes published within `[start, end)`."""
+
+    stmt = _published_within(select(*GAZETTE_LISTING_COLUMNS), start, end)
+
+    if after is not None:
+        stmt = stmt.where(tuple_(Gazette.publication_date, Gazette.id) > tuple_(*after))
+
+    stmt = stmt.order_by(Gazette.publication_date, Gazette.id)
+
+    if skip:
+        stmt = stmt.offset(skip)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return stmt
+
+
+def gazettes_stats_statement(start: datetime | None, end: datetime | None) -> Select:
+    """Builds the aggregate query validating the listings of `[start, end)`."""
+
+    stmt = select(
+        func.count().label("count"),
+        func.max(Gazette.id).label("max_id"),
+        func.max(Gazette.created_at).label("last_created_at"),
+    )
+
+    return _published_within(stmt, start, end)
+
+
+def _published_within(stmt: Select, start: datetime | None, end: datetime | None) -> Select:
+    """Restricts a query to the gazettes published within `[start, end)`."""
+
+    if start is not None:
+        stmt = stmt.where(Gazette.publication_date >= start)
+    if end is not None:
+        stmt = stmt.where(Gazette.publication_date < end)
+
+    return stmt
+
+
+def gazettes_export_statement() -> Select:
+    """Builds the query streaming the whole archive."""
+
+    return select(*GAZETTE_COLUMNS).order_by(Gazette.publication_date, Gazette.id)
+
+
+def month_range(month: int, year: int) -> tuple[datetime, datetime]:
+    """Returns the half-open `[start, end)` range covering the given month."""
+
+    start = datetime(year, month, 1)
+    return start, start + relativedelta(months=1)
+
+
+def unique_gazettes(gazettes: Sequence[GazetteCreate]) -> list[GazetteCreate]:
+    """Returns `gazettes` without repeated URLs, keeping the first of each."""
+
+    unique: dict[str, GazetteCreate] = {}
+    for gazette in gazettes:
+        unique.setdefault(gazette.url, gazette)
+
+    return list(unique.values())
+
+
+def in_request_order(gazettes: Sequence[GazetteCreate], rows: Sequence[Row]) -> list[Row]:
+    """Returns the row of each gazette's URL, in the order of `gazettes`."""
+
+    by_url = {row.url: row for row in rows}
+    return [by_url[g.url] for g in gazettes]
+
+
+def find_missing_urls(gazettes: Sequence[GazetteCreate], created: Sequence[Row]) -> list[str]:
+    """Returns the URLs of `gazettes` that were not part of the created rows."""
+
+    created_urls = {row.url for row in created}
+    return list(dict.fromkeys(g.url for g in gazettes if g.url not in created_urls))
+
+
+def log_bulk_result(
+    gazettes: Sequence[GazetteCreate], created: Sequence[Row], existing: Sequence[Row]
+) -> None:
+    """Logs the outcome of a bulk insert."""
+
+    logging.info(
+        f"Bulk insert of {len(gazettes)} gazettes: {len(created)} created, "
+        f"{len(existing)} already existed."
     )
@@ -1,23 +1,109 @@
-import os
-from sqlalchemy import create_engine
+import threading
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
+
+from .config import Settings, get_settings
+
+
+def _engine_options(settings: Settings) -> dict:
+    """
+    Builds the connection pool options for the SQLAlchemy engine from settings.
+    """
 
-from .config import get_settings
+    if settings.DB_PGBOUNCER_MODE:
+        # PgBouncer already pools server connections, and in transaction
+        # pooling mode prepared statements cannot be reused across transactions.
+        options: dict = {"poolclass": NullPool}
+        if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg":
+            options["connect_args"] = {"prepare_threshold": None}
+        return options
+
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
 
 
 # Get database URL from environment variable
 DATABASE_URL = get_settings().DATABASE_URL
 
 # Create the SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **_engine_options(get_settings()))
 
 # Create a SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session factory, used by the API when DB_ASYNC is enabled.
+# With the psycopg driver the same URL serves both the sync and async engines.
+async_engine = (
+    create_async_engine(DATABASE_URL, **_engine_options(get_settings()))
+    if get_settings().DB_ASYNC
+    else None
+)
+AsyncSessionLocal = (
+    async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
+
 # Base class for declarative models
 Base = declarative_base()
 
 
+# Cumulative pool event counters, exposed for monitoring.
+_pool_counters = {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0}
+_pool_counters_lock = threading.Lock()
+
+
+def _count_pool_event(name: str):
+    """Returns a pool event listener incrementing the given counter."""
+
+    def listener(*args):
+        with _pool_counters_lock:
+            _pool_counters[name] += 1
+
+    return listener
+
+
+# The API only uses one of the two engines, so their counters never mix.
+_engines = [engine] if async_engine is None else [engine, async_engine.sync_engine]
+
+for _engine in _engines:
+    event.listen(_engine, "connect", _count_pool_event("connects"))
+    event.listen(_engine, "checkout", _count_pool_event("checkouts"))
+    event.listen(_engine, "checkin", _count_pool_event("checkins"))
+    event.listen(_engine, "invalidate", _count_pool_event("invalidations"))
+
+
+def get_pool_status() -> dict:
+    """
+    Returns the current state of the connection pool and its cumulative
+    event counters. Pool size figures are None for pools that do not keep
+    connections (e.g. NullPool in PgBouncer mode).
+    """
+
+    pool = async_engine.pool if async_engine is not None else engine.pool
+
+    with _pool_counters_lock:
+        counters = dict(_pool_counters)
+
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size() if hasattr(pool, "size") else None,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+        "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+        **counters,
+    }
+
+
 def get_db():
     """
     Dependency to get a database session for FastAPI.
@@ -29,3 +115,16 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency to get an async database session for FastAPI.
+    Ensures the session is closed after the request.
+    """
+
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access is disabled. Set DB_ASYNC to enable it.")
+
+    async with AsyncSessionLocal() as db:
+        yield db
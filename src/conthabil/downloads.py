@@ -0,0 +1,241 @@
+"""
+Helpers for resumable downloads, shared by the Downloader and the AsyncEngine,
+which only differ in how they perform the request.
+
+A download is written to `<save_path>.part` and only renamed to `save_path`
+once its size matches the one announced by the server, so an interrupted
+download never leaves a truncated file that looks complete. The next attempt
+resumes from the end of the partial file with an HTTP Range request, guarded
+by an If-Range carrying the validator (strong ETag or Last-Modified) of the
+response the partial file came from, kept in `<save_path>.part.validator`.
+Servers whose file changed since, or that ignore the range, answer 200 with
+the whole file, which then overwrites the partial one. A partial file without
+a validator cannot be safely resumed, so it is downloaded again.
+"""
+
+import logging
+import os
+from typing import BinaryIO
+
+import httpx
+
+from conthabil.manifest import DownloadManifest
+
+
+PART_SUFFIX = ".part"
+VALIDATOR_SUFFIX = ".validator"
+
+# How many times a download whose partial file the server rejected starts
+# over from scratch, before giving up on it for this run.
+MAX_RESTARTS = 1
+
+
+class IncompleteDownloadError(IOError):
+    """Raised when a download ends before the size announced by the server."""
+
+
+def part_path(save_path: str) -> str:
+    """Returns the path of the partial file of a download."""
+
+    return save_path + PART_SUFFIX
+
+
+def validator_path(save_path: str) -> str:
+    """Returns the path of the file keeping the If-Range validator of a partial download."""
+
+    return part_path(save_path) + VALIDATOR_SUFFIX
+
+
+def range_validator(response: httpx.Response) -> str | None:
+    """
+    Returns the validator a Range request resuming this response's body can
+    send as If-Range: its strong ETag, or else its Last-Modified date. Weak
+    ETags cannot be used with If-Range.
+    """
+
+    etag = response.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+
+    return response.headers.get("last-modified")
+
+
+def _read_validator(save_path: str) -> str | None:
+    """Reads the If-Range validator of a partial download, if one was kept."""
+
+    try:
+        with open(validator_path(save_path), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _remove_validator(save_path: str) -> None:
+    """Removes the If-Range validator of a partial download, if any."""
+
+    _remove_if_exists(validator_path(save_path))
+
+
+def _remove_if_exists(path: str) -> None:
+    """Removes a file, if it exists."""
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def resume_request_headers(save_path: str) -> tuple[int, dict[str, str]]:
+    """
+    Builds the request headers resuming the partial download of `save_path`.
+
+    Returns:
+        The size of the partial file already on disk, and the headers to send.
+        Downloads ask for the identity encoding, so the bytes written, the
+        Range offsets and Content-Length all count the same bytes. A partial
+        file without a validator is not resumed, and the offset is then 0.
+    """
+
+    try:
+        offset = os.path.getsize(part_path(save_path))
+    except OSError:
+        offset = 0
+
+    validator = _read_validator(save_path) if offset else None
+    if not validator:
+        offset = 0
+
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+
+    return offset, headers
+
+
+def resume_offset(response: httpx.Response, offset: int) -> int:
+    """
+    Returns the position in the partial file where the response body starts:
+    `offset` if the server honoured the Range request, 0 if it sent the whole file.
+    """
+
+    if response.status_code != 206:
+        return 0
+
+    content_range = response.headers.get("content-range", "")
+    unit, _, spec = content_range.partition(" ")
+    start = spec.partition("-")[0]
+
+    if unit != "bytes" or not start.isdigit() or int(start) != offset:
+        raise IncompleteDownloadError(f"Unexpected Content-Range '{content_range}' resuming at byte {offset}")
+
+    return offset
+
+
+def expected_size(response: httpx.Response, start: int) -> int | None:
+    """
+    Returns the full size of the file being downloaded, or None if the server
+    did not announce it.
+    """
+
+    total = response.headers.get("content-range", "").rpartition("/")[2]
+    if total.isdigit():
+        return int(total)
+
+    length = response.headers.get("content-length")
+    if length is not None and length.isdigit():
+        return start + int(length)
+
+    return None
+
+
+def finish_download(save_path: str, size: int | None) -> None:
+    """
+    Verifies the partial file against the announced size and atomically moves
+    it to `save_path`. An incomplete file is kept, so the next attempt resumes it.
+    """
+
+    path = part_path(save_path)
+    written = os.path.getsize(path)
+
+    if size is not None and written != size:
+        raise IncompleteDownloadError(f"Downloaded {written} of {size} bytes for {save_path}")
+
+    os.replace(path, save_path)
+    _remove_validator(save_path)
+
+
+def download_request(
+    link: str, download_path: str, manifest: DownloadManifest
+) -> tuple[str, int, dict[str, str]]:
+    """
+    Prepares the download of a link into `download_path`.
+
+    Returns:
+        The path the file is saved to, the size of its partial file already
+        on disk, and the request headers: a Range resuming the partial file,
+        or else the manifest's conditional headers.
+    """
+
+    save_path = os.path.join(download_path, os.path.basename(link))
+
+    offset, headers = resume_request_headers(save_path)
+    if not offset:
+        headers.update(manifest.conditional_headers(link))
+
+    return save_path, offset, headers
+
+
+def open_part_file(save_path: str, response: httpx.Response, offset: int) -> BinaryIO:
+    """
+    Opens the partial file receiving the body of a successful response:
+    appending to it if the response resumes the download, truncated otherwise.
+    A new partial file keeps the response's validator for a later If-Range.
+    """
+
+    start = resume_offset(response, offset)
+    if start:
+        return open(part_path(save_path), "ab")
+
+    validator = range_validator(response)
+    if validator:
+        with open(validator_path(save_path), "w", encoding="utf-8") as f:
+            f.write(validator)
+    else:
+        _remove_validator(save_path)
+
+    return open(part_path(save_path), "wb")
+
+
+def complete_download(
+    link: str, save_path: str, offset: int, response: httpx.Response, manifest: DownloadManifest
+) -> bool:
+    """
+    Completes a download once the response body was written to the partial
+    file: verifies and moves it to `save_path`, and records it in the manifest.
+    A 304 response keeps the file already downloaded.
+
+    Returns:
+        False if the partial file does not match the file on the server, in
+        which case it was removed and the download must start over.
+
+    Raises:
+        httpx.HTTPStatusError: If the response is an error.
+        IncompleteDownloadError: If the file is shorter than announced.
+    """
+
+    if response.status_code == 304:
+        logging.info(f"{os.path.basename(save_path)} is unchanged on the server. Skipping download.")
+        return True
+
+    if response.status_code == 416:
+        logging.warning(f"Cannot resume {link}; restarting the download.")
+        _remove_if_exists(part_path(save_path))
+        _remove_validator(save_path)
+        return False
+
+    response.raise_for_status()
+    finish_download(save_path, expected_size(response, resume_offset(response, offset)))
+    manifest.record(link, save_path, response)
+
+    return True
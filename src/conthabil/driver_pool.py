@@ -0,0 +1,293 @@
+"""
+Pool of warm remote WebDriver sessions.
+
+Opening a `webdriver.Remote` session starts a new Chrome in the Selenium
+container, which takes several seconds. When the workflow runs repeatedly
+(e.g. with `main_runner --interval`), a DriverPool keeps the sessions open
+between runs: each scraper borrows a session and gives it back once done.
+Returned sessions are reset (cookies, storage and extra windows cleared), so
+every use starts from a clean state; sessions that fail their health check or
+reached `max_uses` are replaced by new ones.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Literal
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+BrowserProfile = Literal["default", "performance"]
+
+# Requests the "performance" profile blocks: images, stylesheets and fonts,
+# none of which the search form or the results table need. Scripts are kept,
+# since the form is submitted by the site's AJAX framework.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.css",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+
+
+def browser_options(profile: BrowserProfile = "default") -> Options:
+    """
+    Builds the Chrome options of a browser profile: "default" is a regular
+    Chrome, "performance" a headless one with a small window, no extensions,
+    no images, and pages considered loaded once their DOM is ready.
+    """
+
+    options = Options()
+    if profile == "performance":
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1024,768")
+        options.add_argument("--disable-extensions")
+        # Also keeps images out when DevTools commands are unavailable.
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        # Return from driver.get() at DOMContentLoaded, without waiting for
+        # the remaining subresources; the scraper waits for the elements it uses.
+        options.page_load_strategy = "eager"
+
+    return options
+
+
+def block_assets(driver: WebDriver) -> None:
+    """
+    Makes the browser refuse the requests of BLOCKED_URL_PATTERNS, through
+    the Chrome DevTools Protocol.
+    """
+
+    for cmd, params in (
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS}),
+    ):
+        driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})
+
+
+def create_remote_driver(selenium_url: str, profile: BrowserProfile = "default") -> WebDriver:
+    """
+    Opens a session on the remote Selenium Chrome WebDriver.
+
+    Args:
+        selenium_url: The URL of the remote Selenium WebDriver.
+        profile: The browser profile of the session (see `browser_options`).
+
+    Returns:
+        An instance of the remote Selenium WebDriver.
+    """
+
+    logging.debug(f"Connecting to remote WebDriver at {selenium_url} ({profile} profile)")
+    chrome_options = browser_options(profile)
+
+    try:
+        # A Chromium connection knows the endpoint of DevTools commands, which
+        # a plain remote connection does not.
+        command_executor = ChromiumRemoteConnection(
+            remote_server_addr=selenium_url, vendor_prefix="goog", browser_name="chrome"
+        )
+        driver = webdriver.Remote(command_executor=command_executor, options=chrome_options)
+        logging.debug("Successfully connected to remote WebDriver.")
+
+    except Exception as e:
+        logging.error(f"Failed to connect to remote WebDriver: {e}")
+        raise
+
+    if profile == "performance":
+        try:
+            block_assets(driver)
+        except WebDriverException as e:
+            logging.warning(f"Could not block images, stylesheets and fonts: {e}")
+
+    return driver
+
+
+def is_healthy(driver: WebDriver) -> bool:
+    """Tells whether a session still answers commands."""
+
+    try:
+        driver.execute_script("return 1;")
+        return True
+    except WebDriverException:
+        return False
+
+
+def reset_driver(driver: WebDriver) -> None:
+    """
+    Clears what a use left in a session: extra windows, cookies and the web
+    storage of the current site, then loads a blank page.
+    """
+
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    driver.delete_all_cookies()
+    # Storage is per origin: clear the one of the page left open before leaving it.
+    driver.execute_script(
+        "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+    )
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """
+    Thread-safe pool of remote WebDriver sessions, reused across scrapes.
+    """
+
+    def __init__(
+        self,
+        selenium_url: str,
+        size: int = 1,
+        max_uses: int = 20,
+        browser_profile: BrowserProfile = "default",
+    ):
+        """
+        Initializes the DriverPool. No session is opened until `warm` or
+        `acquire` is called.
+
+        Args:
+            selenium_url: The URL of the remote Selenium WebDriver.
+            size: Maximum number of idle sessions kept open. More sessions can
+                be borrowed at once; the extra ones are closed when returned.
+            max_uses: Number of uses after which a session is replaced by a
+                fresh one, bounding the memory a long-lived Chrome accumulates.
+            browser_profile: The browser profile of the sessions.
+        """
+
+        self.selenium_url = selenium_url
+        self.size = size
+        self.max_uses = max_uses
+        self.browser_profile = browser_profile
+
+        self._idle: deque[WebDriver] = deque()
+        self._uses: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+
+    def warm(self) -> None:
+        """Opens sessions until `size` of them are idle."""
+
+        while True:
+            with self._lock:
+                if len(self._idle) >= self.size:
+                    return
+
+            driver = self._open()
+            with self._lock:
+                self._idle.append(driver)
+
+
+    def acquire(self) -> WebDriver:
+        """
+        Borrows a healthy session, opening a new one if none is idle.
+        """
+
+        while True:
+            with self._lock:
+                driver = self._idle.popleft() if self._idle else None
+
+            if driver is None:
+                driver = self._open()
+            elif not is_healthy(driver):
+                logging.warning("Discarding an unresponsive WebDriver session.")
+                self._quit(driver)
+                continue
+
+            with self._lock:
+                self._uses[driver.session_id] += 1
+            return driver
+
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Gives a borrowed session back: it is reset and kept for the next use,
+        or closed if it is worn out, broken or not needed.
+        """
+
+        with self._lock:
+            uses = self._uses.get(driver.session_id, 0)
+            keep = len(self._idle) < self.size
+
+        if uses >= self.max_uses:
+            logging.info(f"Recycling a WebDriver session after {uses} uses.")
+            self._quit(driver)
+            return
+
+        if not keep:
+            self._quit(driver)
+            return
+
+        try:
+            reset_driver(driver)
+        except WebDriverException as e:
+            logging.warning(f"Could not reset a WebDriver session, closing it: {e}")
+            self._quit(driver)
+            return
+
+        with self._lock:
+            self._idle.append(driver)
+
+
+    def keep_alive(self) -> None:
+        """
+        Sends a command to every idle session, so that Selenium Grid does not
+        end them for inactivity, replaces those that stopped answering and
+        opens the missing ones. Called between scheduled runs, it keeps
+        browser startup out of the runs themselves.
+        """
+
+        with self._lock:
+            drivers = list(self._idle)
+            self._idle.clear()
+
+        healthy = []
+        for driver in drivers:
+            if is_healthy(driver):
+                healthy.append(driver)
+            else:
+                logging.warning("Discarding an unresponsive WebDriver session.")
+                self._quit(driver)
+
+        with self._lock:
+            self._idle.extend(healthy)
+
+        self.warm()
+
+
+    def close(self) -> None:
+        """Closes every idle session."""
+
+        with self._lock:
+            drivers = list(self._idle)
+            self._idle.clear()
+
+        for driver in drivers:
+            self._quit(driver)
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+
+    def _open(self) -> WebDriver:
+        driver = create_remote_driver(self.selenium_url, self.browser_profile)
+        with self._lock:
+            self._uses[driver.session_id] = 0
+        return driver
+
+
+    def _quit(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._uses.pop(driver.session_id, None)
+
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logging.debug(f"Error closing WebDriver session: {e}")
@@ -0,0 +1,149 @@
+"""
+Selenium-free scraper for the municipal gazette site.
+
+The search form of the site (`form[data-request='onTest']`) is an October CMS
+AJAX form: submitting it posts the form fields to the page URL with an
+`X-OCTOBER-REQUEST-HANDLER` header, and the server answers with a JSON object
+holding the rendered HTML partials. HttpScraper replays that request directly
+with httpx and parses the results table with the standard library's HTML
+parser, so no browser has to be started.
+"""
+
+import json
+import logging
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+import httpx
+
+from conthabil.results_table import parse_pdf_links
+from conthabil.scraper import BaseScraper, previous_month
+
+
+SEARCH_HANDLER = "onTest"
+
+
+class _SearchFormParser(HTMLParser):
+    """
+    Collects what is needed to replay the search form's AJAX request: its
+    hidden fields, the partials it updates and the page's CSRF token.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.fields: dict[str, str] = {}
+        self.partials: list[str] = []
+        self.request_url: str | None = None
+        self.csrf_token: str | None = None
+        self.found = False
+        self._in_form = False
+
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+
+        if tag == "meta" and attributes.get("name") == "csrf-token":
+            self.csrf_token = attributes.get("content")
+
+        elif tag == "form" and attributes.get("data-request") == SEARCH_HANDLER:
+            self.found = self._in_form = True
+            self.request_url = attributes.get("data-request-url")
+            # e.g. data-request-update="'results': '#results', 'pager': '#pager'"
+            update = attributes.get("data-request-update") or ""
+            self.partials = [
+                name.strip().strip("'\"")
+                for name, _, _ in (item.partition(":") for item in update.split(","))
+                if name.strip()
+            ]
+
+        elif tag == "input" and self._in_form and attributes.get("type") == "hidden":
+            if name := attributes.get("name"):
+                self.fields[name] = attributes.get("value") or ""
+
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "form":
+            self._in_form = False
+
+
+def ajax_response_html(response: httpx.Response) -> str:
+    """
+    Returns the HTML rendered by an October CMS AJAX handler: the partials of
+    its JSON response joined together, or the body itself if it is not JSON.
+    """
+
+    try:
+        payload = response.json()
+    except json.JSONDecodeError:
+        return response.text
+
+    if not isinstance(payload, dict):
+        return ""
+
+    return "\n".join(value for value in payload.values() if isinstance(value, str))
+
+
+class HttpScraper(BaseScraper):
+    """
+    Finds the PDF links by calling the site's search AJAX handler over HTTP,
+    without a browser. Downloads work as in `Scraper`.
+    """
+
+    def find_pdf_links(
+        self, target_url: str, month: str | None = None, year: str | None = None
+    ) -> list[str]:
+        """
+        Searches the target URL for a month (by default, the previous one) and
+        collects the PDF links, without downloading them.
+
+        Args:
+            target_url: The URL to scrape.
+            month: The zero-padded month to search for (e.g. "07").
+            year: The year to search for (e.g. "2025").
+
+        Returns:
+            A list of URLs to the PDF files.
+        """
+
+        if not (month and year):
+            month, year = previous_month()
+        logging.info(f"Performing search for month/year: {month}/{year}")
+
+        started = time.perf_counter()
+
+        # Loading the page sets the session cookie and gives the form's hidden
+        # fields and CSRF token, which the AJAX handler may require.
+        page = self.rate_limiter.send(target_url, lambda: self.client.get(target_url))
+        page.raise_for_status()
+
+        form = _SearchFormParser()
+        form.feed(page.text)
+        form.close()
+        if not form.found:
+            raise RuntimeError(f"Search form not found at {target_url}")
+
+        headers = {
+            "X-OCTOBER-REQUEST-HANDLER": SEARCH_HANDLER,
+            "X-Requested-With": "XMLHttpRequest",
+            "Accept": "application/json, text/html",
+        }
+        if form.partials:
+            headers["X-OCTOBER-REQUEST-PARTIALS"] = "&".join(form.partials)
+        if form.csrf_token:
+            headers["X-CSRF-TOKEN"] = form.csrf_token
+
+        request_url = urljoin(str(page.url), form.request_url or "")
+        data = {**form.fields, "mes": month, "ano": year}
+
+        response = self.rate_limiter.send(
+            request_url, lambda: self.client.post(request_url, data=data, headers=headers)
+        )
+        response.raise_for_status()
+
+        pdf_links = parse_pdf_links(ajax_response_html(response), str(page.url))
+
+        logging.info(
+            f"Found {len(pdf_links)} PDF links in {time.perf_counter() - started:.2f}s."
+        )
+        return pdf_links
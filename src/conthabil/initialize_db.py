@@ -1,5 +1,8 @@
 import logging
 
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
+
 from conthabil.database import engine
 from conthabil.config import setup_logging
 from conthabil import models
@@ -19,6 +22,38 @@ def initialize_database():
 
     logging.info("Database tables created (if they didn't exist).")
 
+    add_missing_columns()
+
+    # create_all skips tables that already exist, so indexes added to the
+    # models later are created here for existing databases.
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    logging.info("Database indexes created (if they didn't exist).")
+
+
+def add_missing_columns():
+    """
+    Adds columns declared in the models but missing from existing tables,
+    since create_all skips tables that already exist. Existing rows get the
+    column's server default.
+    """
+
+    inspector = inspect(engine)
+
+    with engine.begin() as conn:
+        for table in models.Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+
+                column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}"))
+                logging.info(f"Added missing column {table.name}.{column.name}.")
+
 
 if __name__ == "__main__":
 
@@ -1,17 +1,40 @@
+import argparse
+import asyncio
 import logging
 import os
-import re
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+import httpx
+from dateutil.relativedelta import relativedelta
 
 from conthabil.api_client import ApiClient
-from conthabil.config import get_settings, setup_logging
-from conthabil.scraper import Scraper
+from conthabil.async_engine import AsyncEngine
+from conthabil.circuit_breaker import CircuitBreaker
+from conthabil.config import Settings, get_settings, setup_logging
+from conthabil.driver_pool import DriverPool
+from conthabil.http_scraper import HttpScraper
+from conthabil.parked import PARKED_FILENAME, ParkedWork
+from conthabil.pipeline import Pipeline, parse_publication_date
+from conthabil.ratelimit import RateLimiter
+from conthabil.scraper import BaseScraper, Downloader, Scraper, month_span
+from conthabil.upload_cache import UPLOAD_CACHE_FILENAME, UploadCache
 from conthabil.uploader import Uploader
 
 
-def run_full_workflow():
+def run_full_workflow(
+    backfill_months: list[tuple[str, str]] | None = None,
+    driver_pool: DriverPool | None = None,
+):
     """
     Orchestrates the full workflow: scraping, uploading, and storing gazette data.
+
+    Args:
+        backfill_months: The (month, year) pairs to scrape instead of the
+            previous month, searched in parallel browser sessions.
+        driver_pool: Pool of warm WebDriver sessions the scraper borrows its
+            session from, kept open across the runs of the scheduler.
     """
 
     setup_logging()
@@ -22,13 +45,387 @@ def run_full_workflow():
 
     os.makedirs(settings.DOWNLOAD_PATH, exist_ok=True)
 
+    # Shared by every client of the run, keyed by target host.
+    rate_limiter = _create_rate_limiter(settings)
+
+    try:
+        retry_parked_work(settings, rate_limiter)
+    except Exception as e:
+        logging.critical(f"A critical error occurred retrying the parked work: {e}")
+
+    if backfill_months:
+        run_backfill_workflow(settings, rate_limiter, backfill_months)
+    elif settings.WORKFLOW_MODE == "pipeline":
+        run_pipelined_workflow(settings, rate_limiter, driver_pool)
+    elif settings.WORKFLOW_MODE == "async":
+        run_async_workflow(settings, rate_limiter, driver_pool)
+    else:
+        run_batch_workflow(settings, rate_limiter, driver_pool)
+
+    logging.info("Full workflow completed.")
+
+
+def _create_rate_limiter(settings: Settings) -> RateLimiter:
+    """Builds the adaptive per-host rate limiter configured from the settings."""
+
+    return RateLimiter(
+        max_rate=settings.RATE_LIMIT_MAX_RATE,
+        burst=settings.RATE_LIMIT_BURST,
+        initial_concurrency=settings.RATE_LIMIT_INITIAL_CONCURRENCY,
+        max_concurrency=settings.RATE_LIMIT_MAX_CONCURRENCY,
+        max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+        backoff_base=settings.RATE_LIMIT_BACKOFF_BASE,
+        backoff_max=settings.RATE_LIMIT_BACKOFF_MAX,
+    )
+
+
+def _create_scraper(
+    settings: Settings, rate_limiter: RateLimiter, driver_pool: DriverPool | None = None
+) -> BaseScraper:
+    """
+    Builds the scraper of the configured backend, with its download client
+    configured from the settings. The Selenium scraper borrows its session
+    from `driver_pool` when given.
+    """
+
+    options = _download_options(settings, rate_limiter)
+
+    if settings.SCRAPER_BACKEND == "http":
+        return HttpScraper(**options)
+
+    return Scraper(
+        selenium_url=settings.SELENIUM_URL,
+        link_extraction=settings.SCRAPER_LINK_EXTRACTION,
+        driver_pool=driver_pool,
+        browser_profile=settings.SCRAPER_BROWSER_PROFILE,
+        **options,
+    )
+
+
+def _create_downloader(settings: Settings, rate_limiter: RateLimiter) -> Downloader:
+    """Builds a Downloader that only downloads files, without a browser session."""
+
+    return Downloader(**_download_options(settings, rate_limiter))
+
+
+def _workers(settings: Settings, workers: int | None) -> int:
+    """
+    Returns the thread count of a stage: the configured one, or by default
+    enough threads for the rate limiter to grow to its maximum concurrency.
+    """
+
+    return workers or settings.RATE_LIMIT_MAX_CONCURRENCY
+
+
+def _download_options(settings: Settings, rate_limiter: RateLimiter) -> dict:
+    """Returns the Downloader arguments configuring the downloads from the settings."""
+
+    return dict(
+        download_path=settings.DOWNLOAD_PATH,
+        max_workers=_workers(settings, settings.DOWNLOAD_WORKERS),
+        max_connections=settings.DOWNLOAD_MAX_CONNECTIONS,
+        keepalive_expiry=settings.DOWNLOAD_KEEPALIVE_EXPIRY,
+        http2=settings.DOWNLOAD_HTTP2,
+        rate_limiter=rate_limiter,
+    )
+
+
+def _create_uploader(settings: Settings, rate_limiter: RateLimiter) -> Uploader:
+    """Builds an Uploader with its connection pool configured from the settings."""
+
+    return Uploader(
+        upload_url=settings.UPLOAD_URL,
+        max_workers=_workers(settings, settings.UPLOAD_WORKERS),
+        max_connections=settings.UPLOAD_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.UPLOAD_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.UPLOAD_KEEPALIVE_EXPIRY,
+        http2=settings.UPLOAD_HTTP2,
+        cache=_create_upload_cache(settings),
+        rate_limiter=rate_limiter,
+        circuit_breaker=_create_circuit_breaker(settings, "upload host"),
+    )
+
+
+def _create_api_client(settings: Settings, rate_limiter: RateLimiter) -> ApiClient:
+    """Builds an ApiClient configured from the settings."""
+
+    return ApiClient(
+        base_url=settings.API_BASE_URL,
+        bulk_chunk_size=settings.API_BULK_CHUNK_SIZE,
+        rate_limiter=rate_limiter,
+        circuit_breaker=_create_circuit_breaker(settings, "gazette API"),
+    )
+
+
+def _create_circuit_breaker(settings: Settings, name: str) -> CircuitBreaker:
+    """Builds a circuit breaker for the named service, configured from the settings."""
+
+    return CircuitBreaker(
+        name=name,
+        failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=settings.CIRCUIT_RESET_TIMEOUT,
+    )
+
+
+def _save_parked(
+    settings: Settings,
+    uploads: list[str] | None = None,
+    gazettes: list[tuple[datetime, str]] | None = None,
+):
+    """
+    Saves the files and gazettes skipped while a circuit was open to the
+    download directory, where the next run picks them up.
+    """
+
+    uploads = uploads or []
+    gazettes = gazettes or []
+    if not uploads and not gazettes:
+        return
+
+    ParkedWork(os.path.join(settings.DOWNLOAD_PATH, PARKED_FILENAME)).park(uploads, gazettes)
+
+    if uploads:
+        logging.warning(
+            f"{len(uploads)} files were not uploaded because the upload host was "
+            f"unavailable. They will be uploaded by the next run."
+        )
+    if gazettes:
+        logging.warning(
+            f"{len(gazettes)} gazettes were not stored because the API was "
+            f"unavailable. They will be stored by the next run."
+        )
+
+
+def retry_parked_work(settings: Settings, rate_limiter: RateLimiter):
+    """
+    Uploads and stores the work parked by previous runs while the upload
+    host or the API was unavailable. What fails again stays parked; the
+    file is only rewritten once every entry was tried.
+    """
+
+    parked = ParkedWork(os.path.join(settings.DOWNLOAD_PATH, PARKED_FILENAME))
+    if not parked:
+        return
+
+    logging.info(
+        f"Retrying {len(parked.uploads)} uploads and {len(parked.gazettes)} gazettes "
+        f"parked by a previous run..."
+    )
+    gazettes = list(parked.gazettes)
+    uploads_left = []
+
+    with _create_uploader(settings, rate_limiter) as uploader:
+        for file_path in parked.uploads:
+            if not (uploaded_url := uploader._upload_file(file_path)):
+                if os.path.exists(file_path):
+                    uploads_left.append(file_path)
+                else:
+                    logging.error(f"Parked file {file_path} no longer exists. Dropping it.")
+                continue
+            try:
+                gazettes.append((parse_publication_date(file_path), uploaded_url))
+            except ValueError as e:
+                logging.error(
+                    f"Error parsing date from filename '{os.path.basename(file_path)}': {e}. "
+                    f"Skipping storage for {uploaded_url}."
+                )
+
+    with _create_api_client(settings, rate_limiter) as api_client:
+        stored = api_client.store_gazettes(gazettes)
+    logging.info(f"Stored {stored} parked gazettes.")
+
+    parked.clear()
+    _save_parked(settings, uploads_left, api_client.parked)
+
+
+def _create_upload_cache(settings: Settings) -> UploadCache | None:
+    """Builds the upload cache stored in the download directory, unless disabled."""
+
+    if settings.UPLOAD_CACHE_MAX_ENTRIES <= 0:
+        return None
+
+    return UploadCache(
+        path=os.path.join(settings.DOWNLOAD_PATH, UPLOAD_CACHE_FILENAME),
+        max_entries=settings.UPLOAD_CACHE_MAX_ENTRIES,
+        max_age=settings.UPLOAD_CACHE_MAX_AGE,
+    )
+
+
+def run_pipelined_workflow(
+    settings: Settings, rate_limiter: RateLimiter, driver_pool: DriverPool | None = None
+):
+    """
+    Scrapes the PDF links, then streams each file through download, upload
+    and storage concurrently.
+    """
+
+    try:
+        with _create_scraper(settings, rate_limiter, driver_pool) as scraper:
+
+            logging.info("Step 1: Searching for PDF links...")
+            links = scraper.find_pdf_links(target_url=settings.TARGET_URL)
+
+            if not links:
+                logging.warning("No PDF links found. Skipping download, upload and storage steps.")
+                return
+
+            logging.info("Step 2: Downloading, uploading and storing files...")
+            _run_pipeline(settings, rate_limiter, scraper, links)
+
+    except Exception as e:
+        logging.critical(f"A critical error occurred during the pipelined workflow: {e}")
+
+
+def _run_pipeline(
+    settings: Settings, rate_limiter: RateLimiter, scraper: Downloader, links: list[str]
+):
+    """Streams the links through the download, upload and store pipeline."""
+
+    with _create_api_client(settings, rate_limiter) as api_client, \
+            _create_uploader(settings, rate_limiter) as uploader:
+        pipeline = Pipeline(
+            scraper=scraper,
+            uploader=uploader,
+            api_client=api_client,
+            download_workers=_workers(settings, settings.DOWNLOAD_WORKERS),
+            upload_workers=_workers(settings, settings.UPLOAD_WORKERS),
+            store_workers=_workers(settings, settings.STORE_WORKERS),
+            queue_size=settings.PIPELINE_QUEUE_SIZE,
+            delete_after_upload=settings.PIPELINE_DELETE_AFTER_UPLOAD,
+        )
+        pipeline.run(links)
+
+    _save_parked(settings, uploader.parked, api_client.parked)
+
+
+def run_backfill_workflow(
+    settings: Settings, rate_limiter: RateLimiter, months: list[tuple[str, str]]
+):
+    """
+    Scrapes the PDF links of several months, spreading the searches over
+    `BACKFILL_SESSIONS` parallel scraper sessions, then streams every link
+    through a single download, upload and store pipeline.
+    """
+
+    logging.info(f"Step 1: Searching for PDF links of {len(months)} months...")
+    links = _find_backfill_links(settings, rate_limiter, months)
+
+    if not links:
+        logging.warning("No PDF links found. Skipping download, upload and storage steps.")
+        return
+
+    logging.info(f"Step 2: Downloading, uploading and storing {len(links)} files...")
+    try:
+        with _create_downloader(settings, rate_limiter) as downloader:
+            _run_pipeline(settings, rate_limiter, downloader, links)
+
+    except Exception as e:
+        logging.critical(f"A critical error occurred during the backfill: {e}")
+
+
+def _find_backfill_links(
+    settings: Settings, rate_limiter: RateLimiter, months: list[tuple[str, str]]
+) -> list[str]:
+    """
+    Searches every month, each session handling an interleaved share of them,
+    and merges the links found, without duplicates.
+    """
+
+    sessions = max(1, min(settings.BACKFILL_SESSIONS, len(months)))
+
+    def search(batch: list[tuple[str, str]]) -> list[str]:
+        links = []
+        try:
+            with _create_scraper(settings, rate_limiter) as scraper:
+                for month, year in batch:
+                    try:
+                        links.extend(scraper.find_pdf_links(settings.TARGET_URL, month=month, year=year))
+                    except Exception as e:
+                        logging.error(f"Search for {month}/{year} failed: {e}")
+
+        except Exception as e:
+            logging.critical(f"A critical error occurred in a scraping session: {e}")
+
+        return links
+
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        results = executor.map(search, [months[i::sessions] for i in range(sessions)])
+        merged = list(dict.fromkeys(link for links in results for link in links))
+
+    logging.info(f"Found {len(merged)} PDF links in {len(months)} months.")
+    return merged
+
+
+def run_async_workflow(
+    settings: Settings, rate_limiter: RateLimiter, driver_pool: DriverPool | None = None
+):
+    """
+    Scrapes the PDF links, then downloads, uploads and stores every file on
+    a single asyncio event loop.
+    """
+
+    try:
+        with _create_scraper(settings, rate_limiter, driver_pool) as scraper:
+
+            logging.info("Step 1: Searching for PDF links...")
+            links = scraper.find_pdf_links(target_url=settings.TARGET_URL)
+
+    except Exception as e:
+        logging.critical(f"A critical error occurred during scraping: {e}")
+        return
+
+    if not links:
+        logging.warning("No PDF links found. Skipping download, upload and storage steps.")
+        return
+
+    logging.info("Step 2: Downloading, uploading and storing files asynchronously...")
+    asyncio.run(_run_async_engine(settings, rate_limiter, links))
+
+
+async def _run_async_engine(settings: Settings, rate_limiter: RateLimiter, links: list[str]):
+    """
+    Runs the AsyncEngine over the scraped links, with the rate limiter,
+    circuit breakers and connection pools the threaded workflows use.
+    """
+
+    async with AsyncEngine(
+        download_path=settings.DOWNLOAD_PATH,
+        upload_url=settings.UPLOAD_URL,
+        api_base_url=settings.API_BASE_URL,
+        default_host_limit=settings.ASYNC_DEFAULT_HOST_LIMIT,
+        host_limits=settings.ASYNC_HOST_LIMITS,
+        upload_cache=_create_upload_cache(settings),
+        rate_limiter=rate_limiter,
+        upload_circuit_breaker=_create_circuit_breaker(settings, "upload host"),
+        api_circuit_breaker=_create_circuit_breaker(settings, "gazette API"),
+        download_limits=httpx.Limits(
+            max_connections=settings.DOWNLOAD_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.DOWNLOAD_MAX_CONNECTIONS,
+            keepalive_expiry=settings.DOWNLOAD_KEEPALIVE_EXPIRY,
+        ),
+        download_http2=settings.DOWNLOAD_HTTP2,
+        upload_limits=httpx.Limits(
+            max_connections=settings.UPLOAD_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.UPLOAD_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.UPLOAD_KEEPALIVE_EXPIRY,
+        ),
+        upload_http2=settings.UPLOAD_HTTP2,
+    ) as engine:
+        await engine.run(links)
+
+    _save_parked(settings, engine.parked_uploads, engine.parked_gazettes)
+
+
+def run_batch_workflow(
+    settings: Settings, rate_limiter: RateLimiter, driver_pool: DriverPool | None = None
+):
+    """
+    Runs each stage to completion before starting the next one.
+    """
 
     # Step 1: Scrape files
     try:
-        with Scraper(
-            selenium_url=settings.SELENIUM_URL,
-            download_path=settings.DOWNLOAD_PATH,
-        ) as scraper:
+        with _create_scraper(settings, rate_limiter, driver_pool) as scraper:
 
             logging.info("Step 1: Starting scraping process...")
             downloaded_paths = scraper.find_and_download_files(target_url=settings.TARGET_URL)
@@ -45,11 +442,11 @@ def run_full_workflow():
 
     # Step 2: Upload files
     try:
-        uploader = Uploader(upload_url=settings.UPLOAD_URL)
-
-        logging.info("Step 2: Starting upload process...")
-        uploaded_urls = uploader.upload_files(downloaded_paths)
+        with _create_uploader(settings, rate_limiter) as uploader:
+            logging.info("Step 2: Starting upload process...")
+            uploaded_urls = uploader.upload_files(downloaded_paths)
         logging.info(f"Step 2: Upload complete. Uploaded {len(uploaded_urls)} files.")
+        _save_parked(settings, uploads=uploader.parked)
 
     except Exception as e:
         logging.critical(f"A critical error occurred during uploading: {e}")
@@ -63,22 +460,14 @@ def run_full_workflow():
     # Step 3: Store URLs via API
     logging.info("Step 3: Storing uploaded URLs in the database via API...")
 
-    api_client = ApiClient(base_url=settings.API_BASE_URL)
-
     upload_map = dict(zip(uploaded_urls, downloaded_paths))
+    gazettes = []
 
     for uploaded_url, file_path in upload_map.items():
         filename = os.path.basename(file_path)
         try:
-            match = re.search(r"(\d{8})", filename)
-            if not match:
-                raise ValueError("No YYYYMMDD date pattern found in filename")
-
-            date_str = match.group(1)
-            publication_date = datetime.strptime(date_str, "%Y%m%d")
-            api_client.store_gazette(
-                publication_date=publication_date, uploaded_url=uploaded_url
-            )
+            publication_date = parse_publication_date(file_path)
+            gazettes.append((publication_date, uploaded_url))
 
         except (ValueError, IndexError) as e:
             logging.error(
@@ -86,8 +475,113 @@ def run_full_workflow():
                 f"Skipping storage for {uploaded_url}."
             )
 
-    logging.info("Full workflow completed.")
+    with _create_api_client(settings, rate_limiter) as api_client:
+        stored = api_client.store_gazettes(gazettes)
+    logging.info(f"Step 3: Storage complete. Stored {stored} gazettes.")
+    _save_parked(settings, gazettes=api_client.parked)
+
+
+def run_scheduler(interval: float):
+    """
+    Runs the workflow every `interval` seconds until interrupted, borrowing
+    the browser sessions from a pool kept warm between the runs.
+    """
+
+    setup_logging()
+    settings = get_settings()
+
+    driver_pool = None
+    if settings.SCRAPER_BACKEND == "selenium":
+        driver_pool = DriverPool(
+            selenium_url=settings.SELENIUM_URL,
+            size=settings.DRIVER_POOL_SIZE,
+            max_uses=settings.DRIVER_POOL_MAX_USES,
+            browser_profile=settings.SCRAPER_BROWSER_PROFILE,
+        )
+
+    logging.info(f"Running the workflow every {interval:.0f}s.")
+    try:
+        while True:
+            started = time.monotonic()
+            try:
+                run_full_workflow(driver_pool=driver_pool)
+            except Exception as e:
+                logging.critical(f"A critical error occurred during a scheduled run: {e}")
+
+            next_run = started + interval
+            logging.info(f"Next run in {max(0, next_run - time.monotonic()):.0f}s.")
+            _wait_until(next_run, settings, driver_pool)
+
+    except KeyboardInterrupt:
+        logging.info("Scheduler stopped.")
+
+    finally:
+        if driver_pool:
+            driver_pool.close()
+
+
+def _wait_until(deadline: float, settings: Settings, driver_pool: DriverPool | None):
+    """
+    Sleeps until the monotonic `deadline`, keeping the pooled browser
+    sessions alive (and opening the missing ones) in the meantime.
+    """
+
+    while (remaining := deadline - time.monotonic()) > 0:
+        if driver_pool:
+            try:
+                driver_pool.keep_alive()
+            except Exception as e:
+                logging.warning(f"Could not warm up the WebDriver pool: {e}")
+
+        time.sleep(min(remaining, settings.DRIVER_POOL_KEEPALIVE))
+
+
+def parse_year_month(value: str) -> date:
+    """Parses a YYYY-MM command line argument into the first day of that month."""
+
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid month '{value}', expected YYYY-MM") from None
+
+
+def main(argv: list[str] | None = None):
+    """Parses the command line and runs the workflow."""
+
+    parser = argparse.ArgumentParser(description="Scrapes, uploads and stores the gazettes.")
+    parser.add_argument(
+        "--from", dest="start", type=parse_year_month, metavar="YYYY-MM",
+        help="Backfill: first month to scrape (instead of the previous month).",
+    )
+    parser.add_argument(
+        "--to", dest="end", type=parse_year_month, metavar="YYYY-MM",
+        help="Backfill: last month to scrape (defaults to the previous month).",
+    )
+    parser.add_argument(
+        "--interval", type=float, metavar="MINUTES",
+        help="Run the workflow every MINUTES minutes, keeping browser sessions warm between runs.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.end and not args.start:
+        parser.error("--to requires --from")
+    if args.interval is not None:
+        if args.start:
+            parser.error("--interval cannot be combined with --from/--to")
+        if args.interval <= 0:
+            parser.error("--interval must be positive")
+        run_scheduler(args.interval * 60)
+        return
+
+    backfill_months = None
+    if args.start:
+        end = args.end or date.today() - relativedelta(months=1)
+        if end < args.start:
+            parser.error("--to must not be before --from")
+        backfill_months = month_span(args.start, end)
+
+    run_full_workflow(backfill_months)
 
 
 if __name__ == "__main__":
-    run_full_workflow()
+    main()
@@ -0,0 +1,135 @@
+"""
+Persistent manifest of downloaded files, kept as JSON in the download directory.
+
+For each URL it records the validators sent by the server (ETag and
+Last-Modified) along with the size and SHA-256 of the file on disk, so the
+next run can issue a conditional GET and skip files the server reports as
+unchanged with a 304 Not Modified.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+
+import httpx
+
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+@dataclass
+class ManifestEntry:
+    """What is known about a downloaded file."""
+
+    path: str
+    size: int
+    sha256: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def file_sha256(path: str) -> str:
+    """Returns the hex SHA-256 digest of a file's content."""
+
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class DownloadManifest:
+    """
+    Thread-safe mapping of download URLs to ManifestEntry, saved to disk on
+    every change.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the DownloadManifest, loading the existing file if any.
+
+        Args:
+            path: The path of the JSON manifest file.
+        """
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, ManifestEntry] = {}
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._entries = {url: ManifestEntry(**entry) for url, entry in json.load(f).items()}
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable download manifest {path}: {e}")
+
+
+    def get(self, url: str) -> ManifestEntry | None:
+        """Returns the entry recorded for a URL, or None."""
+
+        with self._lock:
+            return self._entries.get(url)
+
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Builds the If-None-Match / If-Modified-Since headers for a URL, as long
+        as the recorded file is still on disk with the recorded size.
+        """
+
+        entry = self.get(url)
+        if entry is None:
+            return {}
+
+        try:
+            if os.path.getsize(entry.path) != entry.size:
+                return {}
+        except OSError:
+            return {}
+
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        return headers
+
+
+    def record(self, url: str, save_path: str, response: httpx.Response) -> ManifestEntry:
+        """
+        Records a completed download and saves the manifest.
+
+        Args:
+            url: The URL the file was downloaded from.
+            save_path: The local path of the complete file.
+            response: The response the file was downloaded with.
+
+        Returns:
+            The recorded entry.
+        """
+
+        entry = ManifestEntry(
+            path=save_path,
+            size=os.path.getsize(save_path),
+            sha256=file_sha256(save_path),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+
+        with self._lock:
+            self._entries[url] = entry
+            self._save()
+
+        return entry
+
+
+    def _save(self) -> None:
+        """Writes the manifest atomically. Must be called with the lock held."""
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({url: asdict(entry) for url, entry in self._entries.items()}, f, indent=2)
+
+        os.replace(tmp_path, self.path)
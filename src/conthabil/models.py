@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
 
 from conthabil.database import Base
 
@@ -12,3 +12,13 @@ class Gazette(Base):
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String, unique=True, index=True, nullable=False)
     publication_date = Column(DateTime, nullable=False)
+    # When the entry was stored; used for the Last-Modified header. Stored as
+    # an absolute instant (timestamptz on PostgreSQL), whatever the timezone
+    # of the session that inserted it.
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # B-tree led by publication_date: serves date range filters as well as
+        # the (publication_date, id) ordering and keyset pagination.
+        Index("ix_gazettes_publication_date_id", "publication_date", "id"),
+    )
@@ -0,0 +1,52 @@
+"""
+Opaque cursors for keyset pagination of gazette listings.
+
+A cursor encodes the sort key `(publication_date, id)` of the last entry of a
+page, so the next page can be fetched with an indexed range condition instead
+of an OFFSET that grows linearly with the page depth.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+
+def encode_cursor(gazette: Any) -> str:
+    """
+    Builds the cursor pointing right after the given gazette.
+
+    Args:
+        gazette: The last gazette (ORM object or row) of the current page.
+
+    Returns:
+        A URL-safe opaque cursor string.
+    """
+
+    key = [gazette.publication_date.isoformat(), gazette.id]
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Extracts the sort key from a cursor built by `encode_cursor`.
+
+    Args:
+        cursor: The opaque cursor string.
+
+    Returns:
+        The (publication_date, id) pair of the last entry of the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        publication_date, gazette_id = json.loads(raw)
+        return datetime.fromisoformat(publication_date), int(gazette_id)
+
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,92 @@
+"""
+Work parked while a circuit was open, kept as JSON next to the downloads.
+
+The uploader parks the files it could not upload and the API client the
+gazettes it could not store while their service was down. At the end of a
+run they are saved here, and the next run retries them before its own work.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+
+
+PARKED_FILENAME = "parked.json"
+
+
+class ParkedWork:
+    """
+    Files left to upload and gazettes left to store by previous runs, saved
+    to disk on every change.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the ParkedWork, loading the existing file if any.
+
+        Args:
+            path: The path of the JSON file.
+        """
+
+        self.path = path
+        self.uploads: list[str] = []
+        self.gazettes: list[tuple[datetime, str]] = []
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.uploads = list(data["uploads"])
+            self.gazettes = [
+                (datetime.fromisoformat(gazette["publication_date"]), gazette["url"])
+                for gazette in data["gazettes"]
+            ]
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError, KeyError) as e:
+            logging.warning(f"Ignoring unreadable parked work file {path}: {e}")
+
+
+    def park(self, uploads: list[str], gazettes: list[tuple[datetime, str]]) -> None:
+        """Adds files to upload and gazettes to store, without duplicates, and saves them."""
+
+        self.uploads = list(dict.fromkeys([*self.uploads, *uploads]))
+        self.gazettes = list(dict.fromkeys([*self.gazettes, *gazettes]))
+        self._save()
+
+
+    def clear(self) -> None:
+        """Forgets all the parked work, once a run took it over."""
+
+        self.uploads = []
+        self.gazettes = []
+        self._save()
+
+
+    def __len__(self) -> int:
+        return len(self.uploads) + len(self.gazettes)
+
+
+    def _save(self) -> None:
+        """Writes the parked work atomically, or removes the file when there is none."""
+
+        if not self:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+
+        data = {
+            "uploads": self.uploads,
+            "gazettes": [
+                {"publication_date": publication_date.isoformat(), "url": url}
+                for publication_date, url in self.gazettes
+            ],
+        }
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        os.replace(tmp_path, self.path)
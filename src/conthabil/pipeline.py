@@ -0,0 +1,258 @@
+"""
+Streaming per-file pipeline for the download -> upload -> store workflow.
+
+Instead of waiting for every file to finish one stage before starting the
+next, each file flows through the three stages independently. Stages are
+connected by bounded queues, so a slow downstream stage applies backpressure
+to the faster upstream ones and only a handful of files are in flight at once.
+"""
+
+import logging
+import os
+import queue
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+from conthabil.api_client import ApiClient
+from conthabil.scraper import Downloader
+from conthabil.uploader import Uploader
+
+
+# Marks the end of a stage's input queue.
+_DONE = object()
+
+
+def parse_publication_date(file_path: str) -> datetime:
+    """
+    Extracts the publication date from a gazette filename.
+
+    Args:
+        file_path: The local path of the downloaded gazette.
+
+    Returns:
+        The publication date encoded in the filename as YYYYMMDD.
+
+    Raises:
+        ValueError: If the filename contains no valid YYYYMMDD date.
+    """
+
+    filename = os.path.basename(file_path)
+    match = re.search(r"(\d{8})", filename)
+    if not match:
+        raise ValueError("No YYYYMMDD date pattern found in filename")
+
+    return datetime.strptime(match.group(1), "%Y%m%d")
+
+
+@dataclass
+class PipelineResult:
+    """Counts of files that made it through each stage of the pipeline."""
+
+    downloaded: int = 0
+    uploaded: int = 0
+    stored: int = 0
+
+
+class Pipeline:
+    """
+    Runs the download, upload and store stages concurrently, one file at a time.
+    """
+
+    def __init__(
+        self,
+        scraper: Downloader,
+        uploader: Uploader,
+        api_client: ApiClient,
+        download_workers: int = 2,
+        upload_workers: int = 5,
+        store_workers: int = 2,
+        queue_size: int = 10,
+        delete_after_upload: bool = False,
+    ):
+        """
+        Initializes the Pipeline.
+
+        Args:
+            scraper: An initialized Downloader (e.g. a Scraper), used for its download stage.
+            uploader: The Uploader used for the upload stage.
+            api_client: The ApiClient used for the store stage.
+            download_workers: Number of concurrent downloads.
+            upload_workers: Number of concurrent uploads.
+            store_workers: Number of concurrent API store calls.
+            queue_size: Maximum number of files waiting between two stages.
+            delete_after_upload: Whether to remove local files once uploaded.
+        """
+
+        self.scraper = scraper
+        self.uploader = uploader
+        self.api_client = api_client
+        self.download_workers = download_workers
+        self.upload_workers = upload_workers
+        self.store_workers = store_workers
+        self.queue_size = queue_size
+        self.delete_after_upload = delete_after_upload
+
+        self._result = PipelineResult()
+        self._lock = threading.Lock()
+
+
+    def run(self, links: list[str]) -> PipelineResult:
+        """
+        Pushes every link through download, upload and store.
+
+        Args:
+            links: The URLs of the files to process.
+
+        Returns:
+            A PipelineResult with the number of files completed per stage.
+        """
+
+        logging.info(f"Starting pipelined processing of {len(links)} files...")
+
+        self._result = PipelineResult()
+
+        link_queue: queue.Queue = queue.Queue()
+        upload_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        store_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        for link in links:
+            link_queue.put(link)
+
+        stages = [
+            self._start_stage("download", self._download, link_queue, upload_queue, self.download_workers),
+            self._start_stage("upload", self._upload, upload_queue, store_queue, self.upload_workers),
+            self._start_stage("store", self._store, store_queue, None, self.store_workers),
+        ]
+
+        # Closing a stage's input only after the previous stage has fully
+        # drained guarantees every item is seen before the sentinels arrive.
+        self._close_stage(link_queue, self.download_workers)
+        for (workers, out_queue), next_count in zip(
+            stages, [self.upload_workers, self.store_workers, 0]
+        ):
+            for worker in workers:
+                worker.join()
+            if out_queue is not None:
+                self._close_stage(out_queue, next_count)
+
+        logging.info(
+            f"Pipeline finished. Downloaded: {self._result.downloaded}, "
+            f"uploaded: {self._result.uploaded}, stored: {self._result.stored}."
+        )
+        return self._result
+
+
+    def _start_stage(
+        self,
+        name: str,
+        func: Callable[[Any], Any],
+        in_queue: queue.Queue,
+        out_queue: queue.Queue | None,
+        workers: int,
+    ) -> tuple[list[threading.Thread], queue.Queue | None]:
+        """Starts the worker threads for a single stage."""
+
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(func, in_queue, out_queue),
+                name=f"pipeline-{name}-{i}",
+                daemon=True,
+            )
+            for i in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        return threads, out_queue
+
+
+    @staticmethod
+    def _close_stage(in_queue: queue.Queue, workers: int) -> None:
+        """Signals every worker of a stage that no more input is coming."""
+
+        for _ in range(workers):
+            in_queue.put(_DONE)
+
+
+    @staticmethod
+    def _worker(
+        func: Callable[[Any], Any],
+        in_queue: queue.Queue,
+        out_queue: queue.Queue | None,
+    ) -> None:
+        """Processes items until the stage is closed, forwarding results downstream."""
+
+        while True:
+            item = in_queue.get()
+            if item is _DONE:
+                return
+
+            try:
+                result = func(item)
+            except Exception as e:
+                logging.error(f"Unexpected error processing {item}: {e}")
+                continue
+
+            if result is not None and out_queue is not None:
+                # Blocks while the downstream stage is saturated (backpressure).
+                out_queue.put(result)
+
+
+    def _download(self, link: str) -> str | None:
+        """Download stage: fetches a single file."""
+
+        file_path = self.scraper._download_file(link)
+        if file_path:
+            self._increment("downloaded")
+        return file_path
+
+
+    def _upload(self, file_path: str) -> tuple[str, str] | None:
+        """Upload stage: uploads a single file and pairs it with its public URL."""
+
+        uploaded_url = self.uploader._upload_file(file_path)
+        if not uploaded_url:
+            return None
+
+        self._increment("uploaded")
+
+        if self.delete_after_upload:
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                logging.warning(f"Could not remove {file_path} after upload: {e}")
+
+        return uploaded_url, file_path
+
+
+    def _store(self, item: tuple[str, str]) -> None:
+        """Store stage: records the uploaded URL through the API."""
+
+        uploaded_url, file_path = item
+
+        try:
+            publication_date = parse_publication_date(file_path)
+        except ValueError as e:
+            logging.error(
+                f"Error parsing date from filename '{os.path.basename(file_path)}': {e}. "
+                f"Skipping storage for {uploaded_url}."
+            )
+            return None
+
+        if self.api_client.store_gazette(
+            publication_date=publication_date, uploaded_url=uploaded_url
+        ):
+            self._increment("stored")
+
+        return None
+
+
+    def _increment(self, field: str) -> None:
+        """Thread-safely increments one of the result counters."""
+
+        with self._lock:
+            setattr(self._result, field, getattr(self._result, field) + 1)
@@ -0,0 +1,279 @@
+"""
+Adaptive per-host rate limiting for outbound HTTP requests.
+
+Each host gets a token bucket bounding the request rate and a concurrency
+limit bounding the requests in flight. Both follow AIMD (additive increase,
+multiplicative decrease): every successful request raises them slightly, and
+a throttling response (429 or 503) halves them and pauses the host, for the
+time given by `Retry-After` or else an exponential backoff with jitter,
+before the request is retried. The workflow therefore runs as fast as the
+servers allow instead of at a fixed, conservative worker count.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable
+from urllib.parse import urlsplit
+
+import httpx
+
+
+# Responses telling the client to slow down.
+THROTTLING_STATUSES = {429, 503}
+
+# Share of the maximum rate regained after each successful request.
+RATE_RECOVERY = 0.05
+
+# Seconds between two checks for a free slot by async requests.
+SLOT_POLL_INTERVAL = 0.01
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """
+    Returns the delay in seconds requested by a response's Retry-After header
+    (given either as seconds or as an HTTP date), or None if absent or invalid.
+    """
+
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+
+    if value.strip().isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _HostLimiter:
+    """Token bucket and AIMD concurrency limit of a single host."""
+
+    def __init__(self, max_rate: float, burst: int, initial_concurrency: int, max_concurrency: int):
+        self.max_rate = max_rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+
+        self.rate = max_rate
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.concurrency = float(initial_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+
+        self._cond = threading.Condition()
+
+
+    def acquire(self) -> None:
+        """Blocks until the host is not paused, a slot is free and a token is available."""
+
+        with self._cond:
+            while (timeout := self._try_acquire()) != 0:
+                self._cond.wait(timeout)
+
+
+    async def acquire_async(self) -> None:
+        """
+        Async version of `acquire`, waiting on the event loop instead of
+        blocking a thread. Free slots are polled every SLOT_POLL_INTERVAL
+        seconds, as they may be released by other threads.
+        """
+
+        while True:
+            with self._cond:
+                timeout = self._try_acquire()
+
+            if timeout == 0:
+                return
+            await asyncio.sleep(SLOT_POLL_INTERVAL if timeout is None else timeout)
+
+
+    def _try_acquire(self) -> float | None:
+        """
+        Takes a slot and a token if the host allows a request now, returning 0.
+        Otherwise returns the seconds to wait before trying again, or None to
+        wait for a slot to be released. Must be called with the lock held.
+        """
+
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= int(self.concurrency):
+            return None
+        if self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+
+        self.tokens -= 1
+        self.in_flight += 1
+        return 0
+
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+
+    def on_success(self) -> None:
+        """Additive increase: about one more slot per window of successful requests."""
+
+        with self._cond:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self.rate = min(self.max_rate, self.rate + self.max_rate * RATE_RECOVERY)
+            self._cond.notify_all()
+
+
+    def on_throttled(self, delay: float) -> None:
+        """Multiplicative decrease, and a pause of the host for `delay` seconds."""
+
+        with self._cond:
+            self.concurrency = max(1.0, self.concurrency / 2)
+            self.rate = max(self.max_rate * RATE_RECOVERY, self.rate / 2)
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+
+class RateLimiter:
+    """
+    Thread-safe adaptive rate limiter, shared by every client of the workflow
+    and keyed by target host.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = 5.0,
+        burst: int = 5,
+        initial_concurrency: int = 2,
+        max_concurrency: int = 16,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            max_rate: Maximum requests per second per host.
+            burst: Number of requests a host can receive at once after being idle.
+            initial_concurrency: Requests in flight per host before any adaptation.
+            max_concurrency: Upper bound of the requests in flight per host.
+            max_retries: Retries of a throttled request before giving up.
+            backoff_base: Initial backoff delay in seconds, doubled on each retry.
+            backoff_max: Upper bound of the backoff delay in seconds.
+        """
+
+        self.max_rate = max_rate
+        self.burst = burst
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._hosts: dict[str, _HostLimiter] = {}
+        self._lock = threading.Lock()
+
+
+    def _host(self, url: str) -> _HostLimiter:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = _HostLimiter(
+                    self.max_rate, self.burst, self.initial_concurrency, self.max_concurrency
+                )
+            return self._hosts[host]
+
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Returns the delay before retrying: the server's Retry-After if given,
+        else an exponential backoff, with random jitter so that throttled
+        workers do not retry in lockstep.
+        """
+
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.backoff_base)
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+    def send(self, url: str, request: Callable[[], httpx.Response]) -> httpx.Response:
+        """
+        Performs a request to `url` within the host's limits, retrying it while
+        the server throttles it.
+
+        Args:
+            url: The URL the request targets, used to pick the host limiter.
+            request: Performs the request and returns its response. It may be
+                called several times, so it must be safe to repeat.
+
+        Returns:
+            The first non-throttled response, or the last throttled one once
+            the retries are exhausted.
+        """
+
+        host = self._host(url)
+
+        for attempt in range(self.max_retries + 1):
+            host.acquire()
+            try:
+                response = request()
+            finally:
+                host.release()
+
+            if self._settle(host, url, response, attempt):
+                return response
+
+
+    async def asend(
+        self, url: str, request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """
+        Async version of `send`, for requests made on an event loop. A task
+        cancelled while waiting for the host's limits holds no slot.
+        """
+
+        host = self._host(url)
+
+        for attempt in range(self.max_retries + 1):
+            await host.acquire_async()
+            try:
+                response = await request()
+            finally:
+                host.release()
+
+            if self._settle(host, url, response, attempt):
+                return response
+
+
+    def _settle(self, host: _HostLimiter, url: str, response: httpx.Response, attempt: int) -> bool:
+        """
+        Adapts the host's limits to a response, and tells whether it is the
+        final one: not throttled, or throttled with no retry left.
+        """
+
+        if response.status_code not in THROTTLING_STATUSES:
+            host.on_success()
+            return True
+
+        delay = self.backoff(attempt, parse_retry_after(response))
+        host.on_throttled(delay)
+
+        if attempt == self.max_retries:
+            return True
+
+        logging.warning(
+            f"{url} answered {response.status_code}. "
+            f"Retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})."
+        )
+        return False
@@ -0,0 +1,209 @@
+"""
+In-process cache of serialized API responses.
+
+Entries are kept in LRU order with a time-to-live, and each one records the
+publication date range its query covers, so a write only invalidates the
+entries it can actually affect. Responses for past months, which only change
+when a gazette is backfilled, are kept for a longer time-to-live.
+
+A response rendered from rows read before a concurrent write must not be
+cached after that write invalidated its range. Readers therefore take the
+cache's `generation` before querying and pass it to `set`, which drops the
+response if a write has since touched its date range.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Hashable, Iterable
+
+
+@dataclass
+class CachedResponse:
+    """A serialized response body and the headers to send along with it."""
+
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+# Number of recent writes remembered to validate responses read before them.
+WRITE_LOG_SIZE = 1024
+
+
+@dataclass
+class _Entry:
+    response: CachedResponse
+    start: datetime | None
+    end: datetime | None
+    expires_at: float
+
+
+def _covers(start: datetime | None, end: datetime | None, publication_date: datetime) -> bool:
+    """Tells whether a publication date falls within `[start, end)`."""
+
+    return (start is None or start <= publication_date) and (end is None or publication_date < end)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU/TTL cache of serialized responses, keyed by query parameters.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 60, historical_ttl: float = 86400):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            max_entries: Maximum number of cached responses (0 disables the cache).
+            ttl: Seconds a response is kept when it may include the current month.
+            historical_ttl: Seconds a response is kept when it only covers past months.
+        """
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.historical_ttl = historical_ttl
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # Incremented by every write, which is logged with its publication dates.
+        self._generation = 0
+        self._writes: deque[tuple[int, list[datetime]]] = deque(maxlen=WRITE_LOG_SIZE)
+
+
+    def generation(self) -> int:
+        """
+        Returns the current write generation, to be taken before querying the
+        rows of a response and passed to `set`.
+        """
+
+        with self._lock:
+            return self._generation
+
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """
+        Returns the cached response for the key, or None if absent or expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry.expires_at <= time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.response
+
+
+    def set(
+        self,
+        key: Hashable,
+        response: CachedResponse,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Caches a response, unless a write within its date range happened since
+        `generation`, in which case the response may be stale.
+
+        Args:
+            key: The cache key, derived from the query parameters.
+            response: The serialized response.
+            start: Inclusive lower bound of the publication dates the query
+                covers, or None if unbounded.
+            end: Exclusive upper bound of the publication dates the query
+                covers, or None if unbounded.
+            generation: The `generation` taken before querying the rows of
+                the response, or None to cache it unconditionally.
+        """
+
+        if self.max_entries <= 0:
+            return
+
+        first_of_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        historical = end is not None and end <= first_of_month
+        ttl = self.historical_ttl if historical else self.ttl
+
+        with self._lock:
+            if generation is not None and self._written_since(generation, start, end):
+                return
+
+            self._entries[key] = _Entry(response, start, end, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+    def invalidate(self, publication_dates: Iterable[datetime]) -> None:
+        """
+        Records a write of gazettes with the given publication dates, and
+        drops every cached response whose date range includes one of them.
+        """
+
+        # Stored publication dates are naive, so compare on naive datetimes.
+        dates = [d.replace(tzinfo=None) for d in publication_dates]
+        if not dates:
+            return
+
+        with self._lock:
+            self._generation += 1
+            self._writes.append((self._generation, dates))
+
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if any(_covers(entry.start, entry.end, d) for d in dates)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+
+    def _written_since(self, generation: int, start: datetime | None, end: datetime | None) -> bool:
+        """
+        Tells whether a write after `generation` touched `[start, end)`. Must
+        be called with the lock held.
+        """
+
+        if generation == self._generation:
+            return False
+
+        # Writes older than the log cannot be checked: assume the worst.
+        if not self._writes or self._writes[0][0] > generation + 1:
+            return True
+
+        return any(
+            any(_covers(start, end, d) for d in dates)
+            for written, dates in self._writes
+            if written > generation
+        )
+
+
+    def clear(self) -> None:
+        """Drops every cached response and resets the hit/miss counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+    def stats(self) -> dict:
+        """Returns the cache size and hit/miss counters."""
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
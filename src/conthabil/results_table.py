@@ -0,0 +1,48 @@
+"""
+Extraction of the PDF links from the gazette site's results table
+(`table#example`), from the page HTML rather than through a browser.
+"""
+
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+
+class _ResultsTableParser(HTMLParser):
+    """Collects the link hrefs of the rows of the `#example` results table."""
+
+    def __init__(self):
+        super().__init__()
+        self.hrefs: list[str] = []
+        self._table_depth = 0
+        self._in_body = False
+
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "table":
+            if self._table_depth or dict(attrs).get("id") == "example":
+                self._table_depth += 1
+        elif tag == "tbody" and self._table_depth == 1:
+            self._in_body = True
+        elif tag == "a" and self._in_body:
+            if href := dict(attrs).get("href"):
+                self.hrefs.append(href)
+
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "table" and self._table_depth:
+            self._table_depth -= 1
+        elif tag == "tbody" and self._table_depth == 1:
+            self._in_body = False
+
+
+def parse_pdf_links(html: str, base_url: str) -> list[str]:
+    """
+    Extracts the absolute URLs of the links in the results table of an HTML
+    document or fragment.
+    """
+
+    parser = _ResultsTableParser()
+    parser.feed(html)
+    parser.close()
+
+    return [urljoin(base_url, href) for href in parser.hrefs]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -29,3 +30,29 @@ class GazetteResponse(GazetteBase):
 
     class Config:
         from_attributes = True
+
+
+class DatabasePoolStatus(BaseModel):
+    """
+    Pydantic schema for the database connection pool statistics.
+    Pool size figures are None for pools that do not keep connections.
+    """
+    pool_class: str
+    size: Optional[int]
+    checked_in: Optional[int]
+    checked_out: Optional[int]
+    overflow: Optional[int]
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+
+
+class ResponseCacheStats(BaseModel):
+    """
+    Pydantic schema for the API response cache statistics.
+    """
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
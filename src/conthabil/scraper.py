@@ -1,45 +1,334 @@
 import logging
 import os
+import time
+from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from datetime import date, datetime
 from types import TracebackType
-from typing import Self
+from typing import Literal, Self
 
 import httpx
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
+from conthabil.downloads import (
+    MAX_RESTARTS,
+    IncompleteDownloadError,
+    complete_download,
+    download_request,
+    open_part_file,
+)
+from conthabil.driver_pool import BrowserProfile, DriverPool, create_remote_driver
+from conthabil.manifest import MANIFEST_FILENAME, DownloadManifest
+from conthabil.ratelimit import RateLimiter
+from conthabil.results_table import parse_pdf_links
+
+
+# Returns the (absolute) href of every link of the results table at once.
+FIND_PDF_LINKS_SCRIPT = """
+return Array.from(
+    document.querySelectorAll("table#example > tbody > tr > td > a"),
+    (a) => a.href
+);
+"""
+
+
+def previous_month(today: datetime | None = None) -> tuple[str, str]:
+    """
+    Returns the zero-padded month and the year of the month before `today`
+    (by default, the current date), as expected by the search form.
+    """
+
+    previous_month_date = (today or datetime.today()) - relativedelta(months=1)
+    return previous_month_date.strftime("%m"), previous_month_date.strftime("%Y")
+
+
+def month_span(start: date, end: date) -> list[tuple[str, str]]:
+    """
+    Returns the (month, year) pairs of every month from `start` to `end`,
+    both included, in the format expected by the search form.
+    """
+
+    months = []
+    current = start.replace(day=1)
+    while current <= end:
+        months.append((current.strftime("%m"), current.strftime("%Y")))
+        current += relativedelta(months=1)
+
+    return months
 
-class Scraper:
+
+class Downloader:
+    """
+    Downloads gazette PDFs through a shared pooled HTTP client, resuming
+    partial downloads and skipping files unchanged since the last run.
+    It is designed to be used as a context manager.
+    """
+
+    def __init__(
+        self,
+        download_path: str,
+        max_workers: int | None = None,
+        max_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        rate_limiter: RateLimiter | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        """
+        Initializes the Downloader.
+
+        Args:
+            download_path: The directory to save downloaded files.
+            max_workers: Number of download threads. By default, the rate
+                limiter's maximum concurrency, so that its per-host limit is
+                what bounds the downloads in flight.
+            max_connections: Maximum number of open connections to the download host.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Whether to negotiate HTTP/2 with servers that support it.
+            rate_limiter: Adaptive per-host rate limiter for the downloads.
+            transport: Transport of the HTTP client, replacing the network
+                (e.g. an `httpx.MockTransport`).
+        """
+
+        self.download_path = download_path
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_workers = max_workers or self.rate_limiter.max_concurrency
+        self.manifest = DownloadManifest(os.path.join(download_path, MANIFEST_FILENAME))
+
+        # Shared by every download of the session, so the PDFs of a month
+        # reuse a handful of kept-alive connections to the municipal host.
+        self.client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            follow_redirects=True,
+            transport=transport,
+        )
+
+
+    def __enter__(self) -> Self:
+        """
+        Enters the context manager.
+        """
+        return self
+
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """
+        Exits the context manager, closing the HTTP client.
+        """
+
+        self.close()
+
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP client and its open connections.
+        """
+
+        self.client.close()
+
+
+    def _download_all_files(self, links: list[str]) -> list[str]:
+        """
+        Downloads all files from a list of links concurrently.
+
+        Args:
+            links: A list of URLs to download.
+
+        Returns:
+            A list of local paths for the successfully downloaded files.
+        """
+
+        logging.info(f"Starting concurrent download of {len(links)} files...")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._download_file, links))
+
+        downloaded_files = [path for path in results if path is not None]
+        logging.info(
+            f"Finished downloading. {len(downloaded_files)} files saved."
+        )
+        return downloaded_files
+
+
+    def _download_file(self, link: str) -> str | None:
+        """
+        Downloads a single file from a given link using the shared HTTP client.
+
+        The file is written to a `.part` file that is renamed once complete, and
+        a partial file left by an interrupted download is resumed with a Range
+        request; if the server rejects the range, the download starts over up
+        to `MAX_RESTARTS` times. Files already in the download manifest are
+        requested conditionally, and kept as they are if the server answers 304.
+
+        Args:
+            link: The URL of the file to download.
+
+        Returns:
+            The local path of the downloaded file, or None if download fails.
+        """
+
+        try:
+            for _ in range(MAX_RESTARTS + 1):
+                save_path, offset, headers = download_request(link, self.download_path, self.manifest)
+
+                response = self.rate_limiter.send(
+                    link, lambda: self._fetch_to_part_file(link, save_path, offset, headers)
+                )
+
+                if complete_download(link, save_path, offset, response, self.manifest):
+                    return save_path
+
+            raise IncompleteDownloadError(f"Gave up restarting the download of {link}")
+
+        except (httpx.HTTPError, IOError) as e:
+            logging.error(f"Error downloading {link}: {e}")
+            return None
+
+
+    def _fetch_to_part_file(
+        self, link: str, save_path: str, offset: int, headers: dict[str, str]
+    ) -> httpx.Response:
+        """
+        Requests a file and, if the response is successful, streams its body
+        into the partial file of `save_path`.
+
+        Returns:
+            The (closed) response.
+        """
+
+        with self.client.stream("GET", link, headers=headers) as response:
+            if response.is_success:
+                with open_part_file(save_path, response, offset) as f:
+                    for chunk in response.iter_bytes():
+                        f.write(chunk)
+
+        return response
+
+
+class BaseScraper(Downloader, ABC):
+    """
+    Base of the scrapers: finds the PDF links of the gazette site (left to the
+    subclasses) and downloads them with the Downloader.
+    """
+
+    def find_and_download_files(self, target_url: str) -> list[str]:
+        """
+        Finds and downloads all relevant PDF files from the target URL for the
+        previous month.
+
+        Args:
+            target_url: The URL to scrape.
+
+        Returns:
+            A list of local file paths for the downloaded files.
+        """
+
+        pdf_links = self.find_pdf_links(target_url)
+        downloaded_files = self._download_all_files(pdf_links)
+
+        return downloaded_files
+
+
+    @abstractmethod
+    def find_pdf_links(
+        self, target_url: str, month: str | None = None, year: str | None = None
+    ) -> list[str]:
+        """
+        Searches the target URL for a month (by default, the previous one) and
+        collects the PDF links, without downloading them.
+
+        Args:
+            target_url: The URL to scrape.
+            month: The zero-padded month to search for (e.g. "07").
+            year: The year to search for (e.g. "2025").
+
+        Returns:
+            A list of URLs to the PDF files.
+        """
+
+
+class Scraper(BaseScraper):
     """
     A class to handle the scraping of documents from the specified URL.
     It connects to a remote Selenium WebDriver and is designed to be used as a context manager.
     """
 
-    def __init__(self, selenium_url: str, download_path: str):
+    def __init__(
+        self,
+        selenium_url: str,
+        download_path: str,
+        max_workers: int | None = None,
+        max_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        rate_limiter: RateLimiter | None = None,
+        transport: httpx.BaseTransport | None = None,
+        link_extraction: Literal["script", "page_source"] = "script",
+        driver_pool: DriverPool | None = None,
+        browser_profile: BrowserProfile = "default",
+    ):
         """
         Initializes the Scraper.
 
         Args:
             selenium_url: The URL of the remote Selenium WebDriver.
             download_path: The directory to save downloaded files.
+            max_workers: Number of download threads (see `Downloader`).
+            max_connections: Maximum number of open connections to the download host.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Whether to negotiate HTTP/2 with servers that support it.
+            rate_limiter: Adaptive per-host rate limiter for the downloads.
+            transport: Transport of the download client (see `Downloader`).
+            link_extraction: How the result links are read from the page: with
+                one `execute_script` call ("script") or by parsing the page
+                source locally ("page_source").
+            driver_pool: Pool of warm WebDriver sessions to borrow the session
+                from, instead of opening (and closing) one for this scraper.
+            browser_profile: The browser profile of the session opened when no
+                pool is given ("default", or "performance" for a headless
+                Chrome that does not load images, stylesheets and fonts).
         """
 
+        super().__init__(
+            download_path=download_path,
+            max_workers=max_workers,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            rate_limiter=rate_limiter,
+            transport=transport,
+        )
         self.selenium_url = selenium_url
-        self.download_path = download_path
+        self.link_extraction = link_extraction
+        self.driver_pool = driver_pool
+        self.browser_profile = browser_profile
         self.driver: WebDriver | None = None
 
 
     def __enter__(self) -> Self:
         """
-        Enters the context manager, setting up the WebDriver session.
+        Enters the context manager, setting up the WebDriver session or
+        borrowing one from the driver pool.
         """
-        self.driver = self._setup_driver()
+
+        if self.driver_pool:
+            self.driver = self.driver_pool.acquire()
+        else:
+            self.driver = self._setup_driver()
         return self
 
 
@@ -50,12 +339,19 @@ class Scraper:
         exc_tb: TracebackType | None,
     ) -> None:
         """
-        Exits the context manager, closing the WebDriver session.
+        Exits the context manager, closing the WebDriver session (or giving
+        it back to the driver pool) and the HTTP client.
         """
 
-        if self.driver:
+        if self.driver and self.driver_pool:
+            logging.debug("Returning WebDriver session to the pool.")
+            self.driver_pool.release(self.driver)
+        elif self.driver:
             logging.debug("Closing WebDriver session.")
             self.driver.quit()
+        self.driver = None
+
+        super().__exit__(exc_type, exc_val, exc_tb)
 
 
     def _setup_driver(self) -> WebDriver:
@@ -66,57 +362,54 @@ class Scraper:
             An instance of the remote Selenium WebDriver.
         """
 
-        logging.debug(f"Connecting to remote WebDriver at {self.selenium_url}")
-        chrome_options = Options()
-
-        try:
-            driver = webdriver.Remote(
-                command_executor=self.selenium_url, options=chrome_options
-            )
-            logging.debug("Successfully connected to remote WebDriver.")
-            return driver
-
-        except Exception as e:
-            logging.error(f"Failed to connect to remote WebDriver: {e}")
-            raise
+        return create_remote_driver(self.selenium_url, self.browser_profile)
 
 
-    def find_and_download_files(self, target_url: str) -> list[str]:
+    def find_pdf_links(
+        self, target_url: str, month: str | None = None, year: str | None = None
+    ) -> list[str]:
         """
-        Finds and downloads all relevant PDF files from the target URL for the
-        previous month.
+        Searches the target URL for a month (by default, the previous one) and
+        collects the PDF links, without downloading them.
 
         Args:
             target_url: The URL to scrape.
+            month: The zero-padded month to search for (e.g. "07").
+            year: The year to search for (e.g. "2025").
 
         Returns:
-            A list of local file paths for the downloaded files.
+            A list of URLs to the PDF files.
         """
 
         if not self.driver:
             raise RuntimeError("WebDriver not initialized. Use the 'with' statement.")
 
         logging.debug(f"Navigating to {target_url}")
+        started = time.perf_counter()
         self.driver.get(target_url)
+        logging.info(f"Loaded {target_url} in {time.perf_counter() - started:.2f}s.")
 
-        self._perform_search()
-        self._set_pagination()
+        started = time.perf_counter()
+        self._perform_search(month, year)
+        logging.info(f"Search round trip took {time.perf_counter() - started:.2f}s.")
 
-        pdf_links = self._find_pdf_links()
-        downloaded_files = self._download_all_files(pdf_links)
+        self._set_pagination()
 
-        return downloaded_files
+        return self._find_pdf_links()
 
 
-    def _perform_search(self) -> None:
-        """Calculates the previous month and performs the search."""
+    def _perform_search(self, month: str | None = None, year: str | None = None) -> None:
+        """
+        Performs the search for the given month and year, or for the previous
+        month if they are not given.
+        """
 
         assert self.driver, "WebDriver is not initialized."
 
-        today = datetime.today()
-        previous_month_date = today - relativedelta(months=1)
-        target_month = previous_month_date.strftime("%m")
-        target_year = previous_month_date.strftime("%Y")
+        if month and year:
+            target_month, target_year = month, year
+        else:
+            target_month, target_year = previous_month()
 
         logging.info(f"Performing search for month/year: {target_month}/{target_year}")
 
@@ -177,7 +470,10 @@ class Scraper:
 
     def _find_pdf_links(self) -> list[str]:
         """
-        Finds all PDF links within the results table.
+        Finds all PDF links within the results table, in a single WebDriver
+        round trip: either one `execute_script` call returning every href, or
+        one `page_source` read parsed locally, instead of one `get_attribute`
+        call per link.
 
         Returns:
             A list of strings, where each string is a URL to a PDF file.
@@ -185,66 +481,16 @@ class Scraper:
 
         assert self.driver, "WebDriver is not initialized."
 
-        logging.debug("Finding all PDF links on the page...")
-        link_elements = self.driver.find_elements(
-            By.XPATH, "//table[@id='example']/tbody/tr/td/a"
-        )
-        pdf_links = [
-            href
-            for elem in link_elements
-            if (href := elem.get_attribute("href"))
-        ]
-        logging.info(f"Found {len(pdf_links)} PDF links.")
-        return pdf_links
-
-
-    def _download_all_files(self, links: list[str]) -> list[str]:
-        """
-        Downloads all files from a list of links concurrently.
-
-        Args:
-            links: A list of URLs to download.
-
-        Returns:
-            A list of local paths for the successfully downloaded files.
-        """
-
-        logging.info(f"Starting concurrent download of {len(links)} files...")
+        logging.debug(f"Finding all PDF links on the page ({self.link_extraction})...")
+        started = time.perf_counter()
 
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            results = list(executor.map(self._download_file, links))
+        if self.link_extraction == "page_source":
+            pdf_links = parse_pdf_links(self.driver.page_source, self.driver.current_url)
+        else:
+            pdf_links = [href for href in self.driver.execute_script(FIND_PDF_LINKS_SCRIPT) if href]
 
-        downloaded_files = [path for path in results if path is not None]
         logging.info(
-            f"Finished downloading. {len(downloaded_files)} files saved."
+            f"Found {len(pdf_links)} PDF links in {time.perf_counter() - started:.3f}s "
+            f"({self.link_extraction})."
         )
-        return downloaded_files
-
-
-    def _download_file(self, link: str) -> str | None:
-        """
-        Downloads a single file from a given link using httpx.
-
-        Args:
-            link: The URL of the file to download.
-
-        Returns:
-            The local path of the downloaded file, or None if download fails.
-        """
-
-        try:
-            filename = os.path.basename(link)
-            save_path = os.path.join(self.download_path, filename)
-
-            with httpx.stream("GET", link, follow_redirects=True) as response:
-                response.raise_for_status()
-                with open(save_path, "wb") as f:
-                    for chunk in response.iter_bytes():
-                        f.write(chunk)
-
-            return save_path
-
-        except httpx.RequestError as e:
-            logging.error(f"Error downloading {link}: {e}")
-            return None
-
+        return pdf_links
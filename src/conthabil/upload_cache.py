@@ -0,0 +1,113 @@
+"""
+Content-addressed cache of uploaded files, kept as JSON next to the downloads.
+
+It maps the SHA-256 of a file's content to the public URL the upload host
+returned for it, so a PDF uploaded by a previous run is not uploaded again.
+Entries are evicted in least-recently-used order beyond a maximum size, and
+expire after a maximum age, since the upload host only retains files for a
+limited time.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+
+UPLOAD_CACHE_FILENAME = "upload_cache.json"
+
+
+@dataclass
+class _Entry:
+    url: str
+    uploaded_at: float
+
+
+class UploadCache:
+    """
+    Thread-safe LRU mapping of content hashes to uploaded URLs, saved to disk
+    on every change.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, max_age: float | None = None):
+        """
+        Initializes the UploadCache, loading the existing file if any.
+
+        Args:
+            path: The path of the JSON cache file.
+            max_entries: Maximum number of cached URLs; the least recently
+                used ones are evicted first.
+            max_age: Seconds after which a cached URL is no longer trusted,
+                or None to keep them until evicted.
+        """
+
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._entries = OrderedDict(
+                    (sha256, _Entry(**entry)) for sha256, entry in json.load(f).items()
+                )
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable upload cache {path}: {e}")
+
+
+    def get(self, sha256: str) -> str | None:
+        """
+        Returns the URL a file with this content was uploaded to, or None if
+        absent or expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(sha256)
+            if entry is None:
+                return None
+
+            if self.max_age is not None and entry.uploaded_at + self.max_age <= time.time():
+                del self._entries[sha256]
+                self._save()
+                return None
+
+            self._entries.move_to_end(sha256)
+            return entry.url
+
+
+    def set(self, sha256: str, url: str) -> None:
+        """Records the URL a file with this content was uploaded to, and saves the cache."""
+
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[sha256] = _Entry(url=url, uploaded_at=time.time())
+            self._entries.move_to_end(sha256)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            self._save()
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+    def _save(self) -> None:
+        """Writes the cache atomically, in LRU order. Must be called with the lock held."""
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({sha256: asdict(entry) for sha256, entry in self._entries.items()}, f)
+
+        os.replace(tmp_path, self.path)
@@ -1,23 +1,105 @@
 import logging
 import os
 from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Self
 
 import httpx
 
+from conthabil.circuit_breaker import CircuitBreaker
+from conthabil.manifest import file_sha256
+from conthabil.ratelimit import RateLimiter
+from conthabil.upload_cache import UploadCache
+
 
 class Uploader:
     """
     Handles uploading files to a specified URL.
+
+    Every upload goes through a single pooled `httpx.Client`, which is
+    thread-safe, so concurrent uploads reuse kept-alive (and, with HTTP/2,
+    multiplexed) connections instead of paying a TCP and TLS handshake per file.
+    It can be used as a context manager to close the client when done.
     """
 
-    def __init__(self, upload_url: str):
+    def __init__(
+        self,
+        upload_url: str,
+        max_workers: int | None = None,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        cache: UploadCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
         """
         Initializes the Uploader.
 
         Args:
             upload_url: The target URL for file uploads.
+            max_workers: Number of upload threads. By default, the rate
+                limiter's maximum concurrency, so that its per-host limit is
+                what bounds the uploads in flight.
+            max_connections: Maximum number of open connections to the upload host.
+            max_keepalive_connections: Maximum number of idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Whether to negotiate HTTP/2 with servers that support it.
+            cache: Content-addressed cache of previous uploads, consulted
+                before uploading each file.
+            rate_limiter: Adaptive per-host rate limiter for the uploads.
+            circuit_breaker: Circuit breaker guarding the upload host.
+            transport: Transport of the HTTP client, replacing the network
+                (e.g. an `httpx.MockTransport`).
         """
         self.upload_url = upload_url
+        self.cache = cache
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_workers = max_workers or self.rate_limiter.max_concurrency
+        self.circuit_breaker = circuit_breaker or CircuitBreaker("upload host")
+
+        # Files skipped while the circuit was open, to be uploaded by a later run.
+        self.parked: list[str] = []
+
+        self.client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+
+
+    def __enter__(self) -> Self:
+        """
+        Enters the context manager.
+        """
+        return self
+
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """
+        Exits the context manager, closing the pooled HTTP client.
+        """
+
+        self.close()
+
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP client and its open connections.
+        """
+
+        self.client.close()
 
 
     def upload_files(self, file_paths: list[str]) -> list[str]:
@@ -33,7 +115,7 @@ class Uploader:
 
         logging.info(f"Starting concurrent upload of {len(file_paths)} files...")
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             results = list(executor.map(self._upload_file, file_paths))
 
         uploaded_urls = [url for url in results if url is not None]
@@ -45,7 +127,9 @@ class Uploader:
 
     def _upload_file(self, file_path: str) -> str | None:
         """
-        Uploads a single file using a multipart/form-data POST request.
+        Uploads a single file using a multipart/form-data POST request, unless
+        the upload cache already holds a URL for the same content. While the
+        upload host's circuit is open, the file is parked instead.
 
         Args:
             file_path: The local path of the file to upload.
@@ -57,18 +141,37 @@ class Uploader:
         try:
             file_name = os.path.basename(file_path)
 
-            with open(file_path, "rb") as f:
-                files = {"file": (file_name, f, "application/pdf")}
+            if self.cache is not None:
+                sha256 = file_sha256(file_path)
+                if cached_url := self.cache.get(sha256):
+                    logging.info(f"{file_name} was already uploaded to {cached_url}. Skipping upload.")
+                    return cached_url
+
+            if not self.circuit_breaker.allow():
+                logging.warning(f"Upload host is unavailable. Parking {file_name} for a later run.")
+                self.parked.append(file_path)
+                return None
 
-                with httpx.Client() as client:
-                    response = client.post(self.upload_url, files=files)
-                    response.raise_for_status()
+            with self.circuit_breaker.record_call():
+                response = self.rate_limiter.send(self.upload_url, lambda: self._post_file(file_path))
+                response.raise_for_status()
 
             url = response.text.strip()
 
+            if self.cache is not None:
+                self.cache.set(sha256, url)
+
             return url
 
-        except (httpx.RequestError, IOError) as e:
+        except (httpx.HTTPError, IOError) as e:
             logging.error(f"Error uploading {file_path}: {e}")
             return None
 
+
+    def _post_file(self, file_path: str) -> httpx.Response:
+        """Posts a file to the upload URL as multipart/form-data."""
+
+        with open(file_path, "rb") as f:
+            files = {"file": (os.path.basename(file_path), f, "application/pdf")}
+            return self.client.post(self.upload_url, files=files)
+
@@ -1,5 +1,10 @@
 import sys
 import os
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 """
 Add the project root to the Python path to allow imports from 'main' and 'src'.
@@ -7,3 +12,49 @@ Add the project root to the Python path to allow imports from 'main' and 'src'.
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
+
+
+SAMPLE_GAZETTE_PAYLOAD = {
+    "url": "http://example.com/gazette.pdf",
+    "publication_date": "2025-07-15",
+    "file_path": "/tmp/gazette.pdf",
+    "details": "Official Gazette from July"
+}
+
+
+def create_mock_gazette():
+    """Helper function to create a configured mock gazette object."""
+
+    gazette = MagicMock()
+    gazette.id = 1
+    gazette.url = SAMPLE_GAZETTE_PAYLOAD["url"]
+    gazette.publication_date = datetime.fromisoformat(SAMPLE_GAZETTE_PAYLOAD["publication_date"])
+    gazette.file_path = SAMPLE_GAZETTE_PAYLOAD["file_path"]
+    gazette.details = SAMPLE_GAZETTE_PAYLOAD["details"]
+    gazette.created_at = date.today()
+
+    return gazette
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Starts every test with an empty API response cache."""
+
+    from main import response_cache
+
+    response_cache.clear()
+    yield
+
+
+@pytest.fixture
+def gazette_stats():
+    """
+    Stubs the aggregate query validating listings (`get_gazettes_stats`) in
+    both crud modules, as a range holding the gazette of `create_mock_gazette`.
+    """
+
+    stats = SimpleNamespace(count=1, max_id=1, last_created_at=datetime(2025, 7, 15, 12, tzinfo=timezone.utc))
+
+    with patch("src.conthabil.crud.get_gazettes_stats", return_value=stats) as mock_stats, \
+            patch("src.conthabil.async_crud.get_gazettes_stats", AsyncMock(return_value=stats)):
+        yield mock_stats
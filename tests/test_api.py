@@ -1,33 +1,19 @@
-from unittest.mock import patch, ANY, MagicMock
-from datetime import date
+import json
+from unittest.mock import patch, ANY
+from datetime import datetime
 
+import pytest
 from fastapi.testclient import TestClient
 
-from main import app
+from conftest import SAMPLE_GAZETTE_PAYLOAD, create_mock_gazette
+from main import app, response_cache
+from src.conthabil import pagination
+from src.conthabil.config import get_settings
 
 client = TestClient(app)
 
-
-SAMPLE_GAZETTE_PAYLOAD = {
-    "url": "http://example.com/gazette.pdf",
-    "publication_date": "2025-07-15",
-    "file_path": "/tmp/gazette.pdf",
-    "details": "Official Gazette from July"
-}
-
-
-def create_mock_gazette():
-    """Helper function to create a configured mock gazette object."""
-
-    gazette = MagicMock()
-    gazette.id = 1
-    gazette.url = SAMPLE_GAZETTE_PAYLOAD["url"]
-    gazette.publication_date = date.fromisoformat(SAMPLE_GAZETTE_PAYLOAD["publication_date"])
-    gazette.file_path = SAMPLE_GAZETTE_PAYLOAD["file_path"]
-    gazette.details = SAMPLE_GAZETTE_PAYLOAD["details"]
-    gazette.created_at = date.today()
-
-    return gazette
+# The listings validate against an aggregate query, stubbed for every test.
+pytestmark = pytest.mark.usefixtures("gazette_stats")
 
 
 @patch('src.conthabil.crud.create_gazette')
@@ -37,7 +23,7 @@ def test_create_gazette_success(mock_create_gazette):
     """
 
     # Arrange
-    mock_create_gazette.return_value = create_mock_gazette()
+    mock_create_gazette.return_value = (create_mock_gazette(), True)
 
     # Act
     response = client.post("/api/gazettes/", json=SAMPLE_GAZETTE_PAYLOAD)
@@ -125,3 +111,382 @@ def test_read_gazettes_filter_error():
     assert response_year_only.status_code == 400
     assert response_year_only.json() == {"detail": "Both month and year must be provided for filtering."}
 
+
+
+@patch('src.conthabil.crud.create_gazettes')
+def test_create_gazettes_bulk(mock_create_gazettes):
+    """
+    Tests creating many gazettes through the bulk endpoint.
+    """
+
+    # Arrange
+    mock_create_gazettes.return_value = ([create_mock_gazette()], [create_mock_gazette()])
+    payload = [
+        {"url": SAMPLE_GAZETTE_PAYLOAD["url"], "publication_date": "2025-07-15"},
+        {"url": SAMPLE_GAZETTE_PAYLOAD["url"], "publication_date": "2025-07-15"},
+    ]
+
+    # Act
+    response = client.post("/api/gazettes/bulk", json=payload)
+
+    # Assert
+    assert response.status_code == 200
+    assert [g["id"] for g in response.json()] == [1]
+
+    mock_create_gazettes.assert_called_once_with(db=ANY, gazettes=ANY)
+    assert len(mock_create_gazettes.call_args.kwargs["gazettes"]) == 2
+
+
+def test_create_gazettes_bulk_bad_payload():
+    """
+    Tests that the bulk endpoint rejects a payload that is not a list of gazettes.
+    """
+
+    # Act
+    response = client.post("/api/gazettes/bulk", json=SAMPLE_GAZETTE_PAYLOAD)
+
+    # Assert
+    assert response.status_code == 422
+
+
+def test_create_gazettes_bulk_too_many_entries():
+    """
+    Tests that the bulk endpoint rejects more entries than API_BULK_CHUNK_SIZE.
+    """
+
+    # Arrange
+    payload = [
+        {"url": f"https://upload.example.com/{i}.pdf", "publication_date": "2025-07-15"}
+        for i in range(get_settings().API_BULK_CHUNK_SIZE + 1)
+    ]
+
+    # Act
+    response = client.post("/api/gazettes/bulk", json=payload)
+
+    # Assert
+    assert response.status_code == 422
+
+
+@patch('src.conthabil.crud.get_gazettes')
+def test_read_gazettes_returns_next_cursor(mock_get_gazettes):
+    """
+    Tests that a full page exposes the cursor for the next page.
+    """
+
+    # Arrange
+    mock_get_gazettes.return_value = [create_mock_gazette()]
+
+    # Act
+    response = client.get("/api/gazettes/?limit=1")
+
+    # Assert
+    assert response.status_code == 200
+    next_cursor = response.headers["X-Next-Cursor"]
+    assert pagination.decode_cursor(next_cursor) == (datetime(2025, 7, 15), 1)
+
+
+@patch('src.conthabil.crud.get_gazettes_after')
+def test_read_gazettes_with_cursor(mock_get_gazettes_after):
+    """
+    Tests retrieving the page following a cursor.
+    """
+
+    # Arrange
+    mock_get_gazettes_after.return_value = [create_mock_gazette()]
+    cursor = pagination.encode_cursor(create_mock_gazette())
+
+    # Act
+    response = client.get(f"/api/gazettes/?cursor={cursor}&limit=10")
+
+    # Assert
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+
+    mock_get_gazettes_after.assert_called_once_with(ANY, after=(datetime(2025, 7, 15), 1), limit=10)
+
+
+def test_read_gazettes_invalid_cursor():
+    """
+    Tests that a malformed cursor results in an error.
+    """
+
+    # Act
+    response = client.get("/api/gazettes/?cursor=not-a-cursor")
+
+    # Assert
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid pagination cursor."}
+
+
+@patch('src.conthabil.crud.get_gazettes_by_date_range')
+def test_read_gazettes_with_date_range(mock_get_by_date_range):
+    """
+    Tests retrieving gazettes published between two dates (both inclusive).
+    """
+
+    # Arrange
+    mock_get_by_date_range.return_value = [create_mock_gazette()]
+
+    # Act
+    response = client.get("/api/gazettes/?date_from=2025-07-01&date_to=2025-07-31")
+
+    # Assert
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    mock_get_by_date_range.assert_called_once_with(
+        ANY, start=datetime(2025, 7, 1), end=datetime(2025, 8, 1), skip=0, limit=100
+    )
+
+
+@patch('src.conthabil.crud.get_gazettes_by_date_range')
+def test_read_gazettes_date_range_up_to_last_day(mock_get_by_date_range):
+    """
+    Tests that a range ending on the last representable day has no upper bound.
+    """
+
+    # Arrange
+    mock_get_by_date_range.return_value = [create_mock_gazette()]
+
+    # Act
+    response = client.get("/api/gazettes/?date_from=2025-07-01&date_to=9999-12-31")
+
+    # Assert
+    assert response.status_code == 200
+    mock_get_by_date_range.assert_called_once_with(
+        ANY, start=datetime(2025, 7, 1), end=None, skip=0, limit=100
+    )
+
+
+def test_read_gazettes_month_year_with_date_range():
+    """
+    Tests that combining the month and year filter with a date range is rejected.
+    """
+
+    # Act
+    response = client.get("/api/gazettes/?month=7&year=2025&date_from=2025-01-01")
+
+    # Assert
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "Filter either by month and year or by date range, not both."
+    }
+
+
+@patch('src.conthabil.crud.get_gazettes_by_date_range')
+def test_read_gazettes_date_range_is_paginated(mock_get_by_date_range):
+    """
+    Tests that a date range is limited like the unfiltered listing, and can
+    be walked with the X-Next-Cursor header.
+    """
+
+    # Arrange
+    mock_get_by_date_range.return_value = [create_mock_gazette()]
+
+    # Act
+    response = client.get("/api/gazettes/?date_from=2025-01-01&limit=1")
+    cursor = response.headers["X-Next-Cursor"]
+    client.get(f"/api/gazettes/?date_from=2025-01-01&limit=1&cursor={cursor}")
+
+    # Assert
+    assert mock_get_by_date_range.call_args_list[1].kwargs == {
+        "start": datetime(2025, 1, 1),
+        "end": None,
+        "after": (datetime(2025, 7, 15), 1),
+        "limit": 1,
+    }
+
+
+def test_read_db_pool_status():
+    """
+    Tests retrieving the database connection pool statistics.
+    """
+
+    # Act
+    response = client.get("/api/stats/db-pool")
+
+    # Assert
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["pool_class"] == "QueuePool"
+    assert response_data["size"] == 5
+    assert response_data["checkouts"] >= 0
+
+
+@patch('src.conthabil.crud.create_gazette')
+@patch('src.conthabil.crud.get_gazettes_by_month_year')
+def test_read_gazettes_served_from_cache(mock_get_by_month_year, mock_create_gazette):
+    """
+    Tests that repeated listings are served from the response cache until a
+    gazette is created in the month they cover.
+    """
+
+    # Arrange
+    mock_get_by_month_year.return_value = [create_mock_gazette()]
+    june = create_mock_gazette()
+    june.publication_date = datetime(2025, 6, 30)
+    mock_create_gazette.side_effect = [(june, True), (create_mock_gazette(), False), (create_mock_gazette(), True)]
+
+    # Act
+    first = client.get("/api/gazettes/?month=7&year=2025")
+    second = client.get("/api/gazettes/?month=7&year=2025")
+    client.post("/api/gazettes/", json={"url": "http://example.com/other.pdf", "publication_date": "2025-06-30"})
+    third = client.get("/api/gazettes/?month=7&year=2025")
+    client.post("/api/gazettes/", json=SAMPLE_GAZETTE_PAYLOAD)  # Already stored.
+    fourth = client.get("/api/gazettes/?month=7&year=2025")
+    client.post("/api/gazettes/", json=SAMPLE_GAZETTE_PAYLOAD)
+    fifth = client.get("/api/gazettes/?month=7&year=2025")
+
+    # Assert
+    assert first.json() == second.json() == third.json() == fourth.json() == fifth.json()
+    assert mock_get_by_month_year.call_count == 2
+
+    stats = client.get("/api/stats/response-cache").json()
+    assert (stats["hits"], stats["misses"]) == (3, 2)
+
+
+@patch('src.conthabil.crud.get_gazettes_by_month_year')
+def test_read_gazettes_not_modified(mock_get_by_month_year, gazette_stats):
+    """
+    Tests that a client sending back the ETag or Last-Modified of a listing
+    gets a 304 Not Modified, both from the cache and after it expired, in
+    which case only the aggregate query runs.
+    """
+
+    # Arrange
+    mock_get_by_month_year.return_value = [create_mock_gazette()]
+    first = client.get("/api/gazettes/?month=7&year=2025")
+    etag = first.headers["ETag"]
+    last_modified = first.headers["Last-Modified"]
+
+    # Act
+    cached = client.get("/api/gazettes/?month=7&year=2025", headers={"If-None-Match": etag})
+    response_cache.clear()
+    uncached = client.get("/api/gazettes/?month=7&year=2025", headers={"If-None-Match": etag})
+    since = client.get("/api/gazettes/?month=7&year=2025", headers={"If-Modified-Since": last_modified})
+    other = client.get("/api/gazettes/?month=8&year=2025", headers={"If-None-Match": etag})
+
+    # Assert
+    assert first.status_code == 200
+    assert cached.status_code == uncached.status_code == since.status_code == 304
+    assert cached.headers["ETag"] == uncached.headers["ETag"] == etag
+    assert cached.content == b""
+    assert other.status_code == 200
+    assert first.headers["Last-Modified"] == "Tue, 15 Jul 2025 12:00:00 GMT"
+
+    # The listing ran for the first and the last (other month) requests only.
+    assert mock_get_by_month_year.call_count == 2
+    gazette_stats.assert_any_call(ANY, datetime(2025, 7, 1), datetime(2025, 8, 1))
+
+
+@patch('src.conthabil.crud.get_gazettes_by_month_year')
+def test_read_gazettes_if_modified_since_odd_dates(mock_get_by_month_year):
+    """
+    Tests that an If-Modified-Since in the "-0000" zone is read as UTC and
+    that an unreadable one serves the listing instead of failing.
+    """
+
+    # Arrange
+    mock_get_by_month_year.return_value = [create_mock_gazette()]
+
+    # Act
+    older = client.get("/api/gazettes/?month=7&year=2025", headers={"If-Modified-Since": "Sun, 06 Nov 1994 08:49:37 -0000"})
+    newer = client.get("/api/gazettes/?month=7&year=2025", headers={"If-Modified-Since": "Wed, 16 Jul 2025 12:00:00 -0000"})
+    garbage = client.get("/api/gazettes/?month=7&year=2025", headers={"If-Modified-Since": "yesterday"})
+
+    # Assert
+    assert older.status_code == 200
+    assert newer.status_code == 304
+    assert garbage.status_code == 200
+
+
+@patch('src.conthabil.crud.iter_gazettes')
+def test_export_gazettes(mock_iter_gazettes):
+    """
+    Tests exporting the archive as NDJSON and CSV.
+    """
+
+    # Arrange
+    mock_iter_gazettes.side_effect = lambda db, batch_size: iter([create_mock_gazette(), create_mock_gazette()])
+
+    # Act
+    ndjson_response = client.get("/api/gazettes/export")
+    csv_response = client.get("/api/gazettes/export?format=csv")
+
+    # Assert
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["content-type"] == "application/x-ndjson"
+    lines = ndjson_response.text.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == {
+        "id": 1,
+        "url": SAMPLE_GAZETTE_PAYLOAD["url"],
+        "publication_date": f"{SAMPLE_GAZETTE_PAYLOAD['publication_date']}T00:00:00",
+    }
+
+    assert csv_response.status_code == 200
+    assert csv_response.headers["content-type"].startswith("text/csv")
+    assert csv_response.text.splitlines() == [
+        "id,url,publication_date",
+        f"1,{SAMPLE_GAZETTE_PAYLOAD['url']},{SAMPLE_GAZETTE_PAYLOAD['publication_date']}T00:00:00",
+        f"1,{SAMPLE_GAZETTE_PAYLOAD['url']},{SAMPLE_GAZETTE_PAYLOAD['publication_date']}T00:00:00",
+    ]
+
+
+def test_export_gazettes_bad_format():
+    """
+    Tests that an unknown export format is rejected.
+    """
+
+    # Act
+    response = client.get("/api/gazettes/export?format=xml")
+
+    # Assert
+    assert response.status_code == 422
+
+
+@patch('src.conthabil.crud.get_gazettes')
+def test_read_gazettes_compressed(mock_get_gazettes):
+    """
+    Tests that large listings are compressed with the negotiated encoding,
+    and small ones are sent as they are.
+    """
+
+    # Arrange
+    mock_get_gazettes.side_effect = lambda db, skip, limit: [create_mock_gazette()] * limit
+
+    # Act
+    brotli_response = client.get("/api/gazettes/?limit=50", headers={"Accept-Encoding": "gzip, br"})
+    gzip_response = client.get("/api/gazettes/?limit=50", headers={"Accept-Encoding": "gzip"})
+    identity_response = client.get("/api/gazettes/?limit=50", headers={"Accept-Encoding": "identity"})
+    small_response = client.get("/api/gazettes/?limit=1", headers={"Accept-Encoding": "gzip, br"})
+
+    # Assert
+    assert brotli_response.headers["content-encoding"] == "br"
+    assert gzip_response.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity_response.headers
+    assert "content-encoding" not in small_response.headers
+    assert brotli_response.json() == gzip_response.json() == identity_response.json()
+    assert len(brotli_response.json()) == 50
+    assert int(gzip_response.headers["content-length"]) < len(identity_response.content)
+    assert "Accept-Encoding" in brotli_response.headers["vary"]
+    assert brotli_response.headers["ETag"] == f"W/{identity_response.headers['ETag']}"
+
+
+@patch('src.conthabil.crud.iter_gazettes')
+def test_export_gazettes_compressed(mock_iter_gazettes):
+    """
+    Tests that streamed exports are compressed chunk by chunk.
+    """
+
+    # Arrange
+    mock_iter_gazettes.side_effect = lambda db, batch_size: iter([create_mock_gazette()] * 100)
+
+    # Act
+    response = client.get("/api/gazettes/export", headers={"Accept-Encoding": "gzip"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert len(response.text.splitlines()) == 100
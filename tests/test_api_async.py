@@ -0,0 +1,72 @@
+from unittest.mock import patch, ANY
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from conftest import SAMPLE_GAZETTE_PAYLOAD, create_mock_gazette
+from main import async_router
+from src.conthabil.database import get_async_db
+
+
+# The main app mounts the async routes only when DB_ASYNC is enabled, so
+# they are exercised through a dedicated app.
+app = FastAPI(root_path="/api")
+app.include_router(async_router)
+app.dependency_overrides[get_async_db] = lambda: None
+
+client = TestClient(app)
+
+# The listings validate against an aggregate query, stubbed for every test.
+pytestmark = pytest.mark.usefixtures("gazette_stats")
+
+
+@patch('src.conthabil.async_crud.create_gazette')
+def test_create_gazette_async(mock_create_gazette):
+    """
+    Tests successful creation of a gazette through the async route.
+    """
+
+    # Arrange
+    mock_create_gazette.return_value = (create_mock_gazette(), True)
+
+    # Act
+    response = client.post("/api/gazettes/", json=SAMPLE_GAZETTE_PAYLOAD)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["id"] == 1
+
+    mock_create_gazette.assert_awaited_once_with(db=ANY, gazette=ANY)
+
+
+@patch('src.conthabil.async_crud.get_gazettes_by_month_year')
+def test_read_gazettes_async_with_filter(mock_get_by_month_year):
+    """
+    Tests retrieving gazettes with month and year filters through the async route.
+    """
+
+    # Arrange
+    mock_get_by_month_year.return_value = [create_mock_gazette()]
+
+    # Act
+    response = client.get("/api/gazettes/?month=7&year=2025")
+
+    # Assert
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    mock_get_by_month_year.assert_awaited_once_with(ANY, month=7, year=2025)
+
+
+def test_read_gazettes_async_filter_error():
+    """
+    Tests that the async route validates filters like the sync one.
+    """
+
+    # Act
+    response = client.get("/api/gazettes/?month=7")
+
+    # Assert
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Both month and year must be provided for filtering."}
@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import httpx
+
+from src.conthabil.async_engine import AsyncEngine
+from src.conthabil.circuit_breaker import CircuitBreaker
+from src.conthabil.ratelimit import RateLimiter
+
+
+def create_mock_transport(requests):
+    """Helper function to create a transport emulating the gazette, upload and API hosts."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        if request.url.host == "dom.example.com":
+            return httpx.Response(200, content=b"%PDF-1.4 fake")
+        if request.url.host == "upload.example.com":
+            return httpx.Response(200, text="https://upload.example.com/abc.pdf\n")
+        return httpx.Response(200, json={"id": 1})
+
+    return httpx.MockTransport(handler)
+
+
+def test_async_engine_processes_every_file(tmp_path):
+    """
+    Tests that the async engine downloads, uploads and stores every link.
+    """
+
+    # Arrange
+    requests = []
+    links = [f"https://dom.example.com/DOM_202507{day:02d}.pdf" for day in range(1, 11)]
+    engine = AsyncEngine(
+        download_path=str(tmp_path),
+        upload_url="https://upload.example.com",
+        api_base_url="https://api.example.com/api",
+        host_limits={"dom.example.com": 2},
+        rate_limiter=RateLimiter(max_rate=1000, burst=100),
+        transport=create_mock_transport(requests),
+    )
+
+    async def run():
+        async with engine:
+            return await engine.run(links)
+
+    # Act
+    result = asyncio.run(run())
+
+    # Assert
+    assert (result.downloaded, result.uploaded, result.stored) == (10, 10, 10)
+    assert (tmp_path / "DOM_20250701.pdf").read_bytes() == b"%PDF-1.4 fake"
+
+    store_payloads = [json.loads(r.content) for r in requests if r.url.host == "api.example.com"]
+    assert {p["publication_date"] for p in store_payloads} == {
+        f"2025-07-{day:02d}T00:00:00" for day in range(1, 11)
+    }
+
+
+def test_async_engine_shares_rate_limiter_and_circuit_breakers(tmp_path):
+    """
+    Tests that the engine retries throttled requests through the rate limiter
+    and parks the uploads once the upload host's circuit opens.
+    """
+
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.host == "upload.example.com":
+            raise httpx.ConnectError("connection refused", request=request)
+        if sum(r.url.host == "dom.example.com" for r in requests) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, content=b"%PDF-1.4 fake")
+
+    links = [f"https://dom.example.com/DOM_202507{day:02d}.pdf" for day in range(1, 6)]
+    rate_limiter = RateLimiter(backoff_base=0.01)
+    engine = AsyncEngine(
+        download_path=str(tmp_path),
+        upload_url="https://upload.example.com",
+        api_base_url="https://api.example.com/api",
+        host_limits={"upload.example.com": 1},
+        rate_limiter=rate_limiter,
+        upload_circuit_breaker=CircuitBreaker("upload host", failure_threshold=2),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        async with engine:
+            return await engine.run(links)
+
+    # Act
+    result = asyncio.run(run())
+
+    # Assert
+    assert (result.downloaded, result.uploaded, result.stored) == (5, 0, 0)
+    assert sum(r.url.host == "dom.example.com" for r in requests) == 6
+    assert sum(r.url.host == "upload.example.com" for r in requests) == 2
+    assert len(engine.parked_uploads) == 3
+
+
+def test_async_engine_download_gives_up_restarting(tmp_path):
+    """
+    Tests that an async download written in several chunks completes, and
+    that a server rejecting every request with a 416 makes a download start
+    over once, then fail instead of retrying forever.
+    """
+
+    # Arrange
+    content = b"%PDF-1.4 " + b"x" * (3 * 256 * 1024)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/DOM_20250701.pdf":
+            return httpx.Response(200, content=content)
+        return httpx.Response(416)
+
+    (tmp_path / "DOM_20250702.pdf.part").write_bytes(b"%PDF-1.4 old")
+    (tmp_path / "DOM_20250702.pdf.part.validator").write_text('"v1"')
+    engine = AsyncEngine(
+        download_path=str(tmp_path),
+        upload_url="https://upload.example.com",
+        api_base_url="https://api.example.com/api",
+        rate_limiter=RateLimiter(max_rate=1000, burst=100),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        async with engine:
+            return await asyncio.gather(
+                engine.download_file("https://dom.example.com/DOM_20250701.pdf"),
+                engine.download_file("https://dom.example.com/DOM_20250702.pdf"),
+            )
+
+    # Act
+    downloaded, rejected = asyncio.run(run())
+
+    # Assert
+    assert downloaded == str(tmp_path / "DOM_20250701.pdf")
+    assert (tmp_path / "DOM_20250701.pdf").read_bytes() == content
+    assert rejected is None
+    assert [r.headers.get("Range") for r in requests if r.url.path == "/DOM_20250702.pdf"] == [
+        "bytes=12-", None
+    ]
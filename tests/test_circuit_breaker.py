@@ -0,0 +1,144 @@
+import time
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src.conthabil.api_client import ApiClient
+from src.conthabil.circuit_breaker import CircuitBreaker, CircuitState
+from src.conthabil.uploader import Uploader
+
+
+def half_open_breaker(name: str) -> CircuitBreaker:
+    """Helper function to create a circuit breaker about to let a trial call through."""
+
+    breaker = CircuitBreaker(name, failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    return breaker
+
+
+def test_circuit_breaker_states():
+    """
+    Tests the closed -> open -> half-open -> closed/open transitions.
+    """
+
+    # Arrange
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+
+    # Act / Assert
+    breaker.record_failure()
+    assert breaker.allow() and breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow() and breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow()  # only one trial request
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED and breaker.failures == 0
+
+
+def test_uploader_parks_files_while_circuit_is_open(tmp_path):
+    """
+    Tests that once the upload host keeps failing, the remaining files are
+    parked without being sent.
+    """
+
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    file_paths = []
+    for day in range(1, 6):
+        path = tmp_path / f"DOM_202507{day:02d}.pdf"
+        path.write_bytes(f"%PDF {day}".encode())
+        file_paths.append(str(path))
+
+    uploader = Uploader(
+        upload_url="https://upload.example.com",
+        max_workers=1,
+        circuit_breaker=CircuitBreaker("upload host", failure_threshold=2),
+        transport=httpx.MockTransport(handler),
+    )
+
+    # Act
+    with uploader:
+        uploaded_urls = uploader.upload_files(file_paths)
+
+    # Assert
+    assert uploaded_urls == []
+    assert len(requests) == 2
+    assert uploader.parked == file_paths[2:]
+
+
+def test_local_errors_release_the_half_open_trial(tmp_path):
+    """
+    Tests that a trial call failing for a reason unrelated to the service
+    (an unreadable file, an unexpected exception) lets the next call try again.
+    """
+
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("unexpected")
+
+    uploader = Uploader(
+        upload_url="https://upload.example.com",
+        circuit_breaker=half_open_breaker("upload host"),
+        transport=httpx.MockTransport(handler),
+    )
+    api_client = ApiClient(
+        base_url="https://api.example.com/api",
+        circuit_breaker=half_open_breaker("gazette API"),
+        transport=httpx.MockTransport(handler),
+    )
+
+    # Act
+    with uploader, api_client:
+        uploaded_url = uploader._upload_file(str(tmp_path / "missing.pdf"))
+        with pytest.raises(RuntimeError):
+            api_client.store_gazette(datetime(2025, 7, 1), "https://upload.example.com/a.pdf")
+
+    # Assert
+    assert uploaded_url is None
+    for breaker in (uploader.circuit_breaker, api_client.circuit_breaker):
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow()
+
+
+def test_unreadable_bulk_response_parks_the_chunk():
+    """
+    Tests that a bulk chunk whose response body is not JSON is parked, while
+    the other chunks are still stored.
+    """
+
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b"a.pdf" in request.content:
+            return httpx.Response(200, text="<html>proxy error</html>")
+        return httpx.Response(200, json=[{"id": 2}])
+
+    gazettes = [
+        (datetime(2025, 7, 1), "https://upload.example.com/a.pdf"),
+        (datetime(2025, 7, 2), "https://upload.example.com/b.pdf"),
+    ]
+
+    # Act
+    with ApiClient(
+        base_url="https://api.example.com/api", bulk_chunk_size=1, transport=httpx.MockTransport(handler)
+    ) as api_client:
+        stored = api_client.store_gazettes(gazettes)
+
+    # Assert
+    assert stored == 1
+    assert api_client.parked == gazettes[:1]
@@ -0,0 +1,231 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.conthabil import async_crud, crud
+from src.conthabil.schemas import GazetteCreate
+
+
+@pytest.fixture
+def db():
+    """Provides a session bound to a fresh in-memory SQLite database."""
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    crud.Gazette.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def make_gazette(day: int) -> GazetteCreate:
+    """Helper function to build a gazette published on the given day of July 2025."""
+
+    return GazetteCreate(
+        url=f"http://example.com/DOM_202507{day:02d}.pdf",
+        publication_date=datetime(2025, 7, day),
+    )
+
+
+def test_create_gazettes_returns_created_and_existing(db):
+    """
+    Tests that a bulk insert creates new rows and returns already existing ones.
+    """
+
+    # Arrange
+    crud.create_gazettes(db, [make_gazette(1)])
+
+    # Act
+    rows, created = crud.create_gazettes(db, [make_gazette(1), make_gazette(2), make_gazette(2)])
+
+    # Assert
+    assert [row.url for row in rows] == [make_gazette(day).url for day in (1, 2, 2)]
+    assert [row.url for row in created] == [make_gazette(2).url]
+    assert len(crud.get_gazettes(db)) == 2
+
+
+def test_create_gazette_is_idempotent(db):
+    """
+    Tests that creating a gazette twice returns the same entry without duplicating it.
+    """
+
+    # Act
+    created, was_created = crud.create_gazette(db, make_gazette(1))
+    existing, was_created_again = crud.create_gazette(db, make_gazette(1))
+
+    # Assert
+    assert created.id == existing.id
+    assert (was_created, was_created_again) == (True, False)
+    assert created.publication_date == datetime(2025, 7, 1)
+    assert len(crud.get_gazettes(db)) == 1
+
+
+def test_create_gazette_fallback_without_on_conflict(db, monkeypatch):
+    """
+    Tests the fallback path used by dialects without ON CONFLICT support.
+    """
+
+    # Arrange
+    monkeypatch.setattr(crud, "upsert_gazettes_statement", lambda dialect, gazettes: None)
+
+    # Act
+    created, _ = crud.create_gazette(db, make_gazette(1))
+    existing, was_created = crud.create_gazette(db, make_gazette(1))
+
+    # Assert
+    assert created.id == existing.id
+    assert not was_created
+    assert len(crud.get_gazettes(db)) == 1
+
+
+def test_create_gazettes_fallback_commits_once_in_request_order(db, monkeypatch):
+    """
+    Tests that the fallback bulk path inserts every row in a single
+    transaction and returns the rows in the order of the request.
+    """
+
+    # Arrange
+    monkeypatch.setattr(crud, "upsert_gazettes_statement", lambda dialect, gazettes: None)
+    existing, _ = crud.create_gazette(db, make_gazette(2))
+    commit = MagicMock(wraps=db.commit)
+    monkeypatch.setattr(db, "commit", commit)
+
+    # Act
+    rows, created = crud.create_gazettes(db, [make_gazette(3), make_gazette(2), make_gazette(1), make_gazette(3)])
+
+    # Assert
+    assert [row.publication_date.day for row in rows] == [3, 2, 1, 3]
+    assert rows[1].id == existing.id
+    assert rows[0].id == rows[3].id
+    assert [row.publication_date.day for row in created] == [3, 1]
+    assert commit.call_count == 1
+    assert len(crud.get_gazettes(db)) == 3
+
+
+def test_get_gazettes_after_walks_pages_in_order(db):
+    """
+    Tests that keyset pagination walks every entry exactly once, in order.
+    """
+
+    # Arrange
+    crud.create_gazettes(db, [make_gazette(day) for day in (5, 1, 3, 2, 4)])
+
+    # Act
+    first_page = crud.get_gazettes(db, limit=2)
+    last = first_page[-1]
+    second_page = crud.get_gazettes_after(db, after=(last.publication_date, last.id), limit=10)
+
+    # Assert
+    days = [g.publication_date.day for g in [*first_page, *second_page]]
+    assert days == [1, 2, 3, 4, 5]
+
+
+def test_get_gazettes_by_month_year_uses_half_open_range(db):
+    """
+    Tests that the month filter includes the whole month and nothing past it.
+    """
+
+    # Arrange
+    crud.create_gazettes(db, [
+        GazetteCreate(url="http://example.com/june.pdf", publication_date=datetime(2025, 6, 30, 23, 59)),
+        GazetteCreate(url="http://example.com/july.pdf", publication_date=datetime(2025, 7, 31, 23, 59)),
+        GazetteCreate(url="http://example.com/august.pdf", publication_date=datetime(2025, 8, 1)),
+    ])
+
+    # Act
+    gazettes = crud.get_gazettes_by_month_year(db, month=7, year=2025)
+
+    # Assert
+    assert [g.url for g in gazettes] == ["http://example.com/july.pdf"]
+
+
+def test_get_gazettes_by_date_range_paginates_with_keyset(db):
+    """
+    Tests that a date range is limited, and that its pages follow the cursor.
+    """
+
+    # Arrange
+    crud.create_gazettes(db, [make_gazette(day) for day in range(1, 8)])
+    start, end = datetime(2025, 7, 2), datetime(2025, 7, 7)
+
+    # Act
+    first_page = crud.get_gazettes_by_date_range(db, start=start, end=end, limit=3)
+    last = first_page[-1]
+    second_page = crud.get_gazettes_by_date_range(
+        db, start=start, end=end, limit=3, after=(last.publication_date, last.id)
+    )
+
+    # Assert
+    assert [g.publication_date.day for g in first_page] == [2, 3, 4]
+    assert [g.publication_date.day for g in second_page] == [5, 6]
+
+
+def test_get_gazettes_stats_aggregates_range(db):
+    """
+    Tests the aggregate query validating the listings of a date range.
+    """
+
+    # Arrange
+    crud.create_gazettes(db, [make_gazette(day) for day in (1, 2, 3)])
+
+    # Act
+    stats = crud.get_gazettes_stats(db, start=datetime(2025, 7, 2), end=datetime(2025, 8, 1))
+    empty = crud.get_gazettes_stats(db, start=datetime(2025, 8, 1))
+
+    # Assert
+    assert (stats.count, stats.max_id) == (2, 3)
+    assert stats.last_created_at is not None
+    assert (empty.count, empty.max_id, empty.last_created_at) == (0, None, None)
+
+
+def test_async_crud_matches_sync_crud():
+    """
+    Tests the async create and listing functions against an in-memory SQLite database.
+    """
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(crud.Gazette.metadata.create_all)
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            created, _ = await async_crud.create_gazette(db, make_gazette(1))
+            existing, _ = await async_crud.create_gazette(db, make_gazette(1))
+            await async_crud.create_gazettes(db, [make_gazette(2), make_gazette(3)])
+            july = await async_crud.get_gazettes_by_month_year(db, month=7, year=2025)
+
+        await engine.dispose()
+        return created, existing, july
+
+    # Act
+    created, existing, july = asyncio.run(run())
+
+    # Assert
+    assert created.id == existing.id
+    assert [g.publication_date.day for g in july] == [1, 2, 3]
+
+
+def test_iter_gazettes_streams_whole_archive_in_order(db):
+    """
+    Tests that the export iterator yields every entry, in order, across batches.
+    """
+
+    # Arrange
+    crud.create_gazettes(db, [make_gazette(day) for day in (3, 1, 2)])
+
+    # Act
+    rows = list(crud.iter_gazettes(db, batch_size=2))
+
+    # Assert
+    assert [row.publication_date.day for row in rows] == [1, 2, 3]
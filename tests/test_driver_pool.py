@@ -0,0 +1,130 @@
+import itertools
+from unittest.mock import MagicMock, patch
+
+from selenium.common.exceptions import WebDriverException
+
+from src.conthabil import driver_pool as driver_pool_module
+from src.conthabil.driver_pool import BLOCKED_URL_PATTERNS, DriverPool, create_remote_driver
+from src.conthabil.scraper import Scraper
+
+
+def make_driver_factory():
+    """Returns a create_remote_driver replacement building mock sessions."""
+
+    session_ids = itertools.count(1)
+
+    def create_remote_driver(selenium_url, profile="default"):
+        driver = MagicMock()
+        driver.session_id = f"session-{next(session_ids)}"
+        driver.window_handles = ["main"]
+        return driver
+
+    return create_remote_driver
+
+
+def test_pool_reuses_and_resets_sessions():
+    """
+    Tests that a returned session is reset and handed out again, instead of
+    a new browser session being opened.
+    """
+
+    # Arrange
+    pool = DriverPool(selenium_url="http://selenium", size=1, max_uses=5)
+
+    with patch.object(driver_pool_module, "create_remote_driver", side_effect=make_driver_factory()) as mock_create:
+        # Act
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+    # Assert
+    assert second is first
+    assert mock_create.call_count == 1
+    first.delete_all_cookies.assert_called_once()
+    first.get.assert_called_once_with("about:blank")
+    first.quit.assert_not_called()
+
+
+def test_pool_replaces_unhealthy_and_worn_out_sessions():
+    """
+    Tests that an idle session that stopped answering is discarded, and that
+    a session is closed once it reached its maximum number of uses.
+    """
+
+    # Arrange
+    pool = DriverPool(selenium_url="http://selenium", size=1, max_uses=2)
+
+    with patch.object(driver_pool_module, "create_remote_driver", side_effect=make_driver_factory()):
+        pool.warm()
+        dead = pool.acquire()
+        pool.release(dead)
+        dead.execute_script.side_effect = WebDriverException("session deleted")
+
+        # Act
+        fresh = pool.acquire()
+        pool.release(fresh)
+        reused = pool.acquire()
+        pool.release(reused)
+
+    # Assert
+    assert fresh is not dead
+    dead.quit.assert_called_once()
+    assert reused is fresh
+    fresh.quit.assert_called_once()
+    assert len(pool) == 0
+
+
+def test_scraper_borrows_session_from_pool(tmp_path):
+    """
+    Tests that a scraper given a pool borrows its session instead of opening
+    one, and gives it back instead of closing it.
+    """
+
+    # Arrange
+    driver = MagicMock()
+    pool = MagicMock()
+    pool.acquire.return_value = driver
+
+    # Act
+    with Scraper(selenium_url="http://selenium", download_path=str(tmp_path), driver_pool=pool) as scraper:
+        borrowed = scraper.driver
+
+    # Assert
+    assert borrowed is driver
+    pool.release.assert_called_once_with(driver)
+    driver.quit.assert_not_called()
+
+
+def test_performance_profile_is_headless_and_blocks_assets():
+    """
+    Tests that the performance profile opens a headless, eager-loading Chrome
+    and blocks images, stylesheets and fonts through DevTools, while the
+    default profile keeps a regular Chrome.
+    """
+
+    # Arrange
+    drivers = []
+
+    def remote(command_executor, options):
+        driver = MagicMock(options=options)
+        drivers.append(driver)
+        return driver
+
+    # Act
+    with patch.object(driver_pool_module.webdriver, "Remote", side_effect=remote):
+        default = create_remote_driver("http://selenium:4444/wd/hub")
+        performance = create_remote_driver("http://selenium:4444/wd/hub", "performance")
+
+    # Assert
+    assert default.options.arguments == []
+    assert default.options.page_load_strategy == "normal"
+    default.execute.assert_not_called()
+
+    assert "--headless=new" in performance.options.arguments
+    assert "--disable-extensions" in performance.options.arguments
+    assert "--window-size=1024,768" in performance.options.arguments
+    assert performance.options.page_load_strategy == "eager"
+    performance.execute.assert_any_call(
+        "executeCdpCommand",
+        {"cmd": "Network.setBlockedURLs", "params": {"urls": BLOCKED_URL_PATTERNS}},
+    )
@@ -0,0 +1,74 @@
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+import httpx
+
+from src.conthabil.http_scraper import HttpScraper
+from src.conthabil.results_table import parse_pdf_links
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+TARGET_URL = "https://www.natal.rn.gov.br/dom"
+
+
+def test_parse_pdf_links():
+    """
+    Tests that only the links of the results table body are extracted, as
+    absolute URLs.
+    """
+
+    html = (
+        '<a href="/outside.pdf">x</a>'
+        '<table id="example"><tbody><tr><td><a href="/a.pdf">a</a></td></tr></tbody>'
+        '<tfoot><tr><td><a href="/footer">f</a></td></tr></tfoot></table>'
+    )
+
+    assert parse_pdf_links(html, TARGET_URL) == ["https://www.natal.rn.gov.br/a.pdf"]
+
+
+@patch("src.conthabil.http_scraper.previous_month", return_value=("07", "2025"))
+def test_find_pdf_links_replays_search_request(mock_previous_month, tmp_path):
+    """
+    Tests that the search form's AJAX request is replayed over HTTP and the
+    links of the returned table are collected.
+    """
+
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, text=(FIXTURES / "dom_search_page.html").read_text())
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "application/json"},
+            content=(FIXTURES / "dom_search_response.json").read_bytes(),
+        )
+
+    scraper = HttpScraper(download_path=str(tmp_path), transport=httpx.MockTransport(handler))
+
+    # Act
+    with scraper:
+        links = scraper.find_pdf_links(TARGET_URL)
+
+    # Assert
+    assert links == [
+        "https://www.natal.rn.gov.br/storage/app/media/DOM/anexos/dom_20250701_5981.pdf",
+        "https://www.natal.rn.gov.br/storage/app/media/DOM/anexos/dom_20250702_5982.pdf",
+        "https://www.natal.rn.gov.br/storage/app/media/DOM/anexos/dom_20250703_5983.pdf",
+        "https://www.natal.rn.gov.br/storage/app/media/DOM/anexos/dom_20250703_5983_extra.pdf",
+    ]
+
+    search = requests[1]
+    assert search.method == "POST" and str(search.url) == TARGET_URL
+    assert search.headers["X-OCTOBER-REQUEST-HANDLER"] == "onTest"
+    assert search.headers["X-OCTOBER-REQUEST-PARTIALS"] == "dom/resultado"
+    assert search.headers["X-CSRF-TOKEN"] == "n2PqzUxl0kqLbgk3T5o4yR1eVhO9mFjGwAtD6cI8"
+    assert parse_qs(search.content.decode()) == {
+        "_session_key": ["Wm9kJ8cLr2NqT1bYxVf3"],
+        "_token": ["n2PqzUxl0kqLbgk3T5o4yR1eVhO9mFjGwAtD6cI8"],
+        "mes": ["07"],
+        "ano": ["2025"],
+    }
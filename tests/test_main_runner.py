@@ -0,0 +1,196 @@
+import json
+import threading
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.conthabil import main_runner
+from src.conthabil.api_client import ApiClient
+from src.conthabil.parked import ParkedWork
+from src.conthabil.scraper import month_span
+from src.conthabil.uploader import Uploader
+
+
+def test_month_span():
+    """
+    Tests listing the months of a backfill range, across a year boundary.
+    """
+
+    assert month_span(date(2024, 11, 1), date(2025, 2, 1)) == [
+        ("11", "2024"), ("12", "2024"), ("01", "2025"), ("02", "2025"),
+    ]
+
+
+def test_main_parses_backfill_range():
+    """
+    Tests that --from/--to are turned into the list of months to backfill.
+    """
+
+    with patch.object(main_runner, "run_full_workflow") as mock_run:
+        main_runner.main(["--from", "2024-12", "--to", "2025-01"])
+
+    mock_run.assert_called_once_with([("12", "2024"), ("01", "2025")])
+
+    with pytest.raises(SystemExit):
+        main_runner.main(["--from", "2025-02", "--to", "2025-01"])
+
+
+def test_find_backfill_links_spreads_months_over_sessions():
+    """
+    Tests that the months are searched in parallel sessions, each opening a
+    single scraper, and that the links found are merged without duplicates.
+    """
+
+    # Arrange
+    settings = MagicMock(BACKFILL_SESSIONS=2, TARGET_URL="https://dom.example.com")
+    months = month_span(date(2025, 1, 1), date(2025, 4, 1))
+    searched = {}
+    lock = threading.Lock()
+
+    def create_scraper(settings, rate_limiter):
+        scraper = MagicMock()
+        scraper.__enter__.return_value = scraper
+
+        def find_pdf_links(target_url, month, year):
+            with lock:
+                searched.setdefault(id(scraper), []).append((month, year))
+            return [f"https://dom.example.com/{year}{month}.pdf", "https://dom.example.com/shared.pdf"]
+
+        scraper.find_pdf_links.side_effect = find_pdf_links
+        return scraper
+
+    # Act
+    with patch.object(main_runner, "_create_scraper", side_effect=create_scraper):
+        links = main_runner._find_backfill_links(settings, MagicMock(), months)
+
+    # Assert
+    assert sorted(searched.values()) == [
+        [("01", "2025"), ("03", "2025")],
+        [("02", "2025"), ("04", "2025")],
+    ]
+    assert sorted(links) == sorted(
+        [f"https://dom.example.com/2025{m:02d}.pdf" for m in range(1, 5)]
+        + ["https://dom.example.com/shared.pdf"]
+    )
+
+
+def test_scheduler_reuses_driver_pool_between_runs():
+    """
+    Tests that --interval runs the workflow repeatedly with the same driver
+    pool, keeping it alive between runs and closing it when stopped.
+    """
+
+    # Arrange
+    settings = MagicMock(SCRAPER_BACKEND="selenium", DRIVER_POOL_KEEPALIVE=120.0)
+    pools = []
+    sleeps = []
+    clock = [0.0]
+
+    def create_pool(**kwargs):
+        pool = MagicMock()
+        pools.append(pool)
+        return pool
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+        if clock[0] >= 120:
+            raise KeyboardInterrupt
+
+    # Act
+    with patch.object(main_runner, "get_settings", return_value=settings), \
+            patch.object(main_runner, "setup_logging"), \
+            patch.object(main_runner, "DriverPool", side_effect=create_pool), \
+            patch.object(main_runner, "run_full_workflow") as mock_run, \
+            patch.object(main_runner.time, "sleep", side_effect=sleep), \
+            patch.object(main_runner.time, "monotonic", side_effect=lambda: clock[0]):
+        main_runner.main(["--interval", "1"])
+
+    # Assert
+    [pool] = pools
+    assert mock_run.call_count == 2
+    assert all(call.kwargs["driver_pool"] is pool for call in mock_run.call_args_list)
+    assert sleeps == [60.0, 60.0]
+    assert pool.keep_alive.call_count == 2
+    pool.close.assert_called_once()
+
+
+def test_parked_work_is_retried_by_the_next_run(tmp_path):
+    """
+    Tests that the work parked while a circuit was open is saved to disk,
+    then uploaded and stored by the next run, which clears it.
+    """
+
+    # Arrange
+    settings = MagicMock(DOWNLOAD_PATH=str(tmp_path))
+    file_path = tmp_path / "DOM_20250702.pdf"
+    file_path.write_bytes(b"%PDF-1.4 fake")
+    stored_payloads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "upload.example.com":
+            return httpx.Response(200, text="https://upload.example.com/b.pdf")
+        stored_payloads.extend(json.loads(request.content))
+        return httpx.Response(201, json=json.loads(request.content))
+
+    def create_uploader(settings, rate_limiter):
+        return Uploader(upload_url="https://upload.example.com", transport=httpx.MockTransport(handler))
+
+    def create_api_client(settings, rate_limiter):
+        return ApiClient(base_url="https://api.example.com/api", transport=httpx.MockTransport(handler))
+
+    # Act
+    main_runner._save_parked(
+        settings,
+        [str(file_path)],
+        [(datetime(2025, 7, 1), "https://upload.example.com/a.pdf")],
+    )
+    saved = (tmp_path / "parked.json").exists()
+
+    with patch.object(main_runner, "_create_uploader", side_effect=create_uploader), \
+            patch.object(main_runner, "_create_api_client", side_effect=create_api_client):
+        main_runner.retry_parked_work(settings, MagicMock())
+
+    # Assert
+    assert saved
+    assert stored_payloads == [
+        {"url": "https://upload.example.com/a.pdf", "publication_date": "2025-07-01T00:00:00"},
+        {"url": "https://upload.example.com/b.pdf", "publication_date": "2025-07-02T00:00:00"},
+    ]
+    assert not (tmp_path / "parked.json").exists()
+
+
+def test_parked_work_failing_again_stays_parked(tmp_path):
+    """
+    Tests that parked work whose retry fails, without the circuits opening,
+    is kept for the following run instead of being dropped.
+    """
+
+    # Arrange
+    settings = MagicMock(DOWNLOAD_PATH=str(tmp_path))
+    file_path = tmp_path / "DOM_20250702.pdf"
+    file_path.write_bytes(b"%PDF-1.4 fake")
+    gazette = (datetime(2025, 7, 1), "https://upload.example.com/a.pdf")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500)
+
+    def create_uploader(settings, rate_limiter):
+        return Uploader(upload_url="https://upload.example.com", transport=httpx.MockTransport(handler))
+
+    def create_api_client(settings, rate_limiter):
+        return ApiClient(base_url="https://api.example.com/api", transport=httpx.MockTransport(handler))
+
+    main_runner._save_parked(settings, [str(file_path)], [gazette])
+
+    # Act
+    with patch.object(main_runner, "_create_uploader", side_effect=create_uploader), \
+            patch.object(main_runner, "_create_api_client", side_effect=create_api_client):
+        main_runner.retry_parked_work(settings, MagicMock())
+
+    # Assert
+    parked = ParkedWork(str(tmp_path / "parked.json"))
+    assert parked.uploads == [str(file_path)]
+    assert parked.gazettes == [gazette]
@@ -0,0 +1,71 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.conthabil.pipeline import Pipeline, parse_publication_date
+
+
+def create_mock_stages():
+    """Helper function to create mocked scraper, uploader and api client stages."""
+
+    scraper = MagicMock()
+    scraper._download_file.side_effect = lambda link: f"/tmp/{link.rsplit('/', 1)[-1]}"
+
+    uploader = MagicMock()
+    uploader._upload_file.side_effect = lambda path: f"https://0x0.st/{path.rsplit('/', 1)[-1]}"
+
+    api_client = MagicMock()
+    api_client.store_gazette.return_value = True
+
+    return scraper, uploader, api_client
+
+
+def test_parse_publication_date():
+    """
+    Tests extracting the publication date from a gazette filename.
+    """
+
+    assert parse_publication_date("/tmp/DOM_20250715.pdf") == datetime(2025, 7, 15)
+
+    with pytest.raises(ValueError):
+        parse_publication_date("/tmp/no-date.pdf")
+
+
+def test_pipeline_processes_every_file():
+    """
+    Tests that every link flows through download, upload and store.
+    """
+
+    # Arrange
+    links = [f"https://example.com/DOM_202507{day:02d}.pdf" for day in range(1, 31)]
+    scraper, uploader, api_client = create_mock_stages()
+    pipeline = Pipeline(scraper, uploader, api_client, queue_size=2)
+
+    # Act
+    result = pipeline.run(links)
+
+    # Assert
+    assert (result.downloaded, result.uploaded, result.stored) == (30, 30, 30)
+    stored_urls = {call.kwargs["uploaded_url"] for call in api_client.store_gazette.call_args_list}
+    assert stored_urls == {f"https://0x0.st/DOM_202507{day:02d}.pdf" for day in range(1, 31)}
+
+
+def test_pipeline_skips_failed_files():
+    """
+    Tests that a file failing one stage is not passed on to the next ones.
+    """
+
+    # Arrange
+    links = ["https://example.com/DOM_20250701.pdf", "https://example.com/DOM_20250702.pdf"]
+    scraper, uploader, api_client = create_mock_stages()
+    uploader._upload_file.side_effect = lambda path: None if "0701" in path else "https://0x0.st/ok.pdf"
+
+    # Act
+    result = Pipeline(scraper, uploader, api_client).run(links)
+
+    # Assert
+    assert (result.downloaded, result.uploaded, result.stored) == (2, 1, 1)
+    api_client.store_gazette.assert_called_once_with(
+        publication_date=datetime(2025, 7, 2), uploaded_url="https://0x0.st/ok.pdf"
+    )
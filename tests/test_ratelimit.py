@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.conthabil.ratelimit import RateLimiter, parse_retry_after
+
+
+def test_send_retries_throttled_requests():
+    """
+    Tests that throttled requests are retried until the server accepts them,
+    and that the host's concurrency is halved on throttling and grows back
+    on success.
+    """
+
+    # Arrange
+    statuses = iter([429, 503, 200])
+    limiter = RateLimiter(max_rate=1000, burst=10, initial_concurrency=4, backoff_base=0.01)
+    host = limiter._host("https://upload.example.com")
+
+    def request() -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "0"})
+
+    # Act
+    response = limiter.send("https://upload.example.com/file", request)
+
+    # Assert
+    assert response.status_code == 200
+    assert host.concurrency == 2  # 4 -> 2 -> 1 on throttling, +1 per window on success
+    assert limiter._host("https://other.example.com").concurrency == 4
+
+
+def test_send_gives_up_after_max_retries():
+    """
+    Tests that the last throttled response is returned once the retries are exhausted.
+    """
+
+    # Arrange
+    calls = []
+    limiter = RateLimiter(max_rate=1000, max_retries=2, backoff_base=0.01)
+
+    def request() -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(429)
+
+    # Act
+    response = limiter.send("https://upload.example.com/file", request)
+
+    # Assert
+    assert response.status_code == 429
+    assert len(calls) == 3
+
+
+def test_parse_retry_after():
+    """
+    Tests parsing Retry-After given as seconds or as an HTTP date.
+    """
+
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "12"})) == 12
+    assert 25 < parse_retry_after(httpx.Response(429, headers={"Retry-After": retry_at})) <= 30
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+    assert parse_retry_after(httpx.Response(429)) is None
+
+
+def test_cancelled_asend_frees_its_slot():
+    """
+    Tests that an async request cancelled while waiting for a slot does not
+    take one later, so the host keeps serving requests.
+    """
+
+    # Arrange
+    limiter = RateLimiter(max_rate=1000, burst=10, initial_concurrency=1, max_concurrency=1)
+    host = limiter._host("https://upload.example.com")
+
+    async def request() -> httpx.Response:
+        return httpx.Response(200)
+
+    async def run():
+        host.acquire()  # The only slot is busy.
+        waiting = asyncio.create_task(limiter.asend("https://upload.example.com/a", request))
+        await asyncio.sleep(0.05)
+        waiting.cancel()
+        host.release()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        return await asyncio.wait_for(limiter.asend("https://upload.example.com/b", request), 1)
+
+    # Act
+    response = asyncio.run(run())
+
+    # Assert
+    assert response.status_code == 200
+    assert host.in_flight == 0
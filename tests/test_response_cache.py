@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from src.conthabil.response_cache import CachedResponse, ResponseCache
+
+
+JULY = (datetime(2025, 7, 1), datetime(2025, 8, 1))
+
+
+def test_set_drops_response_read_before_a_write_in_its_range():
+    """
+    Tests that a response queried before a write within its date range is
+    not cached afterwards, while a write elsewhere does not prevent caching.
+    """
+
+    # Arrange
+    cache = ResponseCache()
+
+    # Act
+    generation = cache.generation()
+    cache.invalidate([datetime(2025, 7, 15)])  # Committed while the reader was querying.
+    cache.set("july", CachedResponse(body=b"[]"), *JULY, generation=generation)
+
+    generation = cache.generation()
+    cache.invalidate([datetime(2025, 6, 30)])
+    cache.set("july-again", CachedResponse(body=b"[]"), *JULY, generation=generation)
+
+    # Assert
+    assert cache.get("july") is None
+    assert cache.get("july-again") is not None
+
+
+def test_invalidate_without_dates_keeps_generation():
+    """
+    Tests that a write that created nothing neither drops entries nor
+    invalidates responses being queried.
+    """
+
+    # Arrange
+    cache = ResponseCache()
+    cache.set("july", CachedResponse(body=b"[]"), *JULY)
+    generation = cache.generation()
+
+    # Act
+    cache.invalidate([])
+
+    # Assert
+    assert cache.generation() == generation
+    assert cache.get("july") is not None
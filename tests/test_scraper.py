@@ -0,0 +1,233 @@
+import hashlib
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from src.conthabil.scraper import BaseScraper, Downloader, Scraper
+
+
+def test_download_file_uses_shared_client(tmp_path):
+    """
+    Tests that downloads go through the downloader's shared client, following
+    redirects, and that a failed download returns None.
+    """
+
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/old/DOM_20250701.pdf":
+            return httpx.Response(302, headers={"Location": "https://dom.example.com/DOM_20250701.pdf"})
+        if request.url.path == "/DOM_20250701.pdf":
+            return httpx.Response(200, content=b"%PDF-1.4 fake")
+        raise httpx.ConnectError("connection refused", request=request)
+
+    # Act
+    with Downloader(download_path=str(tmp_path), transport=httpx.MockTransport(handler)) as downloader:
+        downloaded = downloader._download_file("https://dom.example.com/old/DOM_20250701.pdf")
+        failed = downloader._download_file("https://dom.example.com/missing/DOM_20250702.pdf")
+
+    # Assert
+    assert downloaded == str(tmp_path / "DOM_20250701.pdf")
+    assert (tmp_path / "DOM_20250701.pdf").read_bytes() == b"%PDF-1.4 fake"
+    assert failed is None
+
+
+def test_download_file_resumes_partial_file(tmp_path):
+    """
+    Tests that a truncated download is kept as a partial file, then resumed
+    with a Range request guarded by If-Range and renamed once complete.
+    """
+
+    # Arrange
+    content = b"%PDF-1.4 " + b"x" * 100
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "Range" not in request.headers:
+            return httpx.Response(
+                200, headers={"ETag": '"v1"', "Content-Length": str(len(content))}, content=content[:40]
+            )
+        start = int(request.headers["Range"].removeprefix("bytes=").rstrip("-"))
+        return httpx.Response(
+            206,
+            headers={"ETag": '"v1"', "Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"},
+            content=content[start:],
+        )
+
+    link = "https://dom.example.com/DOM_20250701.pdf"
+
+    # Act
+    with Downloader(download_path=str(tmp_path), transport=httpx.MockTransport(handler)) as downloader:
+        truncated = downloader._download_file(link)
+        partial = (tmp_path / "DOM_20250701.pdf.part").read_bytes()
+        resumed = downloader._download_file(link)
+
+    # Assert
+    assert truncated is None
+    assert partial == content[:40]
+    assert requests[1].headers["Range"] == "bytes=40-"
+    assert requests[1].headers["If-Range"] == '"v1"'
+    assert resumed == str(tmp_path / "DOM_20250701.pdf")
+    assert (tmp_path / "DOM_20250701.pdf").read_bytes() == content
+    assert not (tmp_path / "DOM_20250701.pdf.part").exists()
+    assert not (tmp_path / "DOM_20250701.pdf.part.validator").exists()
+
+
+def test_download_file_restarts_changed_partial_file(tmp_path):
+    """
+    Tests that a partial file is rewritten from the start when the file
+    changed on the server, and that one without a validator is not resumed.
+    """
+
+    # Arrange
+    content = b"%PDF-1.4 new " + b"y" * 100
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Like a server honouring If-Range: the ETag changed, so the whole file is sent.
+        requests.append(request)
+        return httpx.Response(200, headers={"ETag": '"v2"'}, content=content)
+
+    (tmp_path / "DOM_20250701.pdf.part").write_bytes(b"%PDF-1.4 old " + b"x" * 27)
+    (tmp_path / "DOM_20250701.pdf.part.validator").write_text('"v1"')
+    (tmp_path / "DOM_20250702.pdf.part").write_bytes(b"%PDF-1.4 old " + b"x" * 27)
+
+    # Act
+    with Downloader(download_path=str(tmp_path), transport=httpx.MockTransport(handler)) as downloader:
+        changed = downloader._download_file("https://dom.example.com/DOM_20250701.pdf")
+        unvalidated = downloader._download_file("https://dom.example.com/DOM_20250702.pdf")
+
+    # Assert
+    assert requests[0].headers["Range"] == "bytes=40-"
+    assert requests[0].headers["If-Range"] == '"v1"'
+    assert "Range" not in requests[1].headers
+    assert changed == str(tmp_path / "DOM_20250701.pdf")
+    assert (tmp_path / "DOM_20250701.pdf").read_bytes() == content
+    assert unvalidated == str(tmp_path / "DOM_20250702.pdf")
+    assert (tmp_path / "DOM_20250702.pdf").read_bytes() == content
+
+
+def test_download_file_gives_up_restarting(tmp_path):
+    """
+    Tests that a server rejecting every request with a 416 makes the download
+    start over once, then fail instead of retrying forever.
+    """
+
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(416)
+
+    (tmp_path / "DOM_20250701.pdf.part").write_bytes(b"%PDF-1.4 old")
+    (tmp_path / "DOM_20250701.pdf.part.validator").write_text('"v1"')
+
+    # Act
+    with Downloader(download_path=str(tmp_path), transport=httpx.MockTransport(handler)) as downloader:
+        downloaded = downloader._download_file("https://dom.example.com/DOM_20250701.pdf")
+
+    # Assert
+    assert downloaded is None
+    assert [request.headers.get("Range") for request in requests] == ["bytes=12-", None]
+
+
+def test_download_file_skips_unchanged_file(tmp_path):
+    """
+    Tests that a file recorded in the download manifest is requested
+    conditionally and not re-transferred when the server answers 304.
+    """
+
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"', "Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT"},
+            content=b"%PDF-1.4 fake",
+        )
+
+    link = "https://dom.example.com/DOM_20250701.pdf"
+    transport = httpx.MockTransport(handler)
+    with Downloader(download_path=str(tmp_path), transport=transport) as downloader:
+        downloader._download_file(link)
+
+    # Act
+    with Downloader(download_path=str(tmp_path), transport=transport) as reloaded:
+        skipped = reloaded._download_file(link)
+
+    # Assert
+    entry = reloaded.manifest.get(link)
+    assert entry.etag == '"v1"'
+    assert entry.size == len(b"%PDF-1.4 fake")
+    assert entry.sha256 == hashlib.sha256(b"%PDF-1.4 fake").hexdigest()
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-Modified-Since"] == "Tue, 01 Jul 2025 00:00:00 GMT"
+    assert skipped == str(tmp_path / "DOM_20250701.pdf")
+    assert (tmp_path / "DOM_20250701.pdf").read_bytes() == b"%PDF-1.4 fake"
+
+
+def test_find_pdf_links_in_a_single_round_trip(tmp_path):
+    """
+    Tests that the result links are read with one execute_script call, or
+    from the page source, without a WebDriver call per link.
+    """
+
+    # Arrange
+    driver = MagicMock()
+    driver.execute_script.return_value = [
+        "https://dom.example.com/DOM_20250701.pdf",
+        "https://dom.example.com/DOM_20250702.pdf",
+    ]
+    driver.current_url = "https://dom.example.com/dom"
+    driver.page_source = (
+        '<table id="example"><tbody>'
+        '<tr><td><a href="/DOM_20250701.pdf">01/07/2025</a></td></tr>'
+        '<tr><td><a href="/DOM_20250702.pdf">02/07/2025</a></td></tr>'
+        "</tbody></table>"
+    )
+
+    script_scraper = Scraper(selenium_url="http://selenium", download_path=str(tmp_path))
+    source_scraper = Scraper(
+        selenium_url="http://selenium", download_path=str(tmp_path), link_extraction="page_source"
+    )
+    script_scraper.driver = source_scraper.driver = driver
+
+    # Act
+    script_links = script_scraper._find_pdf_links()
+    source_links = source_scraper._find_pdf_links()
+    script_scraper.close()
+    source_scraper.close()
+
+    # Assert
+    assert script_links == source_links == [
+        "https://dom.example.com/DOM_20250701.pdf",
+        "https://dom.example.com/DOM_20250702.pdf",
+    ]
+    driver.execute_script.assert_called_once()
+    driver.find_elements.assert_not_called()
+
+
+def test_downloader_downloads_without_a_browser(tmp_path):
+    """
+    Tests that the Downloader downloads files on its own, while BaseScraper
+    cannot be instantiated without a way to find the links.
+    """
+
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"%PDF-1.4 fake")
+
+    # Act
+    with Downloader(download_path=str(tmp_path), transport=httpx.MockTransport(handler)) as downloader:
+        downloaded = downloader._download_all_files(["https://dom.example.com/DOM_20250701.pdf"])
+
+    # Assert
+    assert downloaded == [str(tmp_path / "DOM_20250701.pdf")]
+    with pytest.raises(TypeError):
+        BaseScraper(download_path=str(tmp_path))
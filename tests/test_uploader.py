@@ -0,0 +1,120 @@
+import threading
+import time
+
+import httpx
+
+from src.conthabil.ratelimit import RateLimiter
+from src.conthabil.upload_cache import UploadCache
+from src.conthabil.uploader import Uploader
+
+
+def test_upload_files_reuses_client(tmp_path):
+    """
+    Tests that every upload of a batch goes through the uploader's shared
+    client, which is closed when the context manager exits.
+    """
+
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=f"https://upload.example.com/{len(requests)}.pdf\n")
+
+    file_paths = []
+    for day in range(1, 6):
+        path = tmp_path / f"DOM_202507{day:02d}.pdf"
+        path.write_bytes(b"%PDF-1.4 fake")
+        file_paths.append(str(path))
+
+    # Act
+    with Uploader(
+        upload_url="https://upload.example.com", max_workers=2, transport=httpx.MockTransport(handler)
+    ) as uploader:
+        uploaded_urls = uploader.upload_files(file_paths)
+
+    # Assert
+    assert len(uploaded_urls) == 5
+    assert all(url.startswith("https://upload.example.com/") for url in uploaded_urls)
+    assert len(requests) == 5
+    assert uploader.client.is_closed
+
+
+def test_upload_file_skips_cached_content(tmp_path):
+    """
+    Tests that a file whose content was already uploaded is not uploaded again,
+    and that the upload cache evicts its least recently used entries.
+    """
+
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=f"https://upload.example.com/{len(requests)}.pdf\n")
+
+    paths = {}
+    for name, content in (("a", b"%PDF a"), ("a_copy", b"%PDF a"), ("b", b"%PDF b"), ("c", b"%PDF c")):
+        paths[name] = tmp_path / f"{name}.pdf"
+        paths[name].write_bytes(content)
+
+    cache = UploadCache(str(tmp_path / "upload_cache.json"), max_entries=2)
+    uploader = Uploader(
+        upload_url="https://upload.example.com", cache=cache, transport=httpx.MockTransport(handler)
+    )
+
+    # Act
+    with uploader:
+        first = uploader._upload_file(str(paths["a"]))
+        duplicate = uploader._upload_file(str(paths["a_copy"]))
+        uploader._upload_file(str(paths["b"]))
+        uploader._upload_file(str(paths["c"]))
+        evicted = uploader._upload_file(str(paths["a"]))
+
+    # Assert
+    assert first == duplicate == "https://upload.example.com/1.pdf"
+    assert evicted == "https://upload.example.com/4.pdf"
+    assert len(requests) == 4
+    assert len(UploadCache(str(tmp_path / "upload_cache.json"))) == 2
+
+
+def test_upload_concurrency_grows_with_the_rate_limiter(tmp_path):
+    """
+    Tests that by default the uploader has a thread per slot the rate limiter
+    can open, so the uploads in flight grow past the former fixed 5 workers.
+    """
+
+    # Arrange
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return httpx.Response(200, text="https://upload.example.com/a.pdf")
+
+    file_paths = []
+    for i in range(100):
+        path = tmp_path / f"{i}.pdf"
+        path.write_bytes(b"%PDF-1.4 fake")
+        file_paths.append(str(path))
+
+    rate_limiter = RateLimiter(max_rate=10000, burst=100, initial_concurrency=2, max_concurrency=8)
+
+    # Act
+    with Uploader(
+        upload_url="https://upload.example.com",
+        rate_limiter=rate_limiter,
+        transport=httpx.MockTransport(handler),
+    ) as uploader:
+        uploaded_urls = uploader.upload_files(file_paths)
+
+    # Assert
+    assert len(uploaded_urls) == 100
+    assert uploader.max_workers == 8
+    assert peak[0] > 5